@@ -95,7 +95,9 @@ class EPD:
         try:
             self.spi = spidev.SpiDev()
             self.spi.open(0, 0)  # Bus 0, Device 0
-            self.spi.max_speed_hz = 4000000
+            # 32 MHz matches the V4 path in epdconfig; drop back to 4 MHz if
+            # long jumper wires show corrupted frames (signal integrity)
+            self.spi.max_speed_hz = 32000000
             self.spi.mode = 0
             logger.debug("SPI interface initialized successfully")
         except Exception as e:
@@ -119,7 +121,11 @@ class EPD:
         if self.mock_mode or not self.spi:
             return
 
-        if isinstance(data, (list, bytearray, bytes)):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            # writebytes2 takes the buffer as-is and splits it past the
+            # spidev bufsiz limit, instead of converting every byte
+            self.spi.writebytes2(data)
+        elif isinstance(data, list):
             self.spi.writebytes(data)
         else:
             self.spi.writebytes([data])
@@ -182,6 +188,27 @@ class EPD:
                 break
         time.sleep(0.01)
 
+    def _set_window(self, x_start, y_start, x_end, y_end):
+        """Set the RAM address window (x in pixels, byte-aligned by the panel)"""
+        self._send_command(0x44)  # Set RAM X address
+        self._send_data((x_start >> 3) & 0xFF)
+        self._send_data((x_end >> 3) & 0xFF)
+
+        self._send_command(0x45)  # Set RAM Y address
+        self._send_data(y_start & 0xFF)
+        self._send_data((y_start >> 8) & 0xFF)
+        self._send_data(y_end & 0xFF)
+        self._send_data((y_end >> 8) & 0xFF)
+
+    def _set_cursor(self, x, y):
+        """Set the RAM address counter (x in bytes)"""
+        self._send_command(0x4E)  # Set RAM X counter
+        self._send_data(x & 0xFF)
+
+        self._send_command(0x4F)  # Set RAM Y counter
+        self._send_data(y & 0xFF)
+        self._send_data((y >> 8) & 0xFF)
+
     def init(self, update_mode=FULL_UPDATE):
         """Initialize display
 
@@ -318,16 +345,22 @@ class EPD:
             image: PIL Image object (must be mode '1')
 
         Returns:
-            Byte array suitable for display
+            Packed bytes suitable for display
         """
         if image.mode != '1':
             raise ValueError("Image must be in mode '1' (1-bit pixels)")
 
-        # Rotate and flip image to match display orientation
-        img = image.rotate(180)
+        if image.size == (self.height, self.width):
+            # Landscape canvas: turn it into the panel's portrait rows, as
+            # the V4 driver does, so displayPartialWindow() can slice it
+            img = image.rotate(90, expand=True)
+        else:
+            # Rotate and flip image to match display orientation
+            img = image.rotate(180)
 
-        buf = bytearray(img.tobytes('raw'))
-        return buf
+        # tobytes('raw') packs the 1-bit pixels in C; the SPI path accepts
+        # bytes directly, so skip the bytearray copy
+        return img.tobytes('raw')
 
     def displayPartial(self, image_buffer):
         """Display image buffer using partial update
@@ -348,6 +381,52 @@ class EPD:
         self._send_command(0x20)  # Activate
         self._wait_until_idle()
 
+    def displayPartialWindow(self, image_buffer, x, y, w, h):
+        """Partial update that only sends one region of a full frame
+
+        Coordinates are in the native portrait orientation; x/w are widened
+        to whole bytes. RAM outside the window keeps the previous frame.
+
+        Args:
+            image_buffer: Full frame from getbuffer()
+            x, y, w, h: Region to send, in portrait pixels
+        """
+        linewidth = (self.width + 7) // 8
+        x_start = max(0, x) // 8
+        x_end = min(linewidth, (x + w + 7) // 8)
+        y_start = max(0, y)
+        y_end = min(self.height, y + h)
+        if x_end <= x_start or y_end <= y_start:
+            return
+
+        if self.mock_mode:
+            logger.debug("Mock windowed partial update")
+            time.sleep(0.05)
+            return
+
+        view = memoryview(image_buffer)
+        if x_start == 0 and x_end == linewidth:
+            data = view[y_start * linewidth:y_end * linewidth]
+        else:
+            data = b''.join(view[row * linewidth + x_start:row * linewidth + x_end]
+                            for row in range(y_start, y_end))
+
+        self._set_window(x_start * 8, y_start, x_end * 8 - 1, y_end - 1)
+        self._set_cursor(x_start, y_start)
+
+        self._send_command(0x24)  # Write RAM
+        self._send_data_bulk(data)
+
+        # Restore the full-frame window _init_full programs, so the next
+        # displayPartial() lands where it expects
+        self._set_window(0, self.height - 1, self.width - 1, 0)
+        self._set_cursor(0, self.height - 1)
+
+        self._send_command(0x22)  # Display update sequence
+        self._send_data(0x0F)
+        self._send_command(0x20)  # Activate
+        self._wait_until_idle()
+
     def displayPartBaseImage(self, image_buffer):
         """Set base image for partial updates
 
@@ -11,6 +11,9 @@ from . import epdconfig
 
 # Import official driver
 class EPD:
+    # Bytes per SPI transfer when streaming a frame buffer
+    SPI_CHUNK_SIZE = 4096
+
     def __init__(self):
         self.reset_pin = epdconfig.RST_PIN
         self.dc_pin = epdconfig.DC_PIN
@@ -36,15 +39,24 @@ class EPD:
         epdconfig.digital_write(self.cs_pin, 1)
 
     def send_data(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            self.send_data2(data)
+            return
         epdconfig.digital_write(self.dc_pin, 1)
         epdconfig.digital_write(self.cs_pin, 0)
         epdconfig.spi_writebyte([data])
         epdconfig.digital_write(self.cs_pin, 1)
 
     def send_data2(self, data):
+        # DC/CS are toggled once for the whole buffer, which is then
+        # streamed in SPI_CHUNK_SIZE pieces instead of byte by byte
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        view = memoryview(data)
         epdconfig.digital_write(self.dc_pin, 1)
         epdconfig.digital_write(self.cs_pin, 0)
-        epdconfig.spi_writebyte2(data)
+        for offset in range(0, len(view), self.SPI_CHUNK_SIZE):
+            epdconfig.spi_writebyte2(view[offset:offset + self.SPI_CHUNK_SIZE])
         epdconfig.digital_write(self.cs_pin, 1)
     
     def ReadBusy(self):
@@ -124,17 +136,21 @@ class EPD:
         return 0
 
     def getbuffer(self, image):
+        # Packing is done in C by tobytes("raw"); avoid the extra copies a
+        # redundant convert("1") and a bytearray() round-trip would add
         img = image
         imwidth, imheight = img.size
         if(imwidth == self.width and imheight == self.height):
-            img = img.convert("1")
+            pass
         elif(imwidth == self.height and imheight == self.width):
-            img = img.rotate(90, expand=True).convert("1")
+            img = img.rotate(90, expand=True)
         else:
-            return [0x00] * (int(self.width/8) * self.height)
+            return bytearray(int(self.width/8) * self.height)
 
-        buf = bytearray(img.tobytes("raw"))
-        return buf
+        # Convert after rotating, as before: dithering depends on scan order
+        if img.mode != "1":
+            img = img.convert("1")
+        return img.tobytes("raw")
         
     def display(self, image):
         self.send_command(0x24)
@@ -146,7 +162,7 @@ class EPD:
         self.send_data2(image) 
         self.TurnOnDisplay_Fast()
 
-    def displayPartial(self, image):
+    def _init_partial(self):
         epdconfig.digital_write(self.reset_pin, 0)
         epdconfig.delay_ms(1)
         epdconfig.digital_write(self.reset_pin, 1)  
@@ -162,6 +178,9 @@ class EPD:
         self.send_command(0x11)
         self.send_data(0x03)
 
+    def displayPartial(self, image):
+        self._init_partial()
+
         self.SetWindow(0, 0, self.width - 1, self.height - 1)
         self.SetCursor(0, 0)
         
@@ -169,6 +188,35 @@ class EPD:
         self.send_data2(image)  
         self.TurnOnDisplayPart()
 
+    def displayPartialWindow(self, image, x, y, w, h):
+        # Partial refresh that only sends the (x, y, w, h) region of a full
+        # getbuffer() frame over SPI. Coordinates are in the native portrait
+        # orientation; x/w are widened to whole bytes. RAM outside the
+        # window keeps the previous frame, so the panel refresh is unchanged.
+        linewidth = (self.width + 7) // 8
+        x_start = max(0, x) // 8
+        x_end = min(linewidth, (x + w + 7) // 8)
+        y_start = max(0, y)
+        y_end = min(self.height, y + h)
+        if x_end <= x_start or y_end <= y_start:
+            return
+
+        view = memoryview(image)
+        if x_start == 0 and x_end == linewidth:
+            data = view[y_start * linewidth:y_end * linewidth]
+        else:
+            data = b''.join(view[row * linewidth + x_start:row * linewidth + x_end]
+                            for row in range(y_start, y_end))
+
+        self._init_partial()
+
+        self.SetWindow(x_start * 8, y_start, x_end * 8 - 1, y_end - 1)
+        self.SetCursor(x_start, y_start)
+
+        self.send_command(0x24)
+        self.send_data2(data)
+        self.TurnOnDisplayPart()
+
     def displayPartBaseImage(self, image):
         self.send_command(0x24)
         self.send_data2(image)  
@@ -184,7 +232,7 @@ class EPD:
             linewidth = int(self.width/8) + 1
         
         self.send_command(0x24)
-        self.send_data2([color] * int(self.height * linewidth))  
+        self.send_data2(bytes([color]) * int(self.height * linewidth))
         self.TurnOnDisplay()
 
     def sleep(self):
@@ -141,7 +141,9 @@ class RaspberryPi:
         else:
             # SPI device, bus = 0, device = 0
             self.SPI.open(0, 0)
-            self.SPI.max_speed_hz = 4000000
+            # The SSD1680 controller tolerates a much faster clock than the
+            # stock 4 MHz; 32 MHz cuts the frame transfer time on a Pi Zero
+            self.SPI.max_speed_hz = 32000000
             self.SPI.mode = 0b00
         return 0
 
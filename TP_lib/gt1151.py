@@ -255,6 +255,32 @@ class GT1151:
             return (self.gt_dev.X[0], self.gt_dev.Y[0], True)
         return (0, 0, False)
 
+    def wait_event(self, timeout: float = 0.5) -> bool:
+        """Block until the interrupt pin signals a touch
+
+        Uses a kernel edge wait on INT_PIN instead of polling, so idle
+        callers sleep rather than spin.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if an edge was seen, False on timeout
+        """
+        if self.mock_mode:
+            time.sleep(timeout)
+            return False
+
+        try:
+            channel = GPIO.wait_for_edge(
+                self.INT_PIN, GPIO.FALLING, timeout=max(1, int(timeout * 1000))
+            )
+            return channel is not None
+        except Exception as e:
+            logger.error(f"GT1151 edge wait error: {e}")
+            time.sleep(timeout)
+            return False
+
 
 class GT_Development:
     """Touch device state"""
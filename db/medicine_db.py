@@ -31,6 +31,9 @@ class MedicineDatabase:
 
         self.db_path = db_path
         self._local = threading.local()
+        # Bumped on every taken/skip write so callers can memoize derived data
+        self.revision = 0
+        self._revision_lock = threading.Lock()
         self._init_db()
         logger.info(f"MedicineDatabase initialized: {db_path}")
 
@@ -49,10 +52,41 @@ class MedicineDatabase:
             self._local.conn.execute("PRAGMA journal_mode = WAL")
         return self._local.conn
 
+    def _bump_revision(self):
+        """Record that tracking data changed"""
+        with self._revision_lock:
+            self.revision += 1
+
     @contextmanager
     def transaction(self):
-        """Context manager for database transactions with automatic rollback"""
+        """Context manager for database transactions with automatic rollback
+
+        Nested calls run inside a SAVEPOINT of the outer transaction, so a
+        batch of writes wrapped in one outer transaction commits (and syncs)
+        once, while a failing inner write only rolls back its own changes.
+        """
         conn = self._get_connection()
+        depth = getattr(self._local, 'depth', 0)
+
+        if depth:
+            savepoint = f"sp_{depth}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            self._local.depth = depth + 1
+            try:
+                yield conn
+                conn.execute(f"RELEASE {savepoint}")
+            except Exception as e:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+                logger.error(f"Nested transaction failed, rolling back: {e}")
+                raise
+            finally:
+                self._local.depth = depth
+            return
+
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        self._local.depth = 1
         try:
             yield conn
             conn.commit()
@@ -60,6 +94,8 @@ class MedicineDatabase:
             conn.rollback()
             logger.error(f"Transaction failed, rolling back: {e}")
             raise
+        finally:
+            self._local.depth = 0
 
     def _init_db(self):
         """Initialize database schema if not exists"""
@@ -206,11 +242,10 @@ class MedicineDatabase:
                 ))
 
                 # Insert days
-                for day in medicine_data['days']:
-                    conn.execute(
-                        "INSERT INTO medicine_days (medicine_id, day) VALUES (?, ?)",
-                        (medicine_data['id'], day)
-                    )
+                conn.executemany(
+                    "INSERT INTO medicine_days (medicine_id, day) VALUES (?, ?)",
+                    [(medicine_data['id'], day) for day in medicine_data['days']]
+                )
 
             logger.info(f"Added medicine: {medicine_data['id']}")
             return True
@@ -439,13 +474,16 @@ class MedicineDatabase:
 
                 logger.info(f"Marked medicine taken: {medicine_id} at {timestamp_str}")
 
-                return {
+                result = {
                     'success': True,
                     'medicine_id': medicine_id,
                     'pills_remaining': new_count,
                     'low_stock': low_stock
                 }
 
+            self._bump_revision()
+            return result
+
         except Exception as e:
             logger.error(f"Failed to mark medicine taken: {e}")
             raise
@@ -504,7 +542,7 @@ class MedicineDatabase:
 
                 logger.info(f"Marked medicine skipped: {medicine_id} at {timestamp_str} (reason: {skip_reason})")
 
-                return {
+                result = {
                     'success': True,
                     'medicine_id': medicine_id,
                     'skip_date': date_str,
@@ -513,6 +551,9 @@ class MedicineDatabase:
                     'time_window': time_window
                 }
 
+            self._bump_revision()
+            return result
+
         except Exception as e:
             logger.error(f"Failed to mark medicine skipped: {e}")
             raise
@@ -705,6 +746,29 @@ class MedicineDatabase:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    def set_bulk_load(self, enabled: bool):
+        """Toggle relaxed durability for one-shot bulk imports
+
+        While enabled, SQLite skips fsync and keeps the rollback journal and
+        temp tables in memory. Only use it when the source data is backed up,
+        and disable it afterwards to restore WAL with full sync.
+
+        Args:
+            enabled: True to relax durability, False to restore the defaults
+        """
+        conn = self._get_connection()
+        if enabled:
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA journal_mode = MEMORY")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -20000")
+        else:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = FULL")
+            conn.execute("PRAGMA temp_store = DEFAULT")
+            conn.execute("PRAGMA cache_size = -2000")
+        logger.info(f"Bulk load mode {'enabled' if enabled else 'disabled'}")
+
     def vacuum(self):
         """Optimize database (reclaim space, rebuild indexes)"""
         conn = self._get_connection()
@@ -7,7 +7,7 @@ Optimized for e-paper refresh limitations with shared utilities
 """
 from display.components import MessageBox
 from display.text import draw_centered_text, truncate_text_to_width
-from display.fonts import get_font_preset
+from display.fonts import get_font_preset, preload_fonts
 from display import create_input_handler, InputHandler
 from shared.app_utils import ConfigLoader, setup_logging, setup_paths
 from TP_lib import gt1151, epd2in13_V3
@@ -431,6 +431,9 @@ def run_disney_app(epd, gt_dev=None, gt_old=None, gt=None):
 
 if __name__ == "__main__":
     try:
+        # Warm the font cache while the display initializes
+        preload_fonts(['subtitle', 'display', 'small', 'body'])
+
         # Initialize display
         epd = epd2in13_V3.EPD()
         epd.init(epd.FULL_UPDATE)
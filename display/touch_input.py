@@ -77,7 +77,8 @@ class TouchInputHandler(InputHandler):
         gt_old=None,
         config: Optional[dict] = None,
         polling_interval: float = 0.01,
-        tap_max_duration: float = 0.5
+        tap_max_duration: float = 0.5,
+        idle_timeout: float = 0.5
     ):
         """Initialize touch input handler
 
@@ -88,6 +89,7 @@ class TouchInputHandler(InputHandler):
             config: Optional configuration dict
             polling_interval: Touch polling interval in seconds (default: 10ms)
             tap_max_duration: Max duration for tap vs hold (default: 0.5s)
+            idle_timeout: Max time to block waiting for a touch while idle (default: 0.5s)
 
         Example:
             >>> handler = TouchInputHandler(
@@ -105,12 +107,14 @@ class TouchInputHandler(InputHandler):
         self.config = config or {}
         self.polling_interval = polling_interval
         self.tap_max_duration = tap_max_duration
+        self.idle_timeout = idle_timeout
 
         # Thread management
         self._running = False
         self._poll_thread: Optional[threading.Thread] = None
         self._irq_thread: Optional[threading.Thread] = None
         self._flag = [1]  # Mutable flag for thread control
+        self._touch_event = threading.Event()  # IRQ thread -> scan thread wakeup
 
         # Touch state tracking
         self._touch_start_time: Optional[float] = None
@@ -187,6 +191,7 @@ class TouchInputHandler(InputHandler):
         self._running = False
         self._is_active = False
         self._flag[0] = 0
+        self._touch_event.set()  # Release a scan thread blocked while idle
 
         # Wait for threads to terminate
         if self._irq_thread:
@@ -212,27 +217,50 @@ class TouchInputHandler(InputHandler):
         when touch events occur. Updates gt_dev.Touch state.
 
         This mirrors the standard touch detection pattern used across
-        the application codebase.
+        the application codebase. When the driver provides wait_event(),
+        the thread blocks on the interrupt edge while idle instead of
+        polling every polling_interval.
         """
+        wait_event = getattr(self.gt, 'wait_event', None)
+
         while self._flag[0] == 1 and self._running:
             try:
                 # Check GPIO interrupt pin
                 if self.gt.digital_read(self.gt.INT) == 0:
                     self.gt_dev.Touch = 1
+                    self._touch_event.set()
                 else:
                     self.gt_dev.Touch = 0
             except Exception as e:  # pylint: disable=broad-exception-caught
                 logger.error(f"IRQ polling error: {e}")
 
-            time.sleep(self.polling_interval)
+            if wait_event is not None and not self.is_touched():
+                # Idle: sleep until the interrupt line fires
+                try:
+                    if wait_event(self.idle_timeout):
+                        self._touch_event.set()
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    logger.error(f"IRQ wait error: {e}")
+                    time.sleep(self.polling_interval)
+            else:
+                # Touch in progress: poll so release is seen promptly
+                time.sleep(self.polling_interval)
 
     def _touch_polling_loop(self) -> None:
         """Background thread: Poll touch coordinates and events
 
-        Continuously scans for touch input and processes coordinates.
+        Scans for touch input and processes coordinates while a touch is
+        in progress; otherwise blocks until the IRQ thread signals one.
         Triggers callbacks when touch events are detected.
         """
         while self._flag[0] == 1 and self._running:
+            if not self._last_touch_state and not self.is_touched():
+                # Idle: wait for the IRQ thread rather than scanning
+                self._touch_event.wait(self.idle_timeout)
+                self._touch_event.clear()
+                if not self._running:
+                    break
+
             try:
                 # Scan for touch input (updates gt_dev with coordinates)
                 self.gt.GT_Scan(self.gt_dev, self.gt_old)
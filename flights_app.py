@@ -29,7 +29,7 @@ from shared.app_utils import (
     cleanup_touch_state,
     setup_paths,
     PeriodicTimer,
-    safe_execute
+    safe
 )
 from display.touch_handler import TouchHandler
 from display.icons import draw_compass_icon
@@ -122,60 +122,133 @@ def calculate_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> flo
 # FLIGHT DATA RETRIEVAL
 # ============================================================================
 
+@safe("Flight search error", default=(None, None, None))
 def get_flight_search() -> tuple:
     """Search for closest commercial flight in area
 
     Returns:
         Tuple of (flight_id, distance_km, bearing_degrees) or (None, None, None)
     """
-    def _fetch():
-        result = subprocess.run(
-            ["curl", "-s", "-m", "10", FLIGHT_SEARCH_URL],
-            capture_output=True, text=True, timeout=12
-        )
+    result = subprocess.run(
+        ["curl", "-s", "-m", "10", FLIGHT_SEARCH_URL],
+        capture_output=True, text=True, timeout=12
+    )
 
-        if result.returncode != 0:
-            return None, None, None
+    if result.returncode != 0:
+        return None, None, None
 
-        data = json.loads(result.stdout)
-        commercial_flights = []
+    data = json.loads(result.stdout)
+    commercial_flights = []
 
-        for flight_id, flight_info in data.items():
-            if flight_id in ["version", "full_count"]:
-                continue
+    for flight_id, flight_info in data.items():
+        if flight_id in ["version", "full_count"]:
+            continue
 
-            if len(flight_info) <= 13:
-                continue
+        if len(flight_info) <= 13:
+            continue
 
-            flight_lat = flight_info[1]
-            flight_lon = flight_info[2]
-            callsign = flight_info[13]
+        flight_lat = flight_info[1]
+        flight_lon = flight_info[2]
+        callsign = flight_info[13]
 
-            if not callsign or callsign.strip() == "":
-                continue
+        if not callsign or callsign.strip() == "":
+            continue
+
+        distance = haversine_distance(LAT, LON, flight_lat, flight_lon)
 
-            distance = haversine_distance(LAT, LON, flight_lat, flight_lon)
+        if distance <= RADIUS_KM:
+            bearing = calculate_bearing(LAT, LON, flight_lat, flight_lon)
+            commercial_flights.append({
+                "id": flight_id,
+                "distance": distance,
+                "bearing": bearing,
+                "callsign": callsign
+            })
 
-            if distance <= RADIUS_KM:
-                bearing = calculate_bearing(LAT, LON, flight_lat, flight_lon)
-                commercial_flights.append({
-                    "id": flight_id,
-                    "distance": distance,
-                    "bearing": bearing,
-                    "callsign": callsign
-                })
+    if not commercial_flights:
+        logger.info("No commercial flights within radius")
+        return None, None, None
 
-        if not commercial_flights:
-            logger.info("No commercial flights within radius")
-            return None, None, None
+    commercial_flights.sort(key=lambda x: x["distance"])
+    chosen = commercial_flights[0]
+    logger.info(f"Found flight {chosen['callsign']} at {chosen['distance']:.1f}km, "
+                f"bearing {chosen['bearing']:.0f}°")
+    return chosen["id"], chosen["distance"], chosen["bearing"]
 
-        commercial_flights.sort(key=lambda x: x["distance"])
-        chosen = commercial_flights[0]
-        logger.info(f"Found flight {chosen['callsign']} at {chosen['distance']:.1f}km, "
-                    f"bearing {chosen['bearing']:.0f}°")
-        return chosen["id"], chosen["distance"], chosen["bearing"]
 
-    return safe_execute(_fetch, "Flight search error", (None, None, None))
+@safe("Flight details error")
+def _fetch_flight_details(flight_id: str) -> dict:
+    """Fetch and parse FR24 flight details, or None on error"""
+    url = f"https://data-live.flightradar24.com/clickhandler/?flight={flight_id}"
+
+    result = subprocess.run(
+        ["curl", "-s", "-m", "10", url],
+        capture_output=True, text=True, timeout=12
+    )
+
+    if result.returncode != 0:
+        return None
+
+    data = json.loads(result.stdout)
+
+    # Extract identification data
+    identification = data.get("identification", {})
+    flight_number = identification.get("number", {})
+    flight_number = flight_number.get("default", "") if flight_number else ""
+
+    callsign = identification.get("callsign", "")
+    if callsign == "Blocked":
+        callsign = ""
+
+    # Extract aircraft data
+    aircraft = data.get("aircraft", {})
+    aircraft_model = aircraft.get("model", {})
+    aircraft_code = aircraft_model.get("code", "?") if aircraft_model else "?"
+
+    # Extract airline data
+    airline = data.get("airline", {})
+    airline_name = airline.get("name", "") if airline else ""
+
+    # Extract airport data
+    airport = data.get("airport", {})
+    origin = airport.get("origin") if airport else None
+    destination = airport.get("destination") if airport else None
+
+    origin_code = "?"
+    dest_code = "?"
+    origin_name = ""
+    dest_name = ""
+
+    if origin:
+        origin_iata = origin.get("code", {})
+        origin_code = origin_iata.get("iata", "?") if origin_iata else "?"
+        origin_name = origin.get("name", "").replace(" Airport", "")
+
+    if destination:
+        dest_iata = destination.get("code", {})
+        dest_code = dest_iata.get("iata", "?") if dest_iata else "?"
+        dest_name = destination.get("name", "").replace(" Airport", "")
+
+    # Extract trail data
+    trail = data.get("trail", [])
+    altitude = 0
+    speed = 0
+    if trail and len(trail) > 0:
+        altitude = int(trail[0].get("alt", 0))
+        speed = int(trail[0].get("spd", 0))
+
+    return {
+        "callsign": flight_number or callsign or flight_id[-4:].upper(),
+        "airline": airline_name,
+        "origin": origin_code,
+        "destination": dest_code,
+        "origin_name": origin_name,
+        "dest_name": dest_name,
+        "aircraft": aircraft_code,
+        "altitude": altitude,
+        "speed": speed,
+        "timestamp": datetime.now().strftime("%H:%M")
+    }
 
 
 def get_flight_details(flight_id: str) -> dict:
@@ -187,79 +260,7 @@ def get_flight_details(flight_id: str) -> dict:
     Returns:
         Dictionary with flight data or None on error
     """
-    def _fetch():
-        url = f"https://data-live.flightradar24.com/clickhandler/?flight={flight_id}"
-
-        result = subprocess.run(
-            ["curl", "-s", "-m", "10", url],
-            capture_output=True, text=True, timeout=12
-        )
-
-        if result.returncode != 0:
-            return None
-
-        data = json.loads(result.stdout)
-
-        # Extract identification data
-        identification = data.get("identification", {})
-        flight_number = identification.get("number", {})
-        flight_number = flight_number.get("default", "") if flight_number else ""
-
-        callsign = identification.get("callsign", "")
-        if callsign == "Blocked":
-            callsign = ""
-
-        # Extract aircraft data
-        aircraft = data.get("aircraft", {})
-        aircraft_model = aircraft.get("model", {})
-        aircraft_code = aircraft_model.get("code", "?") if aircraft_model else "?"
-
-        # Extract airline data
-        airline = data.get("airline", {})
-        airline_name = airline.get("name", "") if airline else ""
-
-        # Extract airport data
-        airport = data.get("airport", {})
-        origin = airport.get("origin") if airport else None
-        destination = airport.get("destination") if airport else None
-
-        origin_code = "?"
-        dest_code = "?"
-        origin_name = ""
-        dest_name = ""
-
-        if origin:
-            origin_iata = origin.get("code", {})
-            origin_code = origin_iata.get("iata", "?") if origin_iata else "?"
-            origin_name = origin.get("name", "").replace(" Airport", "")
-
-        if destination:
-            dest_iata = destination.get("code", {})
-            dest_code = dest_iata.get("iata", "?") if dest_iata else "?"
-            dest_name = destination.get("name", "").replace(" Airport", "")
-
-        # Extract trail data
-        trail = data.get("trail", [])
-        altitude = 0
-        speed = 0
-        if trail and len(trail) > 0:
-            altitude = int(trail[0].get("alt", 0))
-            speed = int(trail[0].get("spd", 0))
-
-        return {
-            "callsign": flight_number or callsign or flight_id[-4:].upper(),
-            "airline": airline_name,
-            "origin": origin_code,
-            "destination": dest_code,
-            "origin_name": origin_name,
-            "dest_name": dest_name,
-            "aircraft": aircraft_code,
-            "altitude": altitude,
-            "speed": speed,
-            "timestamp": datetime.now().strftime("%H:%M")
-        }
-
-    flight_data = safe_execute(_fetch, "Flight details error", None)
+    flight_data = _fetch_flight_details(flight_id)
 
     if flight_data:
         logger.info(f"Flight: {flight_data['callsign']} {flight_data['origin']}->"
@@ -30,7 +30,7 @@ States:
 from shared.app_utils import ConfigLoader, install_signal_handlers
 from display.fonts import get_font_preset
 from db.medicine_db import MedicineDatabase
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from TP_lib import epd2in13_V3
 from display import create_input_handler, InputHandler
 import sys
@@ -39,6 +39,9 @@ import time
 from datetime import datetime, date, timedelta
 import logging
 import threading
+import queue
+from collections import deque
+from functools import lru_cache
 
 # Setup paths
 project_root = os.path.dirname(os.path.realpath(__file__))
@@ -75,10 +78,126 @@ ACTIONS = ["Take Now", "Skip", "Back"]
 # Menu options
 MENU_OPTIONS = ["Pending Doses", "Skip History", "Adherence", "Back"]
 
+# Sub-view carousel sentinel and fixed stats items
+BACK = "BACK"
+STATS_ITEMS = ("Overall", BACK)
+
 # Long press threshold
 LONG_PRESS_DURATION = 2.0
 CONFIRMATION_DURATION = 2.0
 
+# Fixed confirmation texts; their rendered frames are cached after first use
+MSG_TAKE_FAILED = "Error marking taken\nPlease try again"
+MSG_TAKE_ERROR = "Error marking taken"
+MSG_SKIP_ERROR = "Error recording skip"
+CONFIRMATION_STATIC = frozenset((MSG_TAKE_FAILED, MSG_TAKE_ERROR, MSG_SKIP_ERROR))
+
+# How long a bulk tracking snapshot is reused before re-querying (seconds)
+TRACKING_CACHE_TTL = 30.0
+
+# Icon glyphs; rasterized once per font into sprites (see _paste_icon_label)
+ICON_GLYPHS = {
+    "pill": "💊", "skip": "⏭️", "take": "✓", "back": "←",
+    "pending": "📋", "stats": "📊",
+    "forgot": "😴", "side_effects": "🤢", "out_of_stock": "📦",
+    "doctor": "🏥", "other": "❓",
+}
+ACTION_ICONS = {"Take Now": "take", "Skip": "skip", "Back": "back"}
+OPTION_ICONS = {"Pending Doses": "pending", "Skip History": "skip",
+                "Adherence": "stats", "Back": "back"}
+SKIP_REASON_ICONS = {"Forgot": "forgot", "Side effects": "side_effects",
+                     "Out of stock": "out_of_stock", "Doctor advised": "doctor",
+                     "Other": "other"}
+
+# Footer hints
+HINT_SELECT = "Click: Next | Hold 2s: Select"
+HINT_CONFIRM = "Click: Next | Hold 2s: Confirm"
+HINT_VIEW = "Click: Next | Hold 2s: View"
+
+# Short presses arriving within this window are coalesced into one render
+TOUCH_DEBOUNCE = 0.15
+
+
+@lru_cache(maxsize=256)
+def _render_text_bitmap(text, font):
+    """Rasterize a static label once into a tight 1-bit mask
+
+    Returns (mask, (x0, y0)) where the offset is the glyph bbox origin
+    relative to the draw position, or None for text with no ink.
+    """
+    x0, y0, x1, y1 = font.getbbox(text)
+    if x1 <= x0 or y1 <= y0:
+        return None
+
+    mask = Image.new('1', (x1 - x0, y1 - y0), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, font=font, fill=1)
+    return mask, (x0, y0)
+
+
+def _paste_text(image, xy, text, font):
+    """Draw a static label in black from the bitmap cache
+
+    Only for literals and enum labels; formatted values (pill counts,
+    dates) should keep using draw.text so the cache stays small.
+    """
+    cached = _render_text_bitmap(text, font)
+    if cached is None:
+        return
+    mask, (ox, oy) = cached
+    image.paste(0, (xy[0] + ox, xy[1] + oy), mask)
+
+
+def _window_minutes(med):
+    """Return a medicine's (start, end) time window as minutes since midnight"""
+    try:
+        sh, sm = med.get('window_start', '00:00').split(':')
+        eh, em = med.get('window_end', '23:59').split(':')
+        return int(sh) * 60 + int(sm), int(eh) * 60 + int(em)
+    except (AttributeError, ValueError):
+        return 0, 24 * 60  # Default to always due if parsing fails
+
+
+def _with_labels(med):
+    """Attach pre-formatted display strings to a medicine dict (once)
+
+    Render paths read these instead of re-formatting every frame.
+    """
+    if '_window_label' not in med:
+        window = med.get('time_window', 'anytime').capitalize()
+        start = med.get('window_start', '')
+        end = med.get('window_end', '')
+        pills = med.get('pills_remaining', 0)
+        warning = " ⚠️ LOW" if pills <= med.get('low_stock_threshold', 7) else ""
+        med['_window_label'] = f"{window} ({start}-{end})"
+        med['_stock_label'] = f"{pills} pills{warning}"
+        med['_remaining_label'] = f"{pills} pills remaining"
+    return med
+
+
+@lru_cache(maxsize=64)
+def _icon_advance(glyph, font):
+    """Horizontal advance of an icon glyph plus its trailing space"""
+    return int(round(font.getlength(glyph + " ")))
+
+
+def _paste_icon_label(image, draw, xy, icon_key, text, font, static=True):
+    """Draw an icon sprite followed by a label
+
+    The icon is always pasted from the bitmap cache, keeping emoji out
+    of the per-frame shaping path. Static labels are pasted too;
+    pass static=False for labels built from data (medicine names).
+    """
+    glyph = ICON_GLYPHS.get(icon_key, "")
+    x, y = xy
+    if glyph:
+        _paste_text(image, (x, y), glyph, font)
+    x += _icon_advance(glyph, font)
+
+    if static:
+        _paste_text(image, (x, y), text, font)
+    else:
+        draw.text((x, y), text, font=font, fill=0)
+
 
 class MedicineApp:
     """Medicine tracker with carousel navigation"""
@@ -89,6 +208,19 @@ class MedicineApp:
         self.running = False
         self.display_lock = threading.Lock()
 
+        # Main loop wakeup; shared with menu_button's button callbacks when
+        # launched from the menu (see run_medicine_app)
+        self._wake = threading.Event()
+        self._wake_shared = False
+
+        # Canvas geometry (recomputed in initialize() once the EPD is final)
+        self._update_geometry()
+
+        # Fonts are loaded once and shared by every render_* method
+        self._font_title = get_font_preset('title')
+        self._font_body = get_font_preset('body')
+        self._font_hint = get_font_preset('subtitle')
+
         # Touch/button objects passed from menu_button.py
         self.gt_dev = None
         self.gt_old = None
@@ -98,6 +230,8 @@ class MedicineApp:
         self.state = STATE_MEDICINE_LIST
         self.carousel_index = 0
         self.medicines = []
+        self._med_by_id = {}  # id -> medicine dict, rebuilt with self.medicines
+        self._med_windows = []  # (start_min, end_min, medicine), rebuilt with self.medicines
         self.carousel_items = []  # ["MENU"] + medicines
 
         # Selected items
@@ -111,14 +245,36 @@ class MedicineApp:
         self.skip_history = []
         self.stats = {}
 
+        # Bulk tracking snapshot shared by the pending/history/stats loaders
+        self._tracking_cache = {}  # medicine_id -> [tracking rows]
+        self._tracking_cache_ts = None
+        self._tracking_cache_days = 0
+
+        # Memo keys for derived data; recomputed only when db.revision,
+        # the day or the tracking snapshot changes
+        self._stats_rev = -1
+        self._stats_key = None
+        self._skip_key = None
+        self._pending_key = None
+
         # Index tracking for sub-views
         self.pending_index = 0
         self.history_index = 0
         self.stats_index = 0
 
-        # Confirmation state
+        # Sub-view carousels; built on view entry, rotated on each click so
+        # the current item is always at [0]
+        self._pending_deque = deque([BACK])
+        self._history_deque = deque([BACK])
+        self._stats_deque = deque(STATS_ITEMS)
+
+        # Confirmation state (auto-return is driven by one scheduler thread;
+        # a deadline of None means nothing is scheduled)
         self.confirmation_message = ""
-        self.confirmation_timer = None
+        self._deadline = None
+        self._scheduler_cond = threading.Condition()
+        self._scheduler = None
+        self._scheduler_stop = False
 
         # Auto-refresh
         self.refresh_timer = None
@@ -126,6 +282,32 @@ class MedicineApp:
         # Button press tracking
         self.button_press_start = None
 
+        # Static header/separator/footer per state, drawn once (see _get_chrome)
+        self._chrome_cache = {}
+
+        # Finished frames for fixed confirmation messages (errors), keyed by text
+        self._confirmation_frames = {}
+
+        # Last frame sent to the panel, used to compute the dirty rectangle
+        self._prev_image = None
+
+        # Panel updates run on a worker so input keeps flowing during the
+        # 200-400 ms refresh; the queue holds at most one (newest) frame
+        self._disp_queue = queue.Queue(maxsize=1)
+        self._disp_thread = None
+
+        # Render change detection: _cache_rev is bumped whenever data shown
+        # on screen changes; render() skips frames whose key is unchanged
+        self._cache_rev = 0
+        self._last_render_key = None
+        self._medicines_hash = None  # Fingerprint of the last loaded carousel dataset
+
+        # Short-press debounce (presses accumulate until the timer fires)
+        self._touch_lock = threading.Lock()
+        self._touch_timer = None
+        self._pending_presses = 0
+        self._last_touch_ts = 0.0
+
     def initialize(self):
         """Initialize display and input"""
         try:
@@ -134,17 +316,82 @@ class MedicineApp:
             self.epd.Clear(0xFF)
             logger.info("Display initialized (FULL mode, cleared)")
 
+            # Display was re-initialized; rebuild geometry and chrome on demand
+            self._update_geometry()
+            self._chrome_cache.clear()
+            self._confirmation_frames.clear()
+            self._prev_image = None
+
             # Load initial data
             self.load_medicines()
 
             # Setup input handler
             self.setup_input()
 
+            # Start the confirmation scheduler and display worker
+            self.start_scheduler()
+            self._start_display_worker()
+
             return True
         except Exception as e:
             logger.error(f"Initialize failed: {e}")
             return False
 
+    def _update_geometry(self):
+        """Cache landscape canvas size and fixed layout positions"""
+        self._W = self.epd.height
+        self._H = self.epd.width
+        self._cx = self._W // 2
+        self._footer_y = self._H - 12
+        self._footer_y2 = self._H - 15
+
+        # Single reusable framebuffer and draw context for every render_*
+        self._fb = Image.new('1', (self._W, self._H), 255)
+        self._draw = ImageDraw.Draw(self._fb)
+
+    def start_scheduler(self):
+        """Start the long-lived thread that fires confirmation auto-returns"""
+        if self._scheduler is not None and self._scheduler.is_alive():
+            return
+
+        self._scheduler_stop = False
+        self._scheduler = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self._scheduler.start()
+
+    def _scheduler_loop(self):
+        """Sleep until the current deadline, then return to the medicine list"""
+        while True:
+            with self._scheduler_cond:
+                while not self._scheduler_stop:
+                    if self._deadline is None:
+                        self._scheduler_cond.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._scheduler_cond.wait(timeout=remaining)
+
+                if self._scheduler_stop:
+                    return
+                self._deadline = None
+
+            try:
+                self.return_to_medicine_list()
+            except Exception as e:
+                logger.error(f"Scheduled return failed: {e}")
+
+    def schedule_return(self, delay):
+        """(Re)arm the auto-return deadline `delay` seconds from now"""
+        with self._scheduler_cond:
+            self._deadline = time.monotonic() + delay
+            self._scheduler_cond.notify()
+
+    def cancel_return(self):
+        """Cancel any pending auto-return"""
+        with self._scheduler_cond:
+            self._deadline = None
+            self._scheduler_cond.notify()
+
     def setup_input(self):
         """Setup input handler (uses TouchInputHandler via DummyTouch objects)"""
         try:
@@ -179,7 +426,12 @@ class MedicineApp:
             raise
 
     def load_medicines(self):
-        """Load medicines for today's carousel (all active medicines not yet taken today)"""
+        """Load medicines for today's carousel (all active medicines not yet taken today)
+
+        Returns:
+            True if the carousel dataset changed, False if it is identical
+            to the previous load (carousel position is then kept)
+        """
         try:
             all_medicines = db.get_all_medicines()
             active_medicines = [m for m in all_medicines if m.get('active', True)]
@@ -191,123 +443,181 @@ class MedicineApp:
 
             logger.info(f"DEBUG: Today: {today}")
 
-            available_medicines = []
-            for med in active_medicines:
-                med_name = med.get('name', 'Unknown')
-                med_id = med.get('id')
-
-                logger.info(f"DEBUG: Checking {med_name} (ID: {med_id})")
-
-                # Check if not already taken today
-                tracking = db.get_tracking_history(
-                    medicine_id=med['id'],
-                    start_date=today,
-                    end_date=today
-                )
-
-                logger.info(f"DEBUG:   Tracking records: {len(tracking)}")
-                for t in tracking:
-                    logger.info(f"DEBUG:     - Date: {t.get('date')}, Taken: {t.get('taken')}, Skipped: {t.get('skipped')}")
+            # One query for today's tracking across all medicines
+            taken_today = {
+                t['medicine_id']
+                for t in db.get_tracking_history(start_date=today, end_date=today)
+                if t.get('taken', False)
+            }
+            logger.info(f"DEBUG: Taken today: {sorted(taken_today)}")
 
-                # Only add if NOT taken today
-                already_taken = any(t.get('taken', False) for t in tracking)
-                logger.info(f"DEBUG:   Already taken today: {already_taken}")
+            # Only add if NOT taken today
+            available_medicines = [m for m in active_medicines if m['id'] not in taken_today]
 
-                if not already_taken:
-                    available_medicines.append(med)
-                    logger.info(f"DEBUG:   ✓ ADDED to carousel")
-                else:
-                    logger.info(f"DEBUG:   ✗ SKIPPED (already taken)")
+            # Unchanged dataset: keep the current carousel and position
+            dataset_hash = self._medicines_fingerprint(available_medicines)
+            if dataset_hash == self._medicines_hash and self.carousel_items:
+                logger.info("Medicine data unchanged")
+                return False
 
-            self.medicines = available_medicines
+            self.medicines = [_with_labels(m) for m in available_medicines]
+            self._med_by_id = {m['id']: m for m in self.medicines}
+            self._index_windows()
+            self._medicines_hash = dataset_hash
 
             # Build carousel: MENU first, then all medicines, then EXIT
             self.carousel_items = ["MENU"] + self.medicines + ["EXIT"]
             self.carousel_index = 0
+            self._cache_rev += 1
 
             logger.info(f"Loaded {len(self.medicines)} medicines for carousel")
             logger.info(f"DEBUG: Carousel medicines: {[m.get('name') for m in self.medicines]}")
+            return True
 
         except Exception as e:
             logger.error(f"Failed to load medicines: {e}")
             logger.exception("Full traceback:")
             self.medicines = []
+            self._med_by_id = {}
+            self._med_windows = []
             self.carousel_items = ["MENU"]
+            self._medicines_hash = None
+            self._cache_rev += 1
+            return True
+
+    @staticmethod
+    def _medicines_fingerprint(medicines):
+        """Hash of the medicine fields the carousel actually displays"""
+        return hash(tuple(
+            (m.get('id'), m.get('name'), m.get('dosage'), m.get('pills_remaining'),
+             m.get('low_stock_threshold'), m.get('time_window'),
+             m.get('window_start'), m.get('window_end'))
+            for m in medicines
+        ))
+
+    def _load_tracking_window(self, days=7):
+        """Fetch tracking for all medicines over the last `days` days in one query
+
+        The snapshot is cached for TRACKING_CACHE_TTL seconds so touring
+        Pending -> History -> Adherence hits the database once.
+        """
+        now = time.monotonic()
+        if (self._tracking_cache_ts is not None
+                and self._tracking_cache_days >= days
+                and now - self._tracking_cache_ts < TRACKING_CACHE_TTL):
+            return self._tracking_cache
+
+        end_date = date.today()
+        start_date = end_date - timedelta(days=days)
+
+        cache = {}
+        for t in db.get_tracking_history(start_date=start_date, end_date=end_date):
+            cache.setdefault(t['medicine_id'], []).append(t)
+
+        self._tracking_cache = cache
+        self._tracking_cache_ts = now
+        self._tracking_cache_days = days
+        return cache
+
+    def invalidate_tracking_cache(self):
+        """Drop the tracking snapshot so the next loader re-queries"""
+        self._tracking_cache = {}
+        self._tracking_cache_ts = None
+        self._tracking_cache_days = 0
 
     def load_pending_doses(self):
         """Load pending doses for today"""
         try:
-            today = date.today()
-            current_time = datetime.now().time()
+            now = datetime.now()
+            today = now.date().isoformat()
+            now_m = now.hour * 60 + now.minute
+            tracking_by_med = self._load_tracking_window(7)
+
+            # Time windows have minute resolution, so the minute is part of the key
+            key = (db.revision, now.strftime('%Y-%m-%d %H:%M'), self._tracking_cache_ts)
+            if key == self._pending_key:
+                return
+
+            taken_today = {
+                med_id for med_id, tracking in tracking_by_med.items()
+                if any(t.get('taken', False) and t.get('date') == today for t in tracking)
+            }
 
-            self.pending_doses = []
-            for med in self.medicines:
-                # Check if medicine is due in current time window
-                if self.is_in_time_window(med, current_time):
-                    # Check if not already taken today
-                    tracking = db.get_tracking_history(
-                        medicine_id=med['id'],
-                        start_date=today,
-                        end_date=today
-                    )
-                    if not any(t.get('taken', False) for t in tracking):
-                        self.pending_doses.append(med)
+            # Due in the current window and not already taken today
+            self.pending_doses = [
+                med for start, end, med in self._med_windows
+                if start <= now_m <= end and med['id'] not in taken_today
+            ]
 
+            self._pending_key = key
+            self._cache_rev += 1
             logger.info(f"Found {len(self.pending_doses)} pending doses")
 
         except Exception as e:
             logger.error(f"Failed to load pending doses: {e}")
             self.pending_doses = []
+            self._pending_key = None
+            self._cache_rev += 1
 
     def load_skip_history(self):
         """Load recent skip history (last 10)"""
         try:
             # Get last 7 days of tracking
-            end_date = date.today()
-            start_date = end_date - timedelta(days=7)
+            tracking_by_med = self._load_tracking_window(7)
+
+            key = (db.revision, date.today(), self._tracking_cache_ts)
+            if key == self._skip_key:
+                return
 
             all_skips = []
-            for med in self.medicines:
-                tracking = db.get_tracking_history(
-                    medicine_id=med['id'],
-                    start_date=start_date,
-                    end_date=end_date
-                )
+            for med_id, tracking in tracking_by_med.items():
+                med = self._med_by_id.get(med_id)
+                if med is None:
+                    continue
                 for t in tracking:
                     if t.get('skipped', False):
+                        reason = t.get('skip_reason', 'Unknown')
                         all_skips.append({
                             'medicine': med['name'],
                             'dosage': med['dosage'],
                             'date': t['date'],
-                            'reason': t.get('skip_reason', 'Unknown')
+                            'reason': reason,
+                            '_date_label': f"Date: {t['date']}",
+                            '_reason_label': f"Reason: {reason}"
                         })
 
             # Sort by date (most recent first)
             all_skips.sort(key=lambda x: x['date'], reverse=True)
             self.skip_history = all_skips[:10]
+            self._skip_key = key
+            self._cache_rev += 1
 
             logger.info(f"Loaded {len(self.skip_history)} skip events")
 
         except Exception as e:
             logger.error(f"Failed to load skip history: {e}")
             self.skip_history = []
+            self._skip_key = None
+            self._cache_rev += 1
 
     def calculate_stats(self):
         """Calculate adherence stats for last 7 days"""
         try:
-            end_date = date.today()
-            start_date = end_date - timedelta(days=7)
+            tracking_by_med = self._load_tracking_window(7)
+
+            key = (date.today(), self._tracking_cache_ts)
+            if self._stats_rev == db.revision and key == self._stats_key and self.stats:
+                # Pending count still follows the clock
+                self.load_pending_doses()
+                self.stats['pending'] = len(self.pending_doses)
+                return
 
             total_taken = 0
             total_skipped = 0
             total_pending = 0
 
             for med in self.medicines:
-                tracking = db.get_tracking_history(
-                    medicine_id=med['id'],
-                    start_date=start_date,
-                    end_date=end_date
-                )
+                tracking = tracking_by_med.get(med['id'], ())
                 total_taken += sum(1 for t in tracking if t.get('taken', False))
                 total_skipped += sum(1 for t in tracking if t.get('skipped', False))
 
@@ -325,27 +635,17 @@ class MedicineApp:
                 'pending': total_pending
             }
 
+            self._stats_rev = db.revision
+            self._stats_key = key
+            self._cache_rev += 1
+
             logger.info(f"Stats: {adherence_pct}% adherence")
 
         except Exception as e:
             logger.error(f"Failed to calculate stats: {e}")
             self.stats = {'adherence': 0, 'taken': 0, 'skipped': 0, 'pending': 0}
-
-    def is_in_time_window(self, medicine, current_time):
-        """Check if current time is in medicine's time window"""
-        try:
-            window_start = medicine.get('window_start', '00:00')
-            window_end = medicine.get('window_end', '23:59')
-
-            start_parts = window_start.split(':')
-            end_parts = window_end.split(':')
-
-            start_time = datetime.strptime(window_start, '%H:%M').time()
-            end_time = datetime.strptime(window_end, '%H:%M').time()
-
-            return start_time <= current_time <= end_time
-        except:
-            return True  # Default to always due if parsing fails
+            self._stats_rev = -1
+            self._cache_rev += 1
 
     # ========================================================================
     # BUTTON/TOUCH HANDLERS
@@ -376,32 +676,58 @@ class MedicineApp:
             self.gt_dev.TouchpointFlag = 0  # Clear flag
             self.handle_long_press()
         else:
-            # Short press - navigate
+            # Short press - navigate (debounced)
             if self.gt_dev:
                 self.gt_dev.TouchpointFlag = 0  # Clear flag
-            self.handle_short_press()
-
-    def handle_short_press(self):
-        """Navigate to next item in current context"""
+            self.queue_short_press()
+
+    def queue_short_press(self):
+        """Record a short press and render once the debounce window elapses"""
+        with self._touch_lock:
+            self._last_touch_ts = time.monotonic()
+            self._pending_presses += 1
+            if self._touch_timer is None:
+                self._touch_timer = threading.Timer(TOUCH_DEBOUNCE, self._commit_touch)
+                self._touch_timer.daemon = True
+                self._touch_timer.start()
+
+    def _commit_touch(self):
+        """Apply all short presses accumulated during the debounce window"""
+        with self._touch_lock:
+            steps = self._pending_presses
+            self._pending_presses = 0
+            if self._touch_timer is not None:
+                self._touch_timer.cancel()
+                self._touch_timer = None
+
+        if steps:
+            self.handle_short_press(steps)
+
+    def handle_short_press(self, steps=1):
+        """Navigate forward `steps` items in current context"""
         if self.state == STATE_MEDICINE_LIST:
-            self.next_medicine()
+            self.next_medicine(steps)
         elif self.state == STATE_ACTION_MENU:
-            self.next_action()
+            self.next_action(steps)
         elif self.state == STATE_MENU_OPTIONS:
-            self.next_menu_option()
+            self.next_menu_option(steps)
         elif self.state == STATE_SKIP_REASON:
-            self.next_skip_reason()
+            self.next_skip_reason(steps)
         elif self.state == STATE_PENDING_VIEW:
-            self.next_pending()
+            self.next_pending(steps)
         elif self.state == STATE_HISTORY_VIEW:
-            self.next_history()
+            self.next_history(steps)
         elif self.state == STATE_STATS_VIEW:
-            self.next_stats_view()
+            self.next_stats_view(steps)
         elif self.state == STATE_CONFIRMATION:
             pass  # Ignore during confirmation
 
     def handle_long_press(self):
         """Select/execute current item"""
+        # Apply any short presses still waiting in the debounce window first,
+        # so the selection matches what the user stepped to
+        self._commit_touch()
+
         if self.state == STATE_MEDICINE_LIST:
             current_item = self.carousel_items[self.carousel_index]
             if current_item == "MENU":
@@ -423,10 +749,9 @@ class MedicineApp:
 
         elif self.state == STATE_PENDING_VIEW:
             # Handle pending view long press
-            pending_items = self.pending_doses + ["BACK"]
-            current_item = pending_items[self.pending_index]
+            current_item = self._pending_deque[0]
 
-            if current_item == "BACK":
+            if current_item == BACK:
                 # Go back to menu options
                 self.return_to_menu_options()
             else:
@@ -436,19 +761,17 @@ class MedicineApp:
 
         elif self.state == STATE_HISTORY_VIEW:
             # Handle history view long press
-            history_items = self.skip_history + ["BACK"]
-            current_item = history_items[self.history_index]
+            current_item = self._history_deque[0]
 
-            if current_item == "BACK":
+            if current_item == BACK:
                 self.return_to_menu_options()
             # Note: Can't take action on historical skip events, just go back
 
         elif self.state == STATE_STATS_VIEW:
             # Handle stats view long press
-            stats_items = ["Overall", "BACK"]
-            current_item = stats_items[self.stats_index]
+            current_item = self._stats_deque[0]
 
-            if current_item == "BACK":
+            if current_item == BACK:
                 self.return_to_menu_options()
             # Note: No action on stats, just viewing
 
@@ -456,60 +779,52 @@ class MedicineApp:
     # NAVIGATION METHODS
     # ========================================================================
 
-    def next_medicine(self):
+    def next_medicine(self, steps=1):
         """Move to next item in medicine carousel"""
-        self.carousel_index = (self.carousel_index + 1) % len(self.carousel_items)
+        self.carousel_index = (self.carousel_index + steps) % len(self.carousel_items)
         self.render()
 
-    def next_action(self):
+    def next_action(self, steps=1):
         """Move to next action in action menu"""
         if self.selected_action is None:
-            self.selected_action = 0
+            self.selected_action = (steps - 1) % len(ACTIONS)
         else:
-            self.selected_action = (self.selected_action + 1) % len(ACTIONS)
+            self.selected_action = (self.selected_action + steps) % len(ACTIONS)
         self.render()
 
-    def next_menu_option(self):
+    def next_menu_option(self, steps=1):
         """Move to next menu option"""
         if self.selected_option is None:
-            self.selected_option = 0
+            self.selected_option = (steps - 1) % len(MENU_OPTIONS)
         else:
-            self.selected_option = (self.selected_option + 1) % len(MENU_OPTIONS)
+            self.selected_option = (self.selected_option + steps) % len(MENU_OPTIONS)
         self.render()
 
-    def next_skip_reason(self):
+    def next_skip_reason(self, steps=1):
         """Move to next skip reason"""
         if self.selected_reason is None:
-            self.selected_reason = 0
+            self.selected_reason = (steps - 1) % (len(SKIP_REASONS) + 1)
         else:
-            self.selected_reason = (self.selected_reason + 1) % (len(SKIP_REASONS) + 1)  # +1 for Back
+            # +1 for Back
+            self.selected_reason = (self.selected_reason + steps) % (len(SKIP_REASONS) + 1)
         self.render()
 
-    def next_pending(self):
+    def next_pending(self, steps=1):
         """Move to next pending dose"""
-        # Build carousel: pending doses + BACK
-        pending_items = self.pending_doses + ["BACK"]
-
-        # Cycle through items
-        self.pending_index = (self.pending_index + 1) % len(pending_items)
+        self._pending_deque.rotate(-steps)
+        self.pending_index = (self.pending_index + steps) % len(self._pending_deque)
         self.render()
 
-    def next_history(self):
+    def next_history(self, steps=1):
         """Move to next history item"""
-        # Build carousel: skip history + BACK
-        history_items = self.skip_history + ["BACK"]
-
-        # Cycle through items
-        self.history_index = (self.history_index + 1) % len(history_items)
+        self._history_deque.rotate(-steps)
+        self.history_index = (self.history_index + steps) % len(self._history_deque)
         self.render()
 
-    def next_stats_view(self):
+    def next_stats_view(self, steps=1):
         """Cycle stats views"""
-        # Build carousel: Overall stats + BACK
-        stats_items = ["Overall", "BACK"]
-
-        # Cycle through items
-        self.stats_index = (self.stats_index + 1) % len(stats_items)
+        self._stats_deque.rotate(-steps)
+        self.stats_index = (self.stats_index + steps) % len(self._stats_deque)
         self.render()
 
     # ========================================================================
@@ -543,8 +858,8 @@ class MedicineApp:
         self.selected_medicine = None
         self.selected_action = None
 
-        # Reload medicines to reflect any changes (taken/skipped)
-        self.load_medicines()
+        # Takes are applied to self.medicines in memory (see _drop_medicine);
+        # a full reload only happens at startup and on the periodic refresh
 
         # Reset carousel index if it's now out of bounds
         if self.carousel_index >= len(self.carousel_items):
@@ -553,6 +868,24 @@ class MedicineApp:
         logger.info("Returned to medicine list")
         self.render()
 
+    def _index_windows(self):
+        """Parse each medicine's time window once for pending-dose filtering"""
+        self._med_windows = [(*_window_minutes(m), m) for m in self.medicines]
+
+    def _drop_medicine(self, medicine_id):
+        """Remove a medicine from today's carousel without re-querying the DB"""
+        if self._med_by_id.pop(medicine_id, None) is None:
+            return
+
+        self.medicines = [m for m in self.medicines if m['id'] != medicine_id]
+        self._index_windows()
+        # The next DB reload returns this same list; keep it from looking changed
+        self._medicines_hash = self._medicines_fingerprint(self.medicines)
+        self.carousel_items = ["MENU"] + self.medicines + ["EXIT"]
+        if self.carousel_index >= len(self.carousel_items):
+            self.carousel_index = 0
+        self._cache_rev += 1
+
     def return_to_menu_options(self):
         """Return to menu options"""
         self.state = STATE_MENU_OPTIONS
@@ -578,14 +911,19 @@ class MedicineApp:
     def take_medicine(self):
         """Mark medicine as taken"""
         try:
-            med = self.selected_medicine
+            # Prefer the current carousel record (fresh pill count) for this id
+            med = self._med_by_id.get(self.selected_medicine['id'], self.selected_medicine)
             success = db.mark_medicine_taken(
                 medicine_id=med['id'],
                 time_window=med.get('time_window', 'anytime'),
                 taken_date=date.today()
             )
+            self.invalidate_tracking_cache()
 
             if success:
+                # Taken medicines leave today's carousel
+                self._drop_medicine(med['id'])
+
                 pills_remaining = med.get('pills_remaining', 0) - med.get('pills_per_dose', 1)
                 self.show_confirmation(
                     f"✓ {med['name'].upper()} TAKEN\n\n"
@@ -594,11 +932,11 @@ class MedicineApp:
                 )
                 logger.info(f"Marked {med['name']} as taken")
             else:
-                self.show_confirmation("Error marking taken\nPlease try again")
+                self.show_confirmation(MSG_TAKE_FAILED)
 
         except Exception as e:
             logger.error(f"Failed to mark taken: {e}")
-            self.show_confirmation("Error marking taken")
+            self.show_confirmation(MSG_TAKE_ERROR)
 
     def confirm_skip(self):
         """Confirm skip with selected reason"""
@@ -609,7 +947,7 @@ class MedicineApp:
             return
 
         try:
-            med = self.selected_medicine
+            med = self._med_by_id.get(self.selected_medicine['id'], self.selected_medicine)
             reason = SKIP_REASONS[self.selected_reason]
 
             success = db.skip_medicine(
@@ -617,6 +955,7 @@ class MedicineApp:
                 date.today().isoformat(),
                 reason=reason
             )
+            self.invalidate_tracking_cache()
 
             if success:
                 self.show_confirmation(
@@ -626,30 +965,44 @@ class MedicineApp:
                 )
                 logger.info(f"Skipped {med['name']} - {reason}")
             else:
-                self.show_confirmation("Error recording skip")
+                self.show_confirmation(MSG_SKIP_ERROR)
 
         except Exception as e:
             logger.error(f"Failed to record skip: {e}")
-            self.show_confirmation("Error recording skip")
+            self.show_confirmation(MSG_SKIP_ERROR)
 
     def execute_menu_option(self):
         """Execute selected menu option"""
         option = MENU_OPTIONS[self.selected_option]
 
+        # One bulk tracking query serves whichever view is opened
+        if option != "Back":
+            try:
+                self._load_tracking_window(7)
+            except Exception as e:
+                logger.error(f"Failed to load tracking window: {e}")
+
         if option == "Pending Doses":
             self.load_pending_doses()
+            # Build carousel once: pending doses + BACK
+            self._pending_deque = deque(self.pending_doses)
+            self._pending_deque.append(BACK)
             self.pending_index = 0  # Reset index when entering view
             self.state = STATE_PENDING_VIEW
             self.render()
 
         elif option == "Skip History":
             self.load_skip_history()
+            # Build carousel once: skip history + BACK
+            self._history_deque = deque(self.skip_history)
+            self._history_deque.append(BACK)
             self.history_index = 0  # Reset index when entering view
             self.state = STATE_HISTORY_VIEW
             self.render()
 
         elif option == "Adherence":
             self.calculate_stats()
+            self._stats_deque = deque(STATS_ITEMS)
             self.stats_index = 0  # Reset index when entering view
             self.state = STATE_STATS_VIEW
             self.render()
@@ -661,48 +1014,162 @@ class MedicineApp:
         """Show confirmation message and auto-return"""
         self.confirmation_message = message
         self.state = STATE_CONFIRMATION
+        self._cache_rev += 1
         self.render()
 
         # Auto-return to medicine list after delay
-        if self.confirmation_timer:
-            self.confirmation_timer.cancel()
-
-        self.confirmation_timer = threading.Timer(
-            CONFIRMATION_DURATION,
-            self.return_to_medicine_list
-        )
-        self.confirmation_timer.start()
+        self.start_scheduler()
+        self.schedule_return(CONFIRMATION_DURATION)
 
     # ========================================================================
     # RENDERING
     # ========================================================================
 
+    def _get_chrome(self, state_name, header_text=None, footer_text=None,
+                    line_y=25, footer_font=None, footer_y=None):
+        """Shared framebuffer reset to a state's static header, separator and footer
+
+        Templates are built once per state and pasted into self._fb for
+        every frame (no per-frame allocation); _chrome_cache is cleared
+        when the display is re-initialized.
+        """
+        size = (self._W, self._H)
+        chrome = self._chrome_cache.get(state_name)
+
+        if chrome is None or chrome.size != size:
+            chrome = Image.new('1', size, 255)
+            draw = ImageDraw.Draw(chrome)
+
+            if header_text:
+                draw.text((5, 5), header_text, font=self._font_title, fill=0)
+            if line_y is not None:
+                draw.line([(0, line_y), (self._W, line_y)], fill=0, width=1)
+            if footer_text:
+                y = self._footer_y if footer_y is None else footer_y
+                draw.text((5, y), footer_text,
+                          font=footer_font or self._font_hint, fill=0)
+
+            self._chrome_cache[state_name] = chrome
+
+        self._fb.paste(chrome)
+        return self._fb
+
+    def _list_chrome_copy(self):
+        """Framebuffer reset to the medicine list template"""
+        return self._get_chrome(STATE_MEDICINE_LIST, "MEDICINE TRACKER", HINT_SELECT)
+
+    def _start_display_worker(self):
+        """Start the thread that pushes queued frames to the panel"""
+        if self._disp_thread is not None and self._disp_thread.is_alive():
+            return
+
+        self._disp_thread = threading.Thread(target=self._disp_worker, daemon=True)
+        self._disp_thread.start()
+
+    def _stop_display_worker(self, timeout=2.0):
+        """Let an in-flight refresh finish, drop queued frames and stop the worker"""
+        thread = self._disp_thread
+        if thread is None:
+            return
+
+        self._queue_frame(None)
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.warning("Display worker did not stop cleanly")
+        self._disp_thread = None
+
+    def _disp_worker(self):
+        """Consume frames until a None sentinel arrives"""
+        while True:
+            image = self._disp_queue.get()
+            if image is None:
+                return
+            try:
+                self._display_now(image)
+            except Exception as e:
+                logger.error(f"Display update failed: {e}", exc_info=True)
+                self._prev_image = None
+
+    def _queue_frame(self, item):
+        """Queue a frame, replacing any frame the worker has not picked up yet"""
+        while True:
+            try:
+                self._disp_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._disp_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _display(self, image):
+        """Hand a frame to the display worker (newest frame wins)
+
+        image is the shared framebuffer, so a snapshot is queued. Without a
+        running worker the frame is sent synchronously.
+        """
+        if self._disp_thread is None or not self._disp_thread.is_alive():
+            self._display_now(image)
+            return
+
+        self._queue_frame(image.copy())
+
+    def _display_now(self, image):
+        """Send a frame, transferring only the rectangle that changed
+
+        Falls back to a full displayPartial() on the first frame, after a
+        size change, or when the driver has no windowed update.
+        """
+        prev = self._prev_image
+        window = getattr(self.epd, 'displayPartialWindow', None)
+
+        if window is None or prev is None or prev.size != image.size:
+            self.epd.displayPartial(self.epd.getbuffer(image))
+            self._remember_frame(image)
+            return
+
+        bbox = ImageChops.logical_xor(prev, image).getbbox()
+        if bbox is None:
+            # Pixel-identical frame, nothing to send
+            return
+
+        # getbuffer() rotates the landscape canvas 90° counter-clockwise, so
+        # landscape columns map to reversed portrait rows
+        left, top, right, bottom = bbox
+        canvas_width = image.size[0]
+        window(self.epd.getbuffer(image),
+               top, canvas_width - right, bottom - top, right - left)
+        self._remember_frame(image)
+
+    def _remember_frame(self, image):
+        """Keep a copy of the frame on the panel (image is the shared framebuffer)"""
+        prev = self._prev_image
+        if prev is None or prev.size != image.size:
+            self._prev_image = image.copy()
+        else:
+            prev.paste(image)
+
     def render_to_image(self):
         """Create image for current state without displaying (used for base image setup)"""
         # For now, just render medicine list since that's the initial state
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        image = self._list_chrome_copy()
+        draw = self._draw
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
+        font_title = self._font_title
+        font_body = self._font_body
 
         current_item = self.carousel_items[self.carousel_index]
 
-        # Header
-        draw.text((5, 5), "MEDICINE TRACKER", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
-
         if current_item == "MENU":
             # Show menu icon
-            draw.text((self.epd.height//2 - 30, 50), "⚙️  MENU", font=font_title, fill=0)
+            _paste_text(image, (self._cx - 30, 50), "⚙️  MENU", font_title)
         else:
             # Show medicine details
-            med = current_item
+            med = _with_labels(current_item)
             y = 35
 
             # Medicine name
-            draw.text((5, y), f"💊 {med['name']}", font=font_title, fill=0)
+            _paste_icon_label(image, draw, (5, y), "pill", med['name'], font_title, static=False)
             y += 22
 
             # Dosage
@@ -710,28 +1177,28 @@ class MedicineApp:
             y += 18
 
             # Pills remaining (with warning if low)
-            pills = med.get('pills_remaining', 0)
-            threshold = med.get('low_stock_threshold', 7)
-            warning = " ⚠️ LOW" if pills <= threshold else ""
-            draw.text((5, y), f"{pills} pills{warning}", font=font_body, fill=0)
+            draw.text((5, y), med['_stock_label'], font=font_body, fill=0)
             y += 18
 
             # Time window
-            window = med.get('time_window', 'anytime').capitalize()
-            start = med.get('window_start', '')
-            end = med.get('window_end', '')
-            draw.text((5, y), f"{window} ({start}-{end})", font=font_body, fill=0)
-
-        # Instructions at bottom - single line
-        y = self.epd.width - 12
-        draw.text((5, y), "Click: Next | Hold 2s: Select", font=font_hint, fill=0)
+            draw.text((5, y), med['_window_label'], font=font_body, fill=0)
 
         return image
 
     def render(self):
         """Render current state to display using displayPartial()"""
         logger.info(f"DEBUG: render() called, state={self.state}")
+        selected = self.selected_medicine
+        key = (self.state, self.carousel_index, self.pending_index,
+               self.history_index, self.stats_index, self.selected_action,
+               self.selected_option, self.selected_reason,
+               selected.get('id') if isinstance(selected, dict) else None,
+               len(self.pending_doses), len(self.skip_history),
+               tuple(self.stats.values()), self._cache_rev)
         with self.display_lock:
+            if key == self._last_render_key:
+                logger.info("DEBUG: Frame unchanged, skipping render")
+                return
             try:
                 if self.state == STATE_MEDICINE_LIST:
                     logger.info("DEBUG: Calling render_medicine_list()")
@@ -759,50 +1226,48 @@ class MedicineApp:
                     logger.info("DEBUG: Calling render_confirmation()")
                     self.render_confirmation()
 
+                self._last_render_key = key
+
             except Exception as e:
                 logger.error(f"Render failed: {e}", exc_info=True)
+                self._last_render_key = None
 
     def render_medicine_list(self):
         """Render medicine carousel"""
         logger.info(f"DEBUG: render_medicine_list() start, carousel_index={self.carousel_index}")
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        # Header, separator and footer come pre-drawn from the template
+        image = self._list_chrome_copy()
+        draw = self._draw
         logger.info("DEBUG: Image created")
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
+        font_title = self._font_title
+        font_body = self._font_body
         logger.info("DEBUG: Fonts loaded")
 
         current_item = self.carousel_items[self.carousel_index]
         logger.info(f"DEBUG: Current item = {current_item if current_item == 'MENU' else 'MEDICINE'}")
 
-        # Header
-        draw.text((5, 5), "MEDICINE TRACKER", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
-        logger.info("DEBUG: Header drawn")
-
         if current_item == "MENU":
             # Show menu icon
             if len(self.medicines) == 0:
                 # No pending medicines - show completion message
-                draw.text((self.epd.height//2 - 60, 45), "✓ All Done!", font=font_title, fill=0)
-                draw.text((5, 70), "No medicines due today", font=font_body, fill=0)
+                _paste_text(image, (self._cx - 60, 45), "✓ All Done!", font_title)
+                _paste_text(image, (5, 70), "No medicines due today", font_body)
                 logger.info("DEBUG: No pending medicines message shown")
             else:
-                draw.text((self.epd.height//2 - 30, 50), "⚙️  MENU", font=font_title, fill=0)
+                _paste_text(image, (self._cx - 30, 50), "⚙️  MENU", font_title)
                 logger.info("DEBUG: Menu item drawn")
         elif current_item == "EXIT":
             # Show EXIT option
-            draw.text((self.epd.height//2 - 30, 50), "🚪 EXIT", font=font_title, fill=0)
+            _paste_text(image, (self._cx - 30, 50), "🚪 EXIT", font_title)
             logger.info("DEBUG: Exit item drawn")
         else:
             # Show medicine details
-            med = current_item
+            med = _with_labels(current_item)
             y = 35
 
             # Medicine name
-            draw.text((5, y), f"💊 {med['name']}", font=font_title, fill=0)
+            _paste_icon_label(image, draw, (5, y), "pill", med['name'], font_title, static=False)
             y += 22
 
             # Dosage
@@ -810,85 +1275,60 @@ class MedicineApp:
             y += 18
 
             # Pills remaining (with warning if low)
-            pills = med.get('pills_remaining', 0)
-            threshold = med.get('low_stock_threshold', 7)
-            warning = " ⚠️ LOW" if pills <= threshold else ""
-            draw.text((5, y), f"{pills} pills{warning}", font=font_body, fill=0)
+            draw.text((5, y), med['_stock_label'], font=font_body, fill=0)
             y += 18
 
             # Time window
-            window = med.get('time_window', 'anytime').capitalize()
-            start = med.get('window_start', '')
-            end = med.get('window_end', '')
-            draw.text((5, y), f"{window} ({start}-{end})", font=font_body, fill=0)
+            draw.text((5, y), med['_window_label'], font=font_body, fill=0)
             logger.info("DEBUG: Medicine details drawn")
 
-        # Instructions at bottom - single line
-        y = self.epd.width - 12
-        draw.text((5, y), "Click: Next | Hold 2s: Select", font=font_hint, fill=0)
-        logger.info("DEBUG: Instructions drawn, about to call displayPartial()")
+        logger.info("DEBUG: About to call displayPartial()")
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
         logger.info("DEBUG: displayPartial() completed")
 
     def render_action_menu(self):
         """Render action menu (Take/Skip/Back)"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        # Header text is per-medicine, so only the line and footer are cached
+        image = self._get_chrome(STATE_ACTION_MENU, footer_text=HINT_CONFIRM, line_y=22)
+        draw = self._draw
 
-        font_title = get_font_preset('body')
-        font_action = get_font_preset('title')
-        font_hint = get_font_preset('subtitle')
+        font_title = self._font_body
+        font_action = self._font_title
 
-        med = self.selected_medicine
+        med = _with_labels(self.selected_medicine)
 
         # Header - medicine name
         draw.text((5, 5), f"{med['name']} - {med['dosage']}", font=font_title, fill=0)
-        draw.line([(0, 22), (self.epd.height, 22)], fill=0, width=1)
 
         # Current action (large)
         action = ACTIONS[self.selected_action]
-        icon = "✓" if action == "Take Now" else "⏭️" if action == "Skip" else "←"
-        draw.text((self.epd.height//2 - 50, 50), f"{icon} {action.upper()}", font=font_action, fill=0)
+        _paste_icon_label(image, draw, (self._cx - 50, 50), ACTION_ICONS.get(action),
+                          action.upper(), font_action)
 
         # Pills remaining info
         y = 85
-        pills = med.get('pills_remaining', 0)
-        draw.text((5, y), f"{pills} pills remaining", font=font_title, fill=0)
+        draw.text((5, y), med['_remaining_label'], font=font_title, fill=0)
 
         # Time window
         y += 18
-        window = med.get('time_window', 'anytime').capitalize()
-        start = med.get('window_start', '')
-        end = med.get('window_end', '')
-        draw.text((5, y), f"{window} ({start}-{end})", font=font_title, fill=0)
-
-        # Instructions - single line
-        y = self.epd.width - 12
-        draw.text((5, y), "Click: Next | Hold 2s: Confirm", font=font_hint, fill=0)
+        draw.text((5, y), med['_window_label'], font=font_title, fill=0)
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_menu_options(self):
         """Render menu options"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        image = self._get_chrome(STATE_MENU_OPTIONS, "MENU OPTIONS", HINT_VIEW)
+        draw = self._draw
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
-
-        # Header
-        draw.text((5, 5), "MENU OPTIONS", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
+        font_title = self._font_title
+        font_body = self._font_body
 
         # Current option
         option = MENU_OPTIONS[self.selected_option]
-        icons = {"Pending Doses": "📋", "Skip History": "⏭️", "Adherence": "📊", "Back": "←"}
-        icon = icons.get(option, "")
-
         y = 50
-        draw.text((self.epd.height//2 - 60, y), f"{icon} {option.upper()}", font=font_title, fill=0)
+        _paste_icon_label(image, draw, (self._cx - 60, y), OPTION_ICONS.get(option),
+                          option.upper(), font_title)
 
         # Option-specific info
         y = 80
@@ -896,174 +1336,135 @@ class MedicineApp:
             count = len(self.pending_doses) if hasattr(self, 'pending_doses') else 0
             draw.text((5, y), f"{count} medicines due today", font=font_body, fill=0)
         elif option == "Skip History":
-            draw.text((5, y), "Recent skips", font=font_body, fill=0)
+            _paste_text(image, (5, y), "Recent skips", font_body)
         elif option == "Adherence":
-            draw.text((5, y), "Last 7 days stats", font=font_body, fill=0)
+            _paste_text(image, (5, y), "Last 7 days stats", font_body)
 
-        # Instructions - single line
-        y = self.epd.width - 12
-        draw.text((5, y), "Click: Next | Hold 2s: View", font=font_hint, fill=0)
-
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_skip_reason(self):
         """Render skip reason selector"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
-
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
+        image = self._get_chrome(STATE_SKIP_REASON, "WHY SKIP?", HINT_CONFIRM)
+        draw = self._draw
 
-        # Header
-        draw.text((5, 5), "WHY SKIP?", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
+        font_title = self._font_title
 
         # Current reason
         if self.selected_reason < len(SKIP_REASONS):
             reason = SKIP_REASONS[self.selected_reason]
-            icons = {"Forgot": "😴", "Side effects": "🤢", "Out of stock": "📦",
-                     "Doctor advised": "🏥", "Other": "❓"}
-            icon = icons.get(reason, "")
-            draw.text((self.epd.height//2 - 50, 50), f"{icon} {reason.upper()}", font=font_title, fill=0)
+            _paste_icon_label(image, draw, (self._cx - 50, 50), SKIP_REASON_ICONS.get(reason),
+                              reason.upper(), font_title)
         else:
-            draw.text((self.epd.height//2 - 30, 50), "← BACK", font=font_title, fill=0)
-
-        # Instructions - single line
-        y = self.epd.width - 12
-        draw.text((5, y), "Click: Next | Hold 2s: Confirm", font=font_hint, fill=0)
+            _paste_text(image, (self._cx - 30, 50), "← BACK", font_title)
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_pending_view(self):
         """Render pending doses view"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        image = self._get_chrome(STATE_PENDING_VIEW, "PENDING DOSES", HINT_SELECT)
+        draw = self._draw
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
-
-        # Header
-        draw.text((5, 5), "PENDING DOSES", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
+        font_title = self._font_title
+        font_body = self._font_body
 
         if not self.pending_doses:
-            draw.text((5, 50), "No pending doses!", font=font_body, fill=0)
+            _paste_text(image, (5, 50), "No pending doses!", font_body)
         else:
-            # Build carousel: pending doses + BACK
-            pending_items = self.pending_doses + ["BACK"]
-            current_item = pending_items[self.pending_index]
+            current_item = self._pending_deque[0]
 
-            if current_item == "BACK":
+            if current_item == BACK:
                 # Show BACK option
-                draw.text((self.epd.height//2 - 30, 50), "← BACK", font=font_title, fill=0)
+                _paste_text(image, (self._cx - 30, 50), "← BACK", font_title)
             else:
                 # Show medicine details
-                dose = current_item
+                dose = _with_labels(current_item)
                 y = 35
-                draw.text((5, y), f"💊 {dose['name']}", font=font_title, fill=0)
+                _paste_icon_label(image, draw, (5, y), "pill", dose['name'], font_title,
+                                  static=False)
                 y += 22
-                draw.text((5, y), dose['dosage'], font=font_body, fill=0)
-                y += 18
-                window = dose.get('time_window', 'anytime').capitalize()
-                start = dose.get('window_start', '')
-                end = dose.get('window_end', '')
-                draw.text((5, y), f"{window} ({start}-{end})", font=font_body, fill=0)
-
-        # Instructions
-        draw.text((5, self.epd.width - 12), "Click: Next | Hold 2s: Select", font=font_hint, fill=0)
+                draw.multiline_text((5, y), f"{dose['dosage']}\n{dose['_window_label']}",
+                                    font=font_body, fill=0, spacing=4)
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_history_view(self):
         """Render skip history view"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        image = self._get_chrome(STATE_HISTORY_VIEW, "SKIP HISTORY", HINT_SELECT)
+        draw = self._draw
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
-
-        # Header
-        draw.text((5, 5), "SKIP HISTORY", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
+        font_title = self._font_title
+        font_body = self._font_body
 
         if not self.skip_history:
-            draw.text((5, 50), "No skips recorded", font=font_body, fill=0)
+            _paste_text(image, (5, 50), "No skips recorded", font_body)
         else:
-            # Build carousel: skip history + BACK
-            history_items = self.skip_history + ["BACK"]
-            current_item = history_items[self.history_index]
+            current_item = self._history_deque[0]
 
-            if current_item == "BACK":
+            if current_item == BACK:
                 # Show BACK option
-                draw.text((self.epd.height//2 - 30, 50), "← BACK", font=font_title, fill=0)
+                _paste_text(image, (self._cx - 30, 50), "← BACK", font_title)
             else:
                 # Show skip event details
                 skip = current_item
                 y = 35
-                draw.text((5, y), f"⏭️ {skip['medicine']}", font=font_title, fill=0)
+                _paste_icon_label(image, draw, (5, y), "skip", skip['medicine'], font_title,
+                                  static=False)
                 y += 22
-                draw.text((5, y), skip['dosage'], font=font_body, fill=0)
-                y += 18
-                draw.text((5, y), f"Date: {skip['date']}", font=font_body, fill=0)
-                y += 18
-                draw.text((5, y), f"Reason: {skip['reason']}", font=font_body, fill=0)
-
-        draw.text((5, self.epd.width - 12), "Click: Next | Hold 2s: Select", font=font_hint, fill=0)
+                draw.multiline_text(
+                    (5, y), f"{skip['dosage']}\n{skip['_date_label']}\n{skip['_reason_label']}",
+                    font=font_body, fill=0, spacing=4)
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_stats_view(self):
         """Render adherence stats view"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        image = self._get_chrome(STATE_STATS_VIEW, "ADHERENCE STATS", HINT_SELECT)
+        draw = self._draw
 
-        font_title = get_font_preset('title')
-        font_body = get_font_preset('body')
-        font_hint = get_font_preset('subtitle')
+        font_title = self._font_title
+        font_body = self._font_body
 
-        # Header
-        draw.text((5, 5), "ADHERENCE STATS", font=font_title, fill=0)
-        draw.line([(0, 25), (self.epd.height, 25)], fill=0, width=1)
+        current_item = self._stats_deque[0]
 
-        # Build carousel: Overall stats + BACK
-        stats_items = ["Overall", "BACK"]
-        current_item = stats_items[self.stats_index]
-
-        if current_item == "BACK":
+        if current_item == BACK:
             # Show BACK option
-            draw.text((self.epd.height//2 - 30, 50), "← BACK", font=font_title, fill=0)
+            _paste_text(image, (self._cx - 30, 50), "← BACK", font_title)
         else:
             # Show overall stats
             y = 40
             draw.text((5, y), f"Last 7 Days: {self.stats.get('adherence', 0)}%", font=font_title, fill=0)
             y += 25
-            draw.text((5, y), f"Taken: {self.stats.get('taken', 0)} | Skipped: {self.stats.get('skipped', 0)}", font=font_body, fill=0)
-            y += 20
-            draw.text((5, y), f"Pending: {self.stats.get('pending', 0)}", font=font_body, fill=0)
-
-        draw.text((5, self.epd.width - 12), "Click: Next | Hold 2s: Select", font=font_hint, fill=0)
+            draw.multiline_text(
+                (5, y),
+                f"Taken: {self.stats.get('taken', 0)} | Skipped: {self.stats.get('skipped', 0)}\n"
+                f"Pending: {self.stats.get('pending', 0)}",
+                font=font_body, fill=0, spacing=6)
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     def render_confirmation(self):
         """Render confirmation message"""
-        image = Image.new('1', (self.epd.height, self.epd.width), 255)
-        draw = ImageDraw.Draw(image)
+        cached = self._confirmation_frames.get(self.confirmation_message)
+        if cached is not None:
+            self._display(cached)
+            return
+
+        image = self._get_chrome(STATE_CONFIRMATION, footer_text="[Returning to list...]",
+                                 line_y=None, footer_font=self._font_body,
+                                 footer_y=self._footer_y2)
+        draw = self._draw
 
-        font_body = get_font_preset('body')
+        font_body = self._font_body
 
-        # Center the message
-        y = 30
-        for line in self.confirmation_message.split('\n'):
-            draw.text((5, y), line, font=font_body, fill=0)
-            y += 15
+        # Lay out all message lines in one call
+        draw.multiline_text((5, 30), self.confirmation_message, font=font_body,
+                            fill=0, spacing=3)
 
-        draw.text((5, self.epd.width - 15), "[Returning to list...]", font=font_body, fill=0)
+        # Error messages are fixed strings and recur; keep their finished frame
+        if self.confirmation_message in CONFIRMATION_STATIC:
+            self._confirmation_frames[self.confirmation_message] = image.copy()
 
-        self.epd.displayPartial(self.epd.getbuffer(image))
+        self._display(image)
 
     # ========================================================================
     # LIFECYCLE
@@ -1080,6 +1481,8 @@ class MedicineApp:
 
         # Set this as the base image for partial updates
         self.epd.displayPartBaseImage(self.epd.getbuffer(image))
+        self._last_render_key = None
+        self._remember_frame(image)
         logger.info("DEBUG: Base image set with displayPartBaseImage()")
 
         # CRITICAL: Wait for base image to fully commit before switching modes
@@ -1109,14 +1512,17 @@ class MedicineApp:
                     elif flag_value == 1:
                         # Short press
                         logger.info(f"DEBUG: Short press detected in state={self.state}")
-                        self.handle_short_press()
+                        self.queue_short_press()
 
                 # Check for exit request
                 if self.gt_dev and hasattr(self.gt_dev, 'exit_requested') and self.gt_dev.exit_requested:
                     logger.info("Exit requested via long press")
                     break
 
-                time.sleep(0.1)  # Poll every 100ms
+                # Block until a button callback, the refresh timer or stop()
+                # sets the event; without a shared event, keep a 100ms poll
+                self._wake.wait(timeout=1.0 if self._wake_shared else 0.1)
+                self._wake.clear()
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
 
@@ -1126,8 +1532,10 @@ class MedicineApp:
             return
 
         logger.info("Auto-refreshing medicine data")
-        self.load_medicines()
-        self.render()
+        if self.load_medicines():
+            self.render()
+
+        self._wake.set()
 
         self.refresh_timer = threading.Timer(UPDATE_INTERVAL, self.schedule_refresh)
         self.refresh_timer.start()
@@ -1136,9 +1544,18 @@ class MedicineApp:
         """Cleanup and exit"""
         logger.info("Cleaning up medicine app...")
         self.running = False
+        self._wake.set()
+
+        with self._scheduler_cond:
+            self._deadline = None
+            self._scheduler_stop = True
+            self._scheduler_cond.notify()
 
-        if self.confirmation_timer:
-            self.confirmation_timer.cancel()
+        with self._touch_lock:
+            if self._touch_timer is not None:
+                self._touch_timer.cancel()
+                self._touch_timer = None
+            self._pending_presses = 0
 
         if self.refresh_timer:
             self.refresh_timer.cancel()
@@ -1147,6 +1564,9 @@ class MedicineApp:
             logger.info("Stopping input handler...")
             self.input_handler.stop()
 
+        # Menu re-initializes the panel after we return; finish the refresh first
+        self._stop_display_worker()
+
         db.close()
         logger.info("Medicine app stopped")
 
@@ -1189,6 +1609,12 @@ def run_medicine_app(epd, GT_Dev, GT_Old, gt):
     app.gt_old = GT_Old
     app.gt = gt
 
+    # menu_button sets gt.event whenever it changes TouchpointFlag or
+    # exit_requested, so the run loop can block on it
+    if isinstance(getattr(gt, 'event', None), threading.Event):
+        app._wake = gt.event
+        app._wake_shared = True
+
     # Enable internal long-press handling for carousel selection
     # menu_button will send TouchpointFlag=2 instead of exiting
     if GT_Dev:
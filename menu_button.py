@@ -13,14 +13,21 @@ import os
 import time
 import threading
 from datetime import datetime
-picdir = os.path.join(
-    os.path.dirname(
-        os.path.dirname(
-            os.path.realpath(__file__))),
-    "python/pic/2in13")
-fontdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "python/pic")
-libdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "python/lib")
-sys.path.append(libdir)
+# Resolve the install location once; realpath stats every path component
+appdir = os.path.dirname(os.path.realpath(__file__))
+basedir = os.path.dirname(appdir)
+picdir = os.path.join(basedir, "python/pic/2in13")
+fontdir = os.path.join(basedir, "python/pic")
+libdir = os.path.join(basedir, "python/lib")
+if libdir not in sys.path:
+    sys.path.append(libdir)
+
+# Menu fonts, loaded once at import
+try:
+    FONT_TITLE = ImageFont.truetype(os.path.join(fontdir, "Roboto-Regular.ttf"), 10)
+    FONT_ITEM = ImageFont.truetype(os.path.join(fontdir, "Roboto-Regular.ttf"), 12)
+except Exception:
+    FONT_TITLE = FONT_ITEM = ImageFont.load_default()
 
 
 logging.basicConfig(level=logging.INFO)
@@ -57,7 +64,8 @@ epd.init(epd.FULL_UPDATE)
 epd.Clear(0xFF)
 
 # Button on GPIO 3
-pisugar_button = Button(3, pull_up=True, bounce_time=0.1)
+# when_held fires from gpiozero's edge-driven hold timer after hold_time
+pisugar_button = Button(3, pull_up=True, bounce_time=0.1, hold_time=2.0)
 
 
 def draw_menu(selected_index):
@@ -65,12 +73,8 @@ def draw_menu(selected_index):
     img = Image.new("1", (250, 122), 255)
     draw = ImageDraw.Draw(img)
 
-    try:
-        font_title = ImageFont.truetype(os.path.join(fontdir, "Roboto-Regular.ttf"), 10)
-        font_item = ImageFont.truetype(os.path.join(fontdir, "Roboto-Regular.ttf"), 12)
-    except BaseException:
-        font_title = ImageFont.load_default()
-        font_item = ImageFont.load_default()
+    font_title = FONT_TITLE
+    font_item = FONT_ITEM
 
     # Title
     draw.text((5, 2), "PiZero Menu (Button Control)", font=font_title, fill=0)
@@ -99,6 +103,20 @@ def draw_menu(selected_index):
     return img
 
 
+# Packed display buffers per selected index; APPS is fixed, so there are
+# only len(APPS) possible menu frames
+_menu_cache = {}
+
+
+def get_menu_buffer(idx):
+    """Get the display buffer for the menu with item idx selected (cached)"""
+    buf = _menu_cache.get(idx)
+    if buf is None:
+        buf = epd.getbuffer(draw_menu(idx))
+        _menu_cache[idx] = buf
+    return buf
+
+
 def button_pressed():
     """Called when button is pressed"""
     global button_press_start, hold_processed, in_app
@@ -128,6 +146,7 @@ def button_released():
     if in_app and hold_duration < 2.0:
         if global_GT_Dev:
             global_GT_Dev.TouchpointFlag = 1
+            notify_app()
             logging.info("Button click in app")
         return
 
@@ -137,49 +156,45 @@ def button_released():
         logging.info(f"Navigate to: {APPS[current_selection]['name']}")
 
         # Use partial refresh for fast navigation
-        image = draw_menu(current_selection)
-        epd.displayPartial(epd.getbuffer(image))
-
-
-def monitor_button_hold():
-    """Background thread monitoring button hold"""
-    global button_press_start, current_selection, exit_requested, in_app, menu_running, hold_processed
-    global global_GT_Dev, launch_requested, launch_app_index
-
-    while menu_running:
-        if button_press_start is not None:
-            is_pressed = pisugar_button.is_pressed
-            hold_duration = time.time() - button_press_start
-
-            # Debug logging every 0.2s during a hold (more frequent)
-            if hold_duration >= 0.2 and int(hold_duration * 100) % 20 == 0:
-                logging.info(
-                    f"HOLD DEBUG: duration={hold_duration:.2f}s, is_pressed={is_pressed}, in_app={in_app}, hold_processed={hold_processed}")
-
-            if is_pressed and hold_duration >= 2.0 and not hold_processed:
-                hold_processed = True
-
-                if in_app:
-                    # Check if app wants to handle long press internally
-                    if global_GT_Dev and getattr(global_GT_Dev, 'handle_long_press_internally', False):
-                        # App handles long press - signal via TouchpointFlag with special value
-                        global_GT_Dev.TouchpointFlag = 2  # 2 = long press
-                        logging.info("LONG PRESS - App handling internally")
-                    else:
-                        # Default behavior - exit app
-                        logging.info("EXIT APP - Hold complete")
-                        exit_requested = True
-                        if global_GT_Dev:
-                            global_GT_Dev.exit_requested = True
-                else:
-                    logging.info(
-                        f"LAUNCH APP - {APPS[current_selection]['name']} (requesting launch)")
-                    launch_requested = True
-                    launch_app_index = current_selection
-
-                button_press_start = None
-
-        time.sleep(0.1)
+        epd.displayPartial(get_menu_buffer(current_selection))
+
+
+def notify_app():
+    """Wake an app blocked in gt.wait_event() after the touch flags change"""
+    if global_gt is not None and hasattr(global_gt, 'event'):
+        global_gt.event.set()
+
+
+def button_held():
+    """Called by gpiozero once the button has been held for hold_time"""
+    global button_press_start, exit_requested, hold_processed
+    global launch_requested, launch_app_index
+
+    if hold_processed:
+        return
+    hold_processed = True
+
+    if in_app:
+        # Check if app wants to handle long press internally
+        if global_GT_Dev and getattr(global_GT_Dev, 'handle_long_press_internally', False):
+            # App handles long press - signal via TouchpointFlag with special value
+            global_GT_Dev.TouchpointFlag = 2  # 2 = long press
+            notify_app()
+            logging.info("LONG PRESS - App handling internally")
+        else:
+            # Default behavior - exit app
+            logging.info("EXIT APP - Hold complete")
+            exit_requested = True
+            if global_GT_Dev:
+                global_GT_Dev.exit_requested = True
+            notify_app()
+    else:
+        logging.info(
+            f"LAUNCH APP - {APPS[current_selection]['name']} (requesting launch)")
+        launch_requested = True
+        launch_app_index = current_selection
+
+    button_press_start = None
 
 
 def launch_app(app):
@@ -209,10 +224,17 @@ def launch_app(app):
         class DummyGT:
             def __init__(self):
                 self.INT = 27
+                self.event = threading.Event()  # Set by button callbacks
 
             def digital_read(self, pin):
                 return 1
 
+            def wait_event(self, timeout=0.5):
+                # No touch panel behind this stub, so just block quietly;
+                # self.event belongs to the running app's main loop
+                time.sleep(timeout)
+                return False
+
             def GT_Scan(self, gt_dev, gt_old):
                 pass
 
@@ -249,8 +271,7 @@ def launch_app(app):
         # Return to menu with full refresh to clear any ghosting
         epd.init(epd.FULL_UPDATE)
         epd.Clear(0xFF)
-        image = draw_menu(current_selection)
-        epd.displayPartBaseImage(epd.getbuffer(image))
+        epd.displayPartBaseImage(get_menu_buffer(current_selection))
         epd.init(epd.PART_UPDATE)  # Switch to partial for navigation
 
         logging.info("Returned to menu")
@@ -259,17 +280,13 @@ def launch_app(app):
 # Main
 if __name__ == "__main__":
     try:
-        # Start monitor thread
-        monitor_thread = threading.Thread(target=monitor_button_hold, daemon=True)
-        monitor_thread.start()
-
         # Set button callbacks
         pisugar_button.when_pressed = button_pressed
         pisugar_button.when_released = button_released
+        pisugar_button.when_held = button_held
 
         # Display initial menu with full refresh, then set base for partial updates
-        image = draw_menu(current_selection)
-        epd.displayPartBaseImage(epd.getbuffer(image))
+        epd.displayPartBaseImage(get_menu_buffer(current_selection))
         epd.init(epd.PART_UPDATE)  # Switch to partial update mode
 
         logging.info("Button menu started")
@@ -1,84 +1,165 @@
 # \!/usr/bin/python3
-import medicine_app
-import mbta_app
-import disney_app
-import pomodoro_app
-import flights_app
-import reboot_app
-import weather_cal_app
-import forbidden_app
-import threading
+import importlib
 import logging
 from PIL import Image, ImageDraw, ImageFont
 from TP_lib import gt1151, epd2in13_V4 as epd2in13_V3
+from shared.app_utils import cleanup_touch_state
 import sys
 import os
 import time
-picdir = os.path.join(
-    os.path.dirname(
-        os.path.dirname(
-            os.path.realpath(__file__))),
-    'python/pic/2in13')
-fontdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'python/pic')
-libdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'python/lib')
-icondir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'icons')
-sys.path.append(libdir)
+# Resolve the install location once; realpath stats every path component
+appdir = os.path.dirname(os.path.realpath(__file__))
+basedir = os.path.dirname(appdir)
+picdir = os.path.join(basedir, 'python/pic/2in13')
+fontdir = os.path.join(basedir, 'python/pic')
+libdir = os.path.join(basedir, 'python/lib')
+icondir = os.path.join(appdir, 'icons')
+if libdir not in sys.path:
+    sys.path.append(libdir)
 
 logging.basicConfig(level=logging.INFO)
 
+
+def _coming_soon(epd, GT_Dev, GT_Old, gt):
+    """Placeholder launcher for apps without an entry point yet"""
+    global last_shown_idx
+    epd.displayPartial(COMING_SOON_BUFFER)
+    last_shown_idx = -1
+    time.sleep(2)
+    _show_menu()
+
+
+# "launch" is (module, function); app modules are imported on first launch.
+# Entry points take (epd, GT_Dev, GT_Old, gt)
 APPS = [
-    {"name": "Weather &\nCalendar", "icon": "calendar.bmp", "func": "weather"},
-    {"name": "Flights\nAbove Me", "icon": "flight.bmp", "func": "flights"},
-    {"name": "MBTA\nTrains", "icon": "mbta.bmp", "func": "mbta"},
-    {"name": "Disney\nWait Times", "icon": "disney.bmp", "func": "disney"},
-    {"name": "Pomodoro\nTimer", "icon": "clock.bmp", "func": "pomodoro"},
-    {"name": "Reboot\nSystem", "icon": "reboot.bmp", "func": "reboot"},
-    {"name": "Sai\nCurioso", "icon": "forbidden.bmp", "func": "forbidden"}
+    {"name": "Weather &\nCalendar", "icon": "calendar.bmp", "func": "weather",
+     "launch": ("weather_cal_app", "run_weather_app")},
+    {"name": "Flights\nAbove Me", "icon": "flight.bmp", "func": "flights",
+     "launch": ("flights_app", "run_flights_app")},
+    {"name": "MBTA\nTrains", "icon": "mbta.bmp", "func": "mbta",
+     "launch": ("mbta_app", "run_mbta_app")},
+    {"name": "Disney\nWait Times", "icon": "disney.bmp", "func": "disney",
+     "launch": ("disney_app", "run_disney_app")},
+    {"name": "Pomodoro\nTimer", "icon": "clock.bmp", "func": "pomodoro",
+     "launch": ("pomodoro_app", "run_pomodoro_app")},
+    {"name": "Reboot\nSystem", "icon": "reboot.bmp", "func": "reboot",
+     "launch": ("reboot_app", "draw_reboot_confirm")},
+    {"name": "Sai\nCurioso", "icon": "forbidden.bmp", "func": "forbidden",
+     "launch": ("forbidden_app", "draw_forbidden_message")}
 ]
 current_app = 0
-flag_t = 1
 
+# Returns from apps use a partial refresh; every Nth does a full one to clear ghosting
+FULL_REFRESH_EVERY = 20
+_partial_count = 0
 
-def pthread_irq():
-    while flag_t == 1:
-        if gt.digital_read(gt.INT) == 0:
-            GT_Dev.Touch = 1
-        else:
-            GT_Dev.Touch = 0
-        time.sleep(0.01)
+# Index of the menu frame currently on the panel (-1 = something else)
+last_shown_idx = -1
+
+# Fonts are loaded once; every menu frame is rendered at startup
+F_SMALL = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Regular.ttf'), 12)
+F_ARROW = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Bold.ttf'), 40)
+F_TINY = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Regular.ttf'), 10)
+F_NOTICE = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Bold.ttf'), 14)
+
+
+def _load_icon(filename):
+    try:
+        return Image.open(os.path.join(icondir, filename)).convert('1')
+    except FileNotFoundError:
+        logging.warning(f"Menu icon not found: {filename}")
+        return None
+
+
+# Icons decoded once at import, keyed by filename (None if missing)
+ICONS = {app["icon"]: _load_icon(app["icon"]) for app in APPS}
 
 
-def draw_menu():
+# Centered (line, x) pairs per app; names are static so measure them once
+APP_LINES = [
+    [(line, int(250 - F_SMALL.getlength(line)) // 2) for line in app["name"].split("\n")]
+    for app in APPS
+]
+
+
+def _render_chrome():
     img = Image.new('1', (250, 122), 255)
     draw = ImageDraw.Draw(img)
-    f_small = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Regular.ttf'), 12)
-    f_arrow = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Bold.ttf'), 40)
-    f_tiny = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Regular.ttf'), 10)
 
-    draw.text((5, 5), "PiZero Menu", font=f_tiny, fill=0)
-    draw.text((10, 45), "<", font=f_arrow, fill=0)
-    draw.text((220, 45), ">", font=f_arrow, fill=0)
+    draw.text((5, 5), "PiZero Menu", font=F_TINY, fill=0)
+    draw.text((10, 45), "<", font=F_ARROW, fill=0)
+    draw.text((220, 45), ">", font=F_ARROW, fill=0)
 
-    app = APPS[current_app]
+    return img
 
-    try:
-        icon_path = os.path.join(icondir, app["icon"])
-        icon = Image.open(icon_path)
+
+BASE_CHROME = _render_chrome()
+
+
+def _render_frame(idx):
+    img = BASE_CHROME.copy()
+    draw = ImageDraw.Draw(img)
+
+    app = APPS[idx]
+
+    icon = ICONS[app["icon"]]
+    if icon:
         img.paste(icon, ((250 - icon.width) // 2, 25))
-    except BaseException:
-        pass
 
-    lines = app["name"].split("\n")
     y_offset = 90
-    for line in lines:
-        bbox = draw.textbbox((0, 0), line, font=f_small)
-        w = bbox[2] - bbox[0]
-        draw.text(((250 - w) // 2, y_offset), line, font=f_small, fill=0)
+    for line, x in APP_LINES[idx]:
+        draw.text((x, y_offset), line, font=F_SMALL, fill=0)
         y_offset += 14
 
     return img
 
 
+def _render_coming_soon():
+    img = Image.new('1', (250, 122), 255)
+    draw = ImageDraw.Draw(img)
+    draw.text((30, 50), "Coming soon\\!", font=F_NOTICE, fill=0)
+    return img
+
+
+MENU_FRAMES = [_render_frame(i) for i in range(len(APPS))]
+COMING_SOON_FRAME = _render_coming_soon()
+
+# Packed frames, filled once the display is up
+MENU_BUFFERS = []
+COMING_SOON_BUFFER = None
+
+
+def _show_menu():
+    """Partial-refresh the current menu frame unless it is already shown"""
+    global last_shown_idx
+    if current_app == last_shown_idx:
+        return
+    epd.displayPartial(MENU_BUFFERS[current_app])
+    last_shown_idx = current_app
+
+
+def _return_to_menu():
+    """Reset touch state and redraw the menu after an app exits"""
+    global _partial_count, last_shown_idx
+    cleanup_touch_state(GT_Old)
+    GT_Dev.TouchpointFlag = 0
+
+    _partial_count += 1
+    if _partial_count >= FULL_REFRESH_EVERY:
+        _partial_count = 0
+        epd.init(epd.FULL_UPDATE)
+        epd.Clear(0xFF)
+        epd.displayPartBaseImage(MENU_BUFFERS[current_app])
+        epd.init(epd.PART_UPDATE)
+        last_shown_idx = current_app
+    else:
+        # The app drew over the panel, so the menu frame must be resent
+        last_shown_idx = -1
+        _show_menu()
+    logging.info("Back to menu")
+    time.sleep(1)
+
+
 try:
     logging.info("Starting menu")
     epd = epd2in13_V3.EPD()
@@ -90,18 +171,22 @@ try:
     gt.GT_Init()
     epd.Clear(0xFF)
 
-    t = threading.Thread(target=pthread_irq)
-    t.daemon = True
-    t.start()
+    MENU_BUFFERS = [epd.getbuffer(frame) for frame in MENU_FRAMES]
+    COMING_SOON_BUFFER = epd.getbuffer(COMING_SOON_FRAME)
 
-    image = draw_menu()
-    epd.displayPartBaseImage(epd.getbuffer(image))
+    epd.displayPartBaseImage(MENU_BUFFERS[current_app])
     epd.init(epd.PART_UPDATE)
+    last_shown_idx = current_app
 
     logging.info("Menu ready")
 
     while True:
-        time.sleep(0.01)
+        # Idle panel: sleep in the kernel until the controller pulls INT low,
+        # and skip the I2C scan while nothing is touching
+        if gt.digital_read(gt.INT) != 0 and not gt.wait_event(timeout=0.5):
+            GT_Dev.Touch = 0
+            continue
+        GT_Dev.Touch = 1
         gt.GT_Scan(GT_Dev, GT_Old)
 
         if GT_Old.X[0] == GT_Dev.X[0] and GT_Old.Y[0] == GT_Dev.Y[0] and GT_Old.S[0] == GT_Dev.S[0]:
@@ -113,142 +198,25 @@ try:
 
             if y < 70:
                 current_app = (current_app - 1) % len(APPS)
-                image = draw_menu()
-                epd.displayPartial(epd.getbuffer(image))
+                _show_menu()
 
             elif y > 180:
                 current_app = (current_app + 1) % len(APPS)
-                image = draw_menu()
-                epd.displayPartial(epd.getbuffer(image))
+                _show_menu()
 
             elif 70 <= y <= 180:
                 app = APPS[current_app]
                 logging.info(f"LAUNCH: {app['name'].replace(chr(10), ' ')}")
 
-                if app["func"] == "weather":
-                    weather_cal_app.run_weather_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "reboot":
-                    reboot_app.draw_reboot_confirm(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "flights":
-                    flights_app.run_flights_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "pomodoro":
-                    pomodoro_app.run_pomodoro_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "disney":
-                    disney_app.run_disney_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "mbta":
-                    mbta_app.run_mbta_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "medicine":
-                    medicine_app.run_medicine_app(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
-                elif app["func"] == "forbidden":
-                    forbidden_app.draw_forbidden_message(epd, GT_Dev, GT_Old, gt)
-                    GT_Old.X[0] = 0
-                    GT_Old.Y[0] = 0
-                    GT_Old.S[0] = 0
-                    GT_Dev.TouchpointFlag = 0
-                    epd.init(epd.FULL_UPDATE)
-                    epd.Clear(0xFF)
-                    image = draw_menu()
-                    epd.displayPartBaseImage(epd.getbuffer(image))
-                    epd.init(epd.PART_UPDATE)
-                    logging.info("Back to menu")
-                    time.sleep(1)
-
+                if "launch" in app:
+                    module_name, func_name = app["launch"]
+                    launch = getattr(importlib.import_module(module_name), func_name)
+                    launch(epd, GT_Dev, GT_Old, gt)
+                    _return_to_menu()
                 else:
-                    img = Image.new('1', (250, 122), 255)
-                    draw = ImageDraw.Draw(img)
-                    f = ImageFont.truetype(os.path.join(fontdir, 'Roboto-Bold.ttf'), 14)
-                    draw.text((30, 50), "Coming soon\\!", font=f, fill=0)
-                    epd.displayPartial(epd.getbuffer(img))
-                    time.sleep(2)
-                    image = draw_menu()
-                    epd.displayPartial(epd.getbuffer(image))
+                    _coming_soon(epd, GT_Dev, GT_Old, gt)
 
             time.sleep(0.2)
 
 except KeyboardInterrupt:
-    flag_t = 0
     epd2in13_V3.epdconfig.module_exit()
@@ -8,9 +8,18 @@ import json
 import os
 import sys
 import shutil
-from datetime import datetime
+from datetime import date, datetime
 from db.medicine_db import MedicineDatabase
 
+# Optional: stream records instead of loading the whole file into memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Time windows accepted by the API schema (shared/validation.py)
+VALID_TIME_WINDOWS = frozenset(('morning', 'afternoon', 'evening', 'night'))
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -36,83 +45,116 @@ def backup_json_files():
     return backup_dir
 
 
-def load_json_data():
-    """Load existing medicine_data.json"""
+def locate_json_data():
+    """Locate existing medicine_data.json"""
     json_path = '/home/user/pizerowgpio/medicine_data.json'
 
     if not os.path.exists(json_path):
         print(f"❌ Error: {json_path} not found")
         sys.exit(1)
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    mode = "streaming" if ijson else "in-memory"
+    print(f"✓ Found JSON data: {json_path} ({mode} parsing)")
+    return json_path
 
-    print(f"✓ Loaded JSON data: {len(data.get('medicines', []))} medicines")
-    return data
 
+def iter_medicines(json_path: str):
+    """Yield medicine records from the JSON file one at a time"""
+    with open(json_path, 'rb') as f:
+        if ijson:
+            yield from ijson.items(f, 'medicines.item', use_float=True)
+        else:
+            yield from json.load(f).get('medicines', [])
+
+
+def iter_tracking(json_path: str):
+    """Yield (date, entries) pairs from the JSON tracking section"""
+    with open(json_path, 'rb') as f:
+        if ijson:
+            yield from ijson.kvitems(f, 'tracking', use_float=True)
+        else:
+            yield from json.load(f).get('tracking', {}).items()
 
-def migrate_medicines(db: MedicineDatabase, json_data: dict):
-    """Migrate medicines from JSON to SQLite"""
-    medicines = json_data.get('medicines', [])
 
-    print(f"\n📦 Migrating {len(medicines)} medicines...")
+def migrate_medicines(db: MedicineDatabase, json_path: str):
+    """Migrate medicines from JSON to SQLite"""
+    print("\n📦 Migrating medicines...")
 
-    for med in medicines:
+    count = 0
+    for med in iter_medicines(json_path):
         try:
             db.add_medicine(med)
+            count += 1
             print(f"  ✓ {med['name']} ({med['dosage']})")
         except Exception as e:
             print(f"  ❌ Failed to migrate {med.get('name', 'unknown')}: {e}")
             raise
 
-    print(f"✓ Migrated {len(medicines)} medicines")
+    print(f"✓ Migrated {count} medicines")
 
 
-def migrate_tracking(db: MedicineDatabase, json_data: dict):
+def migrate_tracking(db: MedicineDatabase, json_path: str):
     """Migrate tracking history from JSON to SQLite"""
-    tracking = json_data.get('tracking', {})
-
-    print(f"\n📊 Migrating tracking data for {len(tracking)} days...")
+    print("\n📊 Migrating tracking data...")
 
     total_entries = 0
+    total_days = 0
+
+    for date_str, entries in iter_tracking(json_path):
+        total_days += 1
+
+        # The date is shared by every entry of the day; parse it once
+        try:
+            taken_date = date.fromisoformat(date_str)
+        except ValueError:
+            print(f"  ⚠️  Skipping invalid tracking date: {date_str}")
+            continue
 
-    for date_str, entries in tracking.items():
         for key, entry in entries.items():
+            # Only insert if marked as taken
+            if not entry.get('taken', False):
+                continue
+
             # Parse key: "med_id_timewindow"
             parts = key.rsplit('_', 1)
-            if len(parts) != 2:
+            if len(parts) != 2 or parts[1] not in VALID_TIME_WINDOWS:
                 print(f"  ⚠️  Skipping invalid tracking key: {key}")
                 continue
 
-            medicine_id = parts[0]
-            time_window = parts[1]
+            medicine_id, time_window = parts
 
-            # Only insert if marked as taken
-            if entry.get('taken', False):
-                try:
-                    timestamp = datetime.fromisoformat(entry['timestamp'])
-
-                    db.mark_medicine_taken(
-                        medicine_id=medicine_id,
-                        time_window=time_window,
-                        taken_date=datetime.strptime(date_str, '%Y-%m-%d').date(),
-                        timestamp=timestamp
-                    )
+            try:
+                timestamp = datetime.fromisoformat(entry['timestamp'])
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"  ⚠️  Bad timestamp for {medicine_id} on {date_str}: {e}")
+                continue
 
-                    total_entries += 1
+            try:
+                db.mark_medicine_taken(
+                    medicine_id=medicine_id,
+                    time_window=time_window,
+                    taken_date=taken_date,
+                    timestamp=timestamp
+                )
+                total_entries += 1
 
-                except Exception as e:
-                    print(f"  ⚠️  Failed to migrate tracking {medicine_id} on {date_str}: {e}")
+            except Exception as e:
+                print(f"  ⚠️  Failed to migrate tracking {medicine_id} on {date_str}: {e}")
 
-    print(f"✓ Migrated {total_entries} tracking entries across {len(tracking)} days")
+    print(f"✓ Migrated {total_entries} tracking entries across {total_days} days")
 
 
-def verify_migration(db: MedicineDatabase, json_data: dict):
+def verify_migration(db: MedicineDatabase, json_path: str):
     """Verify migration succeeded"""
     print("\n🔍 Verifying migration...")
 
-    # Check medicine count
-    json_medicines = len(json_data.get('medicines', []))
+    # Check medicine count (streamed again, keeping a few names to spot-check)
+    json_medicines = 0
+    sample = []
+    for med in iter_medicines(json_path):
+        json_medicines += 1
+        if len(sample) < 3:
+            sample.append((med['id'], med['name']))
     db_medicines = len(db.get_all_medicines(include_inactive=True))
 
     if json_medicines == db_medicines:
@@ -122,18 +164,18 @@ def verify_migration(db: MedicineDatabase, json_data: dict):
         return False
 
     # Check tracking count
-    json_tracking = sum(len(entries) for entries in json_data.get('tracking', {}).values())
+    json_tracking = sum(len(entries) for _, entries in iter_tracking(json_path))
     db_tracking = len(db.get_tracking_history())
 
     print(f"  Tracking entries: JSON={json_tracking}, DB={db_tracking}")
 
     # Sample verification: check a few medicines exist
-    for med in json_data.get('medicines', [])[:3]:
-        db_med = db.get_medicine_by_id(med['id'])
+    for med_id, name in sample:
+        db_med = db.get_medicine_by_id(med_id)
         if db_med:
-            print(f"  ✓ Verified: {med['name']}")
+            print(f"  ✓ Verified: {name}")
         else:
-            print(f"  ❌ Missing: {med['name']}")
+            print(f"  ❌ Missing: {name}")
             return False
 
     print("✓ Migration verified successfully")
@@ -151,9 +193,9 @@ def main():
     backup_dir = backup_json_files()
     print(f"✓ Backups created in: {backup_dir}")
 
-    # Step 2: Load JSON
+    # Step 2: Locate JSON (records are streamed during each pass)
     print("\n2️⃣  Loading JSON data...")
-    json_data = load_json_data()
+    json_path = locate_json_data()
 
     # Step 3: Initialize database
     print("\n3️⃣  Initializing SQLite database...")
@@ -171,10 +213,15 @@ def main():
     db = MedicineDatabase(db_path=db_path)
     print(f"✓ Database initialized: {db_path}")
 
+    # The JSON is backed up, so skip fsync until the data is verified
+    db.set_bulk_load(True)
+
+    # Each pass runs in one transaction so the inserts share a single commit
     # Step 4: Migrate medicines
     print("\n4️⃣  Migrating medicines...")
     try:
-        migrate_medicines(db, json_data)
+        with db.transaction():
+            migrate_medicines(db, json_path)
     except Exception as e:
         print(f"\n❌ Migration failed: {e}")
         sys.exit(1)
@@ -182,17 +229,20 @@ def main():
     # Step 5: Migrate tracking
     print("\n5️⃣  Migrating tracking history...")
     try:
-        migrate_tracking(db, json_data)
+        with db.transaction():
+            migrate_tracking(db, json_path)
     except Exception as e:
         print(f"\n❌ Migration failed: {e}")
         sys.exit(1)
 
     # Step 6: Verify
     print("\n6️⃣  Verifying migration...")
-    if not verify_migration(db, json_data):
+    if not verify_migration(db, json_path):
         print("\n❌ Verification failed")
         sys.exit(1)
 
+    db.set_bulk_load(False)
+
     # Step 7: Optimize
     print("\n7️⃣  Optimizing database...")
     db.vacuum()
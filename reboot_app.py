@@ -20,7 +20,7 @@ Uses unified InputHandler abstraction for hardware compatibility.
 """
 
 from display.components import Button
-from display.fonts import get_font_preset
+from display.fonts import get_font_preset, preload_fonts
 from display.input_handler import create_input_handler
 from shared.app_utils import setup_logging, check_exit_requested
 from PIL import Image, ImageDraw
@@ -33,11 +33,21 @@ import logging
 
 # Path setup
 libdir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'python/lib')
-sys.path.append(libdir)
+if libdir not in sys.path:
+    sys.path.append(libdir)
 
 
 logger = setup_logging('reboot_app', log_to_file=True)
 
+# Touch targets as (x_min, x_max, y_min, y_max, selection); 0 = Cancel, 1 = Reboot
+REGIONS = ((10, 110, 50, 80, 0), (140, 240, 50, 80, 1))
+
+
+def _hit(x, y):
+    """Return the selection for the button under (x, y), or None"""
+    return next((sel for x0, x1, y0, y1, sel in REGIONS
+                 if x0 <= x <= x1 and y0 <= y <= y1), None)
+
 
 def draw_reboot_screen(epd, selection=0, input_mode="touch"):
     """Draw reboot confirmation screen with selection state
@@ -104,10 +114,6 @@ def draw_reboot_confirm(epd, gt_dev, gt_old, gt):
         input_mode = handler.mode
         logger.info(f"Input mode: {input_mode}")
 
-        # Define button regions for touch mode
-        cancel_region = (10, 50, 110, 80)  # x1, y1, x2, y2
-        reboot_region = (140, 50, 240, 80)
-
         def on_touch_coordinates(x, y):
             """Handle touch input - direct button tapping"""
             nonlocal selection, confirmed, running
@@ -115,14 +121,10 @@ def draw_reboot_confirm(epd, gt_dev, gt_old, gt):
             logger.info(f"Touch detected at ({x}, {y})")
 
             # Check which button was tapped
-            if cancel_region[0] <= x <= cancel_region[2] and cancel_region[1] <= y <= cancel_region[3]:
-                logger.info("Cancel button tapped")
-                selection = 0
-                confirmed = True
-                running = False
-            elif reboot_region[0] <= x <= reboot_region[2] and reboot_region[1] <= y <= reboot_region[3]:
-                logger.info("Reboot button tapped")
-                selection = 1
+            sel = _hit(x, y)
+            if sel is not None:
+                logger.info(f"{'Reboot' if sel else 'Cancel'} button tapped")
+                selection = sel
                 confirmed = True
                 running = False
 
@@ -173,9 +175,16 @@ def draw_reboot_confirm(epd, gt_dev, gt_old, gt):
                 draw_rebooting_screen(epd)
                 time.sleep(1)
 
-                result = subprocess.run(['sudo', 'reboot'], capture_output=True, timeout=5)
-                if result.returncode != 0:
-                    logger.error(f"Reboot failed: {result.stderr.decode()}")
+                # Flush pending writes, then hand off to reboot without waiting:
+                # the system goes down and the "Rebooting..." screen stays up
+                os.sync()
+                try:
+                    subprocess.Popen(['sudo', 'reboot'], close_fds=True,
+                                     stdin=subprocess.DEVNULL,
+                                     stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.DEVNULL)
+                except OSError as e:
+                    logger.error(f"Reboot failed: {e}")
             else:
                 # Cancel confirmed
                 logger.info("Reboot cancelled")
@@ -189,6 +198,9 @@ def draw_reboot_confirm(epd, gt_dev, gt_old, gt):
 
 if __name__ == '__main__':
     try:
+        # Warm the font cache while the display initializes
+        preload_fonts(['title', 'body', 'small'])
+
         epd = epd2in13_V3.EPD()
         epd.init(epd.FULL_UPDATE)
         epd.Clear(0xFF)
@@ -3,7 +3,11 @@ Shared Application Utilities
 Common functions used across all Pi Zero 2W display applications
 """
 
+import functools
+import itertools
+import json
 import os
+import re
 import sys
 import time
 import logging
@@ -17,30 +21,31 @@ from typing import Callable, Optional
 # PATH MANAGEMENT
 # ============================================================================
 
+# Repository root, resolved once at import
+_REPO_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
 def get_base_dir() -> str:
     """Get base directory for applications
 
-    Uses environment variable PIZERO_BASE_DIR if set, otherwise uses default
+    Uses environment variable PIZERO_BASE_DIR if set, otherwise uses default.
     """
     return os.environ.get('PIZERO_BASE_DIR', '/home/pizero2w/pizero_apps')
 
 
 def get_pic_dir() -> str:
     """Get directory for display pictures/icons"""
-    base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    return os.path.join(base, 'python/pic/2in13')
+    return os.path.join(_REPO_DIR, 'python/pic/2in13')
 
 
 def get_font_dir() -> str:
     """Get directory for fonts"""
-    base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    return os.path.join(base, 'python/pic')
+    return os.path.join(_REPO_DIR, 'python/pic')
 
 
 def get_lib_dir() -> str:
     """Get directory for Python libraries"""
-    base = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    return os.path.join(base, 'python/lib')
+    return os.path.join(_REPO_DIR, 'python/lib')
 
 
 def setup_paths():
@@ -65,19 +70,34 @@ def setup_logging(app_name: str, log_to_file: bool = True, level=logging.INFO) -
     Returns:
         Configured logger instance
     """
-    handlers = [logging.StreamHandler()]
-
-    if log_to_file:
-        log_path = f'/tmp/{app_name}.log'
-        handlers.append(logging.FileHandler(log_path))
-
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=handlers
-    )
-
     logger = logging.getLogger(app_name)
+
+    # Handlers are attached once per app logger, so relaunching an app in the
+    # same process does not open another log file
+    if not logger.handlers:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.StreamHandler()]
+
+        if log_to_file:
+            log_path = f'/tmp/{app_name}.log'
+            handlers.append(logging.FileHandler(log_path))
+
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
+        # Module loggers (getLogger(__name__)) and bare logging.* calls go
+        # through root; configure it once with the same handlers, as
+        # basicConfig did. The app logger doesn't propagate, so nothing
+        # is written twice.
+        root = logging.getLogger()
+        if not root.handlers:
+            for handler in handlers:
+                root.addHandler(handler)
+            root.setLevel(level)
+
+    logger.setLevel(level)
+    logger.propagate = False
     return logger
 
 
@@ -137,22 +157,31 @@ def install_signal_handlers(cleanup_callback: Callable):
 class TouchThread:
     """Reusable touch detection thread
 
-    Handles GPIO/touch interrupt polling in background thread
+    Handles GPIO/touch interrupt polling in background thread. When the
+    driver provides wait_event(), the thread blocks on the interrupt edge
+    while idle instead of polling every interval.
     """
 
-    def __init__(self, gt, gt_dev, interval: float = 0.01):
+    def __init__(self, gt, gt_dev, interval: float = 0.01, idle_timeout: float = 0.5,
+                 debounce: float = 0.02):
         """Initialize touch thread
 
         Args:
             gt: Touch driver interface
             gt_dev: Touch device state object
-            interval: Polling interval in seconds (default: 10ms)
+            interval: Polling interval in seconds while touched (default: 10ms)
+            idle_timeout: Max time to block on the interrupt edge while idle (default: 0.5s)
+            debounce: Minimum time between accepted Touch changes (default: 20ms)
         """
         self.gt = gt
         self.gt_dev = gt_dev
         self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.debounce_ns = int(debounce * 1e9)
+        self._last_edge_ns = 0
         self.running = False
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Cuts the loop's sleeps short on stop()
 
     def start(self):
         """Start touch detection thread"""
@@ -160,6 +189,7 @@ class TouchThread:
             return
 
         self.running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._irq_loop, daemon=True)
         self._thread.start()
         logging.debug("Touch detection thread started")
@@ -167,22 +197,41 @@ class TouchThread:
     def stop(self):
         """Stop touch detection thread"""
         self.running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=1.0)
         logging.debug("Touch detection thread stopped")
 
     def _irq_loop(self):
-        """Internal IRQ polling loop"""
+        """Internal IRQ loop"""
+        wait_event = getattr(self.gt, 'wait_event', None)
+
         while self.running:
+            bouncing = False
             try:
-                if self.gt.digital_read(self.gt.INT) == 0:
-                    self.gt_dev.Touch = 1
-                else:
-                    self.gt_dev.Touch = 0
+                touched = 1 if self.gt.digital_read(self.gt.INT) == 0 else 0
+                if touched != self.gt_dev.Touch:
+                    # Drop changes that follow the last accepted one too closely
+                    now = time.monotonic_ns()
+                    if now - self._last_edge_ns >= self.debounce_ns:
+                        self._last_edge_ns = now
+                        self.gt_dev.Touch = touched
+                    else:
+                        bouncing = True
             except Exception as e:
                 logging.error(f"Touch detection error: {e}")
 
-            time.sleep(self.interval)
+            if wait_event is not None and not self.gt_dev.Touch and not bouncing:
+                # Idle: sleep in the kernel until the interrupt line fires
+                try:
+                    wait_event(self.idle_timeout)
+                except Exception as e:
+                    logging.error(f"Touch wait error: {e}")
+                    self._stop_event.wait(self.interval)
+            else:
+                # Touch in progress, bouncing, or no edge wait: poll so the
+                # settled level is seen
+                self._stop_event.wait(self.interval)
 
 
 @contextmanager
@@ -206,7 +255,12 @@ def touch_thread_context(gt, gt_dev, interval: float = 0.01):
 # FONT CACHING
 # ============================================================================
 
-_font_cache = {}
+@functools.lru_cache(maxsize=64)
+def _load_font(name: str, size: int):
+    from PIL import ImageFont
+
+    font_path = os.path.join(get_font_dir(), f"{name}.ttf")
+    return ImageFont.truetype(font_path, size)
 
 
 def get_font(name: str, size: int):
@@ -219,26 +273,44 @@ def get_font(name: str, size: int):
     Returns:
         PIL ImageFont object
     """
-    from PIL import ImageFont
-
-    key = (name, size)
-    if key not in _font_cache:
-        font_path = os.path.join(get_font_dir(), f"{name}.ttf")
-        _font_cache[key] = ImageFont.truetype(font_path, size)
-
-    return _font_cache[key]
+    return _load_font(name, size)
 
 
 def clear_font_cache():
     """Clear font cache (useful for testing/debugging)"""
-    global _font_cache
-    _font_cache.clear()
+    _load_font.cache_clear()
 
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
+# Optional: orjson parses in C and accepts bytes directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Type probes for environment override values
+_BOOL_TRUE = frozenset(('true', 'yes', '1'))
+_BOOL_FALSE = frozenset(('false', 'no', '0'))
+# Anything int() or float() accepts starts like this; other strings skip
+# both conversions instead of raising and catching ValueError twice
+_NUMERIC_START_RE = re.compile(r'\s*[+-]?(?:[\d.]|inf|nan)', re.IGNORECASE)
+
+
+def _resolve_path(config: dict, path: str):
+    """Walk a config dict along a dotted path, or return None if it breaks off"""
+    value = config
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
 class ConfigLoader:
     """Thread-safe configuration loader with environment variable support
 
@@ -251,6 +323,11 @@ class ConfigLoader:
     _instance = None
     _config = None
     _environment = None
+    _path_memo = (None, {})  # (config, dotted path -> resolved value), swapped as one pair
+    _config_path = None  # Resolved config file path, reset with the environment
+    _lock = threading.RLock()  # Reentrant: load() resolves the path via get_environment()
+    _validator = None  # Reused ConfigValidator instance
+    _validated_config = None  # Config object that last passed validation
 
     def __new__(cls):
         if cls._instance is None:
@@ -265,7 +342,9 @@ class ConfigLoader:
             Environment name: 'development', 'production', or 'test'
         """
         if cls._environment is None:
-            cls._environment = os.environ.get('PIZERO_ENV', 'development')
+            with cls._lock:
+                if cls._environment is None:
+                    cls._environment = os.environ.get('PIZERO_ENV', 'development')
         return cls._environment
 
     @classmethod
@@ -278,8 +357,10 @@ class ConfigLoader:
         if environment not in ['development', 'production', 'test']:
             raise ValueError(f"Invalid environment: {environment}")
 
-        cls._environment = environment
-        cls._config = None  # Force reload
+        with cls._lock:
+            cls._environment = environment
+            cls._config = None  # Force reload
+            cls._config_path = None
 
     @classmethod
     def get_config_path(cls) -> str:
@@ -298,6 +379,9 @@ class ConfigLoader:
         if 'PIZERO_CONFIG' in os.environ:
             return os.environ['PIZERO_CONFIG']
 
+        if cls._config_path is not None:
+            return cls._config_path
+
         environment = cls.get_environment()
         config_dir = os.environ.get(
             'PIZERO_CONFIG_DIR',
@@ -307,15 +391,17 @@ class ConfigLoader:
         # Try environment-specific config in config/ directory
         env_config = os.path.join(config_dir, f'{environment}.json')
         if os.path.exists(env_config):
+            cls._config_path = env_config
             return env_config
 
         # Fall back to legacy config.json in base directory
         legacy_config = os.path.join(get_base_dir(), 'config.json')
         if os.path.exists(legacy_config):
             logging.debug(f"Using legacy config: {legacy_config}")
+            cls._config_path = legacy_config
             return legacy_config
 
-        # Final fallback
+        # Final fallback (not cached, so a config created later is found)
         return env_config
 
     @classmethod
@@ -328,60 +414,68 @@ class ConfigLoader:
         Returns:
             Configuration dictionary
         """
-        if cls._config is None or force_reload:
-            import json
+        config = cls._config
+        if config is not None and not force_reload:
+            return config
+
+        with cls._lock:
+            if cls._config is not None and not force_reload:
+                return cls._config
 
+            if force_reload:
+                cls._config_path = None
             config_path = cls.get_config_path()
 
+            # Build the new config locally so lock-free readers never see
+            # it before the environment overrides have been applied
             try:
-                with open(config_path, 'r') as f:
-                    cls._config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    config = _json_loads(f.read())
                 logging.debug(f"Loaded config from: {config_path}")
 
                 # Merge with environment-specific overrides
-                cls._apply_env_overrides()
+                cls._apply_env_overrides(config)
 
             except FileNotFoundError:
                 logging.error(f"Config file not found: {config_path}")
-                cls._config = {}
+                config = {}
             except json.JSONDecodeError as e:
                 logging.error(f"Invalid JSON in config file: {e}")
-                cls._config = {}
+                config = {}
 
-        return cls._config
+            cls._config = config
+            return config
 
     @classmethod
-    def _apply_env_overrides(cls) -> None:
-        """Apply environment variable overrides to loaded config
+    def _apply_env_overrides(cls, config: dict) -> None:
+        """Apply environment variable overrides to a freshly loaded config
 
         Supports dotted notation: PIZERO_CONFIG_SECTION_KEY=value
         Example: PIZERO_CONFIG_MEDICINE_UPDATE_INTERVAL=120
         """
-        if not cls._config:
+        if not config:
             return
 
-        for key, value in os.environ.items():
-            if not key.startswith('PIZERO_CONFIG_'):
-                continue
-
-            # Remove prefix and convert to lowercase
-            config_key = key[14:].lower()
+        # Strip the prefix and lowercase once while filtering
+        prefix = 'PIZERO_CONFIG_'
+        overrides = [(key, key[len(prefix):].lower(), value)
+                     for key, value in os.environ.items() if key.startswith(prefix)]
 
+        for key, config_key, value in overrides:
             # Parse dotted notation: section_key or section_subkey
             parts = config_key.split('_', 1)
             if len(parts) != 2:
                 continue
 
             section, key_path = parts
-            section = section.lower()
 
-            if section not in cls._config:
+            if section not in config:
                 continue
 
             # Try to convert value to appropriate type
             try:
                 converted_value = cls._convert_env_value(value)
-                cls._config[section][key_path] = converted_value
+                config[section][key_path] = converted_value
                 logging.debug(
                     f"Applied override: {section}.{key_path} = {converted_value}"
                 )
@@ -389,6 +483,7 @@ class ConfigLoader:
                 logging.warning(f"Failed to apply override {key}={value}: {e}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=128)
     def _convert_env_value(value: str):
         """Convert environment variable string to appropriate type
 
@@ -398,23 +493,22 @@ class ConfigLoader:
         Returns:
             Converted value (int, float, bool, or str)
         """
-        # Try boolean
-        if value.lower() in ('true', 'yes', '1'):
+        lowered = value.lower()
+        if lowered in _BOOL_TRUE:
             return True
-        if value.lower() in ('false', 'no', '0'):
+        if lowered in _BOOL_FALSE:
             return False
 
-        # Try integer
-        try:
-            return int(value)
-        except ValueError:
-            pass
+        if _NUMERIC_START_RE.match(value):
+            try:
+                return int(value)
+            except ValueError:
+                pass
 
-        # Try float
-        try:
-            return float(value)
-        except ValueError:
-            pass
+            try:
+                return float(value)
+            except ValueError:
+                pass
 
         # Return as string
         return value
@@ -463,14 +557,19 @@ class ConfigLoader:
             ConfigLoader.get_value_nested('medicine.update_interval', 60)
         """
         config = cls.load()
-        parts = path.split('.')
 
-        value = config
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return default
+        # Resolved paths are memoized per config object; a reload publishes
+        # a new dict, so values from the old one can never be served for it
+        memo_config, memo = cls._path_memo
+        if memo_config is not config:
+            memo = {}
+            cls._path_memo = (config, memo)
+
+        try:
+            value = memo[path]
+        except KeyError:
+            value = _resolve_path(config, path)
+            memo[path] = value
 
         return value if value is not None else default
 
@@ -485,17 +584,23 @@ class ConfigLoader:
             ValueError: If configuration is invalid
         """
         try:
-            from shared.config_validator import ConfigValidator
             config = cls.load()
 
-            # Get config path
-            config_path = cls.get_config_path()
+            # load() publishes a new dict on every reload, so identity
+            # tells us whether this config has already been checked
+            if config is cls._validated_config:
+                return True
 
-            # Create validator and validate
-            validator = ConfigValidator(config_path)
+            if cls._validator is None:
+                from shared.config_validator import ConfigValidator
+                cls._validator = ConfigValidator()
+
+            validator = cls._validator
+            validator.config_path = cls.get_config_path()
             validator.config = config
             validator.validate_config()
 
+            cls._validated_config = config
             return True
         except ImportError:
             logging.warning("config_validator module not available, skipping validation")
@@ -555,7 +660,9 @@ class PeriodicTimer:
             interval: Time interval in seconds
         """
         self.interval = interval
-        self.last_time = time.time()
+        # Monotonic integer clock: immune to NTP/wall-clock jumps
+        self.interval_ns = int(interval * 1e9)
+        self.last_ns = time.monotonic_ns()
 
     def is_ready(self) -> bool:
         """Check if interval has elapsed
@@ -563,15 +670,15 @@ class PeriodicTimer:
         Returns:
             True if ready, False otherwise
         """
-        current_time = time.time()
-        if current_time - self.last_time >= self.interval:
-            self.last_time = current_time
+        now = time.monotonic_ns()
+        if now - self.last_ns >= self.interval_ns:
+            self.last_ns = now
             return True
         return False
 
     def reset(self):
         """Reset timer to current time"""
-        self.last_time = time.time()
+        self.last_ns = time.monotonic_ns()
 
 
 # ============================================================================
@@ -596,28 +703,123 @@ def safe_execute(func: Callable, error_message: str = "Operation failed", defaul
         return default
 
 
+def safe_call(func: Callable, *args, error_message: str = "Operation failed",
+              default=None, **kwargs):
+    """Call function with arguments and error handling
+
+    Like safe_execute, but passes arguments through so callers don't need
+    a lambda or closure.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        error_message: Message to log on error
+        default: Default value to return on error
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Function result or default on error
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logging.error(f"{error_message}: {e}")
+        return default
+
+
+def safe(error_message: str = "Operation failed", default=None):
+    """Decorator form of safe_execute, applied once at definition time
+
+    Usage:
+        @safe("Flight search error", default=(None, None, None))
+        def get_flight_search():
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logging.error(f"{error_message}: {e}")
+                return default
+        return wrapper
+    return decorator
+
+
 # ============================================================================
 # FILE OPERATIONS
 # ============================================================================
 
+# Per-process sequence for atomic_write temp names
+_temp_counter = itertools.count()
+
+# Directory -> st_dev, and targets already checked against it
+_dir_dev_cache = {}
+_checked_targets = set()
+
+
+def _check_same_device(filepath: str, dir_path: str) -> None:
+    """Warn once per target if it sits on a different device than its directory
+
+    A bind-mounted target can't be atomically replaced by a rename from
+    its directory; surface that instead of failing later with EXDEV.
+    """
+    if filepath in _checked_targets:
+        return
+
+    dev = _dir_dev_cache.get(dir_path)
+    if dev is None:
+        dev = os.stat(dir_path).st_dev
+        _dir_dev_cache[dir_path] = dev
+
+    try:
+        if os.stat(filepath).st_dev != dev:
+            logging.warning(
+                "atomic_write target is on a different device than its directory: %s",
+                filepath,
+            )
+    except FileNotFoundError:
+        # Nothing to compare yet; check again once it exists
+        return
+
+    _checked_targets.add(filepath)
+
+
 @contextmanager
-def atomic_write(filepath: str):
+def atomic_write(filepath: str, fsync: bool = False):
     """Context manager for atomic file writes
 
-    Writes to temp file then atomically renames to target
+    Writes to temp file then atomically renames to target.
+    The temp name is unique per process and call; only a stale file left by
+    an earlier process with the same PID forces another attempt.
+    The temp file is created owner-only (0600), like tempfile.mkstemp.
+
+    Args:
+        filepath: Target file path
+        fsync: If True, flush data to disk before the rename
 
     Usage:
         with atomic_write('/path/to/file.json') as f:
             json.dump(data, f)
     """
-    import tempfile
+    _check_same_device(filepath, os.path.dirname(filepath) or '.')
 
-    dir_path = os.path.dirname(filepath)
-    fd, temp_path = tempfile.mkstemp(dir=dir_path, prefix='.tmp_')
+    # O_EXCL: never reuse or follow an existing (possibly planted) path
+    while True:
+        temp_path = f"{filepath}.tmp.{os.getpid()}.{next(_temp_counter)}"
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            break
+        except FileExistsError:
+            continue
 
     try:
         with os.fdopen(fd, 'w') as f:
             yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
         # Atomic rename
         os.replace(temp_path, filepath)
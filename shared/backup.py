@@ -5,12 +5,43 @@ Manages daily backups of critical data files
 
 import os
 import shutil
-import glob
+import array
+import bisect
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Backup name format: filename.YYYYMMDD_HHMMSS.backup
+BACKUP_SUFFIX = '.backup'
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+
+def _fast_copy(src: str, dst: str):
+    """Copy file contents and metadata, in-kernel where possible
+
+    Uses os.copy_file_range (Linux 4.5+), which lets the filesystem copy
+    without a userspace round-trip; falls back to shutil.copyfileobj.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Some filesystems (procfs, some FUSE/NFS) report 0
+                    # instead of failing; don't leave a truncated copy
+                    raise OSError("copy_file_range stopped early")
+                remaining -= copied
+        except (OSError, AttributeError):
+            # Unsupported here: restart the copy through userspace
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+
+    shutil.copystat(src, dst)
+
 
 class BackupManager:
     """Manages automated backups with rotation"""
@@ -30,6 +61,40 @@ class BackupManager:
         self.backup_dir = backup_dir
         os.makedirs(backup_dir, exist_ok=True)
 
+        # Per-file index, oldest first: filename -> (epochs, paths).
+        # Rebuilt from the directory by every reader, since cron, restores
+        # and other managers add and remove backups behind our back.
+        self._index = {}
+
+    def _build_index(self):
+        """Re-scan the directory, parsing every backup name once"""
+        self._index = {}
+        with os.scandir(self.backup_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(BACKUP_SUFFIX):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                filename, _, timestamp_str = name[:-len(BACKUP_SUFFIX)].rpartition('.')
+                try:
+                    epoch = int(datetime.strptime(timestamp_str, TIMESTAMP_FORMAT).timestamp())
+                except ValueError:
+                    logger.warning(f"Could not parse backup filename: {entry.path}")
+                    continue
+
+                self._index_add(filename, epoch, entry.path)
+
+    def _index_add(self, filename: str, epoch: int, path: str):
+        """Insert a backup into the sorted per-file index"""
+        epochs, paths = self._index.setdefault(filename, (array.array('q'), []))
+        # A same-second backup overwrites its file, so names (and thus
+        # epochs per filename) are unique and need no dedupe here
+        i = bisect.bisect_left(epochs, epoch)
+        epochs.insert(i, epoch)
+        paths.insert(i, path)
+
     def backup_file(self, filepath: str, keep_days: int = 7) -> str:
         """Create timestamped backup of file
 
@@ -47,13 +112,14 @@ class BackupManager:
             raise FileNotFoundError(f"File not found: {filepath}")
 
         # Create backup filename with timestamp
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now().replace(microsecond=0)
+        timestamp = now.strftime(TIMESTAMP_FORMAT)
         filename = os.path.basename(filepath)
-        backup_name = f"{filename}.{timestamp}.backup"
+        backup_name = f"{filename}.{timestamp}{BACKUP_SUFFIX}"
         backup_path = os.path.join(self.backup_dir, backup_name)
 
         # Copy file
-        shutil.copy2(filepath, backup_path)
+        _fast_copy(filepath, backup_path)
         logger.info(f"Backed up: {filepath} → {backup_path}")
 
         # Clean up old backups
@@ -68,26 +134,28 @@ class BackupManager:
             filename: Base filename to clean up
             keep_days: Number of days to keep
         """
-        cutoff_date = datetime.now() - timedelta(days=keep_days)
+        self._build_index()
+        entry = self._index.get(filename)
+        if entry is None:
+            return
+
+        epochs, paths = entry
+        cutoff = int((datetime.now() - timedelta(days=keep_days)).timestamp())
 
-        # Find all backups for this file
-        pattern = os.path.join(self.backup_dir, f"{filename}.*.backup")
-        backups = glob.glob(pattern)
+        # Index is sorted oldest first, so expired backups are a prefix
+        expired = bisect.bisect_left(epochs, cutoff)
+        if not expired:
+            return
 
-        for backup_path in backups:
-            # Extract timestamp from filename
+        for path in paths[:expired]:
             try:
-                # Format: filename.YYYYMMDD_HHMMSS.backup
-                parts = os.path.basename(backup_path).split('.')
-                if len(parts) >= 3:
-                    timestamp_str = parts[-2]
-                    backup_date = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-
-                    if backup_date < cutoff_date:
-                        os.remove(backup_path)
-                        logger.info(f"Removed old backup: {backup_path}")
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Could not parse backup filename: {backup_path}: {e}")
+                os.remove(path)
+                logger.info(f"Removed old backup: {path}")
+            except FileNotFoundError:
+                pass
+
+        del epochs[:expired]
+        del paths[:expired]
 
     def backup_database(self, db_path: str = None, keep_days: int = 7) -> str:
         """Backup SQLite database file
@@ -136,11 +204,11 @@ class BackupManager:
         if os.path.exists(target_path):
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             pre_restore_backup = f"{target_path}.pre_restore_{timestamp}"
-            shutil.copy2(target_path, pre_restore_backup)
+            _fast_copy(target_path, pre_restore_backup)
             logger.info(f"Created pre-restore backup: {pre_restore_backup}")
 
         # Restore from backup
-        shutil.copy2(backup_path, target_path)
+        _fast_copy(backup_path, target_path)
         logger.info(f"Restored: {backup_path} → {target_path}")
 
     def list_backups(self, filename: str = None) -> list:
@@ -152,23 +220,17 @@ class BackupManager:
         Returns:
             List of tuples: (backup_path, timestamp)
         """
+        self._build_index()
         if filename:
-            pattern = os.path.join(self.backup_dir, f"{filename}.*.backup")
+            entries = [self._index[filename]] if filename in self._index else []
         else:
-            pattern = os.path.join(self.backup_dir, "*.backup")
-
-        backups = []
+            entries = self._index.values()
 
-        for backup_path in glob.glob(pattern):
-            try:
-                # Extract timestamp
-                parts = os.path.basename(backup_path).split('.')
-                if len(parts) >= 3:
-                    timestamp_str = parts[-2]
-                    backup_date = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                    backups.append((backup_path, backup_date))
-            except (ValueError, IndexError):
-                continue
+        backups = [
+            (path, datetime.fromtimestamp(epoch))
+            for epochs, paths in entries
+            for epoch, path in zip(epochs, paths)
+        ]
 
         # Sort by timestamp (newest first)
         backups.sort(key=lambda x: x[1], reverse=True)
@@ -183,11 +245,11 @@ class BackupManager:
         """
         total_size = 0
 
-        for root, dirs, files in os.walk(self.backup_dir):
-            for filename in files:
-                if filename.endswith('.backup'):
-                    filepath = os.path.join(root, filename)
-                    total_size += os.path.getsize(filepath)
+        # Backups live in a flat directory; one scandir pass is enough
+        with os.scandir(self.backup_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.backup') and entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
 
         return total_size
 
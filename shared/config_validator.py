@@ -3,15 +3,30 @@ Configuration Validation Schemas
 Pydantic and custom validators for application configuration
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Collection, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
+import copy
 import logging
 import json
+import re
 from pathlib import Path
 
 
+# Optional: orjson parses in native code and accepts bytes directly
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Accepts what int() accepted on each side of the colon (surrounding
+# whitespace, a sign, extra leading zeros, digit underscores); ranges are
+# checked separately for clearer messages
+_TIME_PART = r'\s*([+-]?\d+(?:_\d+)*)\s*'
+_TIME_RE = re.compile(_TIME_PART + ':' + _TIME_PART + r'\Z')
+
 
 # ============================================================================
 # VALIDATION EXCEPTIONS
@@ -51,22 +66,23 @@ class TimeValidator:
         if not isinstance(value, str):
             raise ConfigValidationError(f"{field_name} must be a string, got {type(value)}")
 
-        try:
-            parts = value.split(':')
-            if len(parts) != 2:
-                raise ValueError("Invalid format")
-
-            hours = int(parts[0])
-            minutes = int(parts[1])
+        match = _TIME_RE.match(value)
+        if match is None:
+            error = "Invalid format"
+        else:
+            hours = int(match[1])
+            minutes = int(match[2])
 
             if not (0 <= hours <= 23):
-                raise ValueError("Hours must be 00-23")
-            if not (0 <= minutes <= 59):
-                raise ValueError("Minutes must be 00-59")
+                error = "Hours must be 00-23"
+            elif not (0 <= minutes <= 59):
+                error = "Minutes must be 00-59"
+            else:
+                error = None
 
-        except (ValueError, AttributeError) as e:
+        if error:
             raise ConfigValidationError(
-                f"{field_name} must be in HH:MM format, got '{value}': {e}"
+                f"{field_name} must be in HH:MM format, got '{value}': {error}"
             )
 
         return f"{hours:02d}:{minutes:02d}"
@@ -166,18 +182,42 @@ class RangeValidator:
         return value
 
 
+class StringValidator:
+    """Validator for string configuration values"""
+
+    @staticmethod
+    def validate_nonempty(value: str, field_name: str = "value") -> str:
+        """Validate value is a non-empty string
+
+        Args:
+            value: Value to validate
+            field_name: Name of field for error messages
+
+        Returns:
+            Validated string
+
+        Raises:
+            ConfigValidationError: If value is not a string or is empty
+        """
+        # Exact type check: JSON only ever produces plain str
+        if type(value) is not str or not value:
+            raise ConfigValidationError(f"{field_name} must be a non-empty string")
+
+        return value
+
+
 class ChoiceValidator:
     """Validator for choice configuration values"""
 
     @staticmethod
     def validate_choice(value: str, field_name: str = "value",
-                        choices: List[str] = None) -> str:
+                        choices: Collection = None) -> str:
         """Validate value is in allowed choices
 
         Args:
             value: Value to validate
             field_name: Name of field for error messages
-            choices: List of allowed values
+            choices: Allowed values; pass a frozenset for O(1) membership
 
         Returns:
             Validated value
@@ -189,8 +229,9 @@ class ChoiceValidator:
             choices = []
 
         if value not in choices:
+            allowed = sorted(choices, key=lambda c: (str(type(c)), c))
             raise ConfigValidationError(
-                f"{field_name} must be one of {choices}, got '{value}'"
+                f"{field_name} must be one of {allowed}, got '{value}'"
             )
 
         return value
@@ -200,7 +241,7 @@ class ChoiceValidator:
 # SECTION VALIDATORS
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class WeatherConfig:
     """Weather section configuration"""
     location: str
@@ -210,20 +251,22 @@ class WeatherConfig:
     show_forecast: bool = True
     api_timeout: int = 10
 
+    _UNITS = frozenset({"metric", "imperial"})
+    _DISPLAY_FORMATS = frozenset({"compact", "detailed"})
+
     def validate(self) -> None:
         """Validate weather configuration"""
-        if not isinstance(self.location, str) or not self.location:
-            raise ConfigValidationError("location must be a non-empty string")
+        StringValidator.validate_nonempty(self.location, "location")
 
-        ChoiceValidator.validate_choice(self.units, "units", ["metric", "imperial"])
+        ChoiceValidator.validate_choice(self.units, "units", WeatherConfig._UNITS)
         RangeValidator.validate_range(self.update_interval, "update_interval", 10, 3600)
         ChoiceValidator.validate_choice(
-            self.display_format, "display_format", ["compact", "detailed"]
+            self.display_format, "display_format", WeatherConfig._DISPLAY_FORMATS
         )
         RangeValidator.validate_range(self.api_timeout, "api_timeout", 1, 60)
 
 
-@dataclass
+@dataclass(frozen=True)
 class MBTAConfig:
     """MBTA section configuration"""
     home_station_id: str
@@ -241,26 +284,24 @@ class MBTAConfig:
 
     def validate(self) -> None:
         """Validate MBTA configuration"""
-        required_strings = [
-            self.home_station_id, self.home_station_name,
-            self.work_station_id, self.work_station_name
-        ]
-        for s in required_strings:
-            if not isinstance(s, str) or not s:
-                raise ConfigValidationError("Station IDs and names must be non-empty strings")
+        StringValidator.validate_nonempty(self.home_station_id, "home_station_id")
+        StringValidator.validate_nonempty(self.home_station_name, "home_station_name")
+        StringValidator.validate_nonempty(self.work_station_id, "work_station_id")
+        StringValidator.validate_nonempty(self.work_station_name, "work_station_name")
 
+        # Cheap numeric checks first, then the time string parsing
         RangeValidator.validate_range(self.update_interval, "update_interval", 10, 600)
+        RangeValidator.validate_range(self.max_predictions, "max_predictions", 1, 10)
+        RangeValidator.validate_range(self.api_timeout, "api_timeout", 1, 60)
         TimeValidator.validate_time_format(self.morning_start, "morning_start")
         TimeValidator.validate_time_format(self.morning_end, "morning_end")
         TimeValidator.validate_time_format(self.evening_start, "evening_start")
         TimeValidator.validate_time_format(self.evening_end, "evening_end")
         TimeValidator.validate_time_range(self.morning_start, self.morning_end)
         TimeValidator.validate_time_range(self.evening_start, self.evening_end)
-        RangeValidator.validate_range(self.max_predictions, "max_predictions", 1, 10)
-        RangeValidator.validate_range(self.api_timeout, "api_timeout", 1, 60)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DisneyConfig:
     """Disney section configuration"""
     park_id: int
@@ -272,16 +313,17 @@ class DisneyConfig:
     favorite_rides: List[str] = field(default_factory=list)
     api_timeout: int = 5
 
+    _SORT_KEYS = frozenset({"wait_time", "name"})
+
     def validate(self) -> None:
         """Validate Disney configuration"""
         if not isinstance(self.park_id, int) or self.park_id <= 0:
             raise ConfigValidationError("park_id must be a positive integer")
-        if not isinstance(self.park_name, str) or not self.park_name:
-            raise ConfigValidationError("park_name must be a non-empty string")
+        StringValidator.validate_nonempty(self.park_name, "park_name")
 
         RangeValidator.validate_range(self.update_interval, "update_interval", 5, 600)
         RangeValidator.validate_range(self.data_refresh_rides, "data_refresh_rides", 5, 300)
-        ChoiceValidator.validate_choice(self.sort_by, "sort_by", ["wait_time", "name"])
+        ChoiceValidator.validate_choice(self.sort_by, "sort_by", DisneyConfig._SORT_KEYS)
 
         if not isinstance(self.favorite_rides, list):
             raise ConfigValidationError("favorite_rides must be a list")
@@ -289,7 +331,7 @@ class DisneyConfig:
         RangeValidator.validate_range(self.api_timeout, "api_timeout", 1, 60)
 
 
-@dataclass
+@dataclass(frozen=True)
 class FlightsConfig:
     """Flights section configuration"""
     latitude: float
@@ -314,7 +356,7 @@ class FlightsConfig:
         RangeValidator.validate_range(self.api_timeout, "api_timeout", 1, 60)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PomodoroConfig:
     """Pomodoro section configuration"""
     work_duration: int = 1500
@@ -335,7 +377,7 @@ class PomodoroConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class MedicineConfig:
     """Medicine section configuration"""
     data_file: str
@@ -348,8 +390,7 @@ class MedicineConfig:
 
     def validate(self) -> None:
         """Validate medicine configuration"""
-        if not isinstance(self.data_file, str) or not self.data_file:
-            raise ConfigValidationError("data_file must be a non-empty string")
+        StringValidator.validate_nonempty(self.data_file, "data_file")
 
         RangeValidator.validate_range(self.update_interval, "update_interval", 5, 600)
         RangeValidator.validate_range(self.reminder_window, "reminder_window", 5, 120)
@@ -360,7 +401,7 @@ class MedicineConfig:
         RangeValidator.validate_range(self.backup_interval, "backup_interval", 30, 3600)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConfig:
     """System section configuration"""
     timezone: str = "America/New_York"
@@ -377,17 +418,15 @@ class SystemConfig:
 
     def validate(self) -> None:
         """Validate system configuration"""
-        if not isinstance(self.timezone, str) or not self.timezone:
-            raise ConfigValidationError("timezone must be a non-empty string")
+        StringValidator.validate_nonempty(self.timezone, "timezone")
 
         RangeValidator.validate_range(self.display_brightness, "display_brightness", 0, 100)
         RangeValidator.validate_range(self.sleep_timeout, "sleep_timeout", 30, 3600)
 
-        if not isinstance(self.base_dir, str) or not self.base_dir:
-            raise ConfigValidationError("base_dir must be a non-empty string")
+        StringValidator.validate_nonempty(self.base_dir, "base_dir")
 
 
-@dataclass
+@dataclass(frozen=True)
 class DisplayConfig:
     """Display section configuration"""
     rotation: int = 0
@@ -396,17 +435,36 @@ class DisplayConfig:
     partial_update_limit: int = 10
     debug_mode: bool = False
 
+    _ROTATIONS = frozenset({0, 90, 180, 270})
+    _REFRESH_MODES = frozenset({"auto", "full", "partial"})
+
     def validate(self) -> None:
         """Validate display configuration"""
-        ChoiceValidator.validate_choice(self.rotation, "rotation", [0, 90, 180, 270])
+        ChoiceValidator.validate_choice(self.rotation, "rotation", DisplayConfig._ROTATIONS)
         ChoiceValidator.validate_choice(
-            self.refresh_mode, "refresh_mode", ["auto", "full", "partial"]
+            self.refresh_mode, "refresh_mode", DisplayConfig._REFRESH_MODES
         )
         RangeValidator.validate_range(
             self.partial_update_limit, "partial_update_limit", 1, 100
         )
 
 
+# Sentinel for absent sections (an explicit null must still be reported)
+_MISSING = object()
+
+# Config section name -> dataclass that validates it
+_SECTION_CLASSES: Dict[str, type] = {
+    'weather': WeatherConfig,
+    'mbta': MBTAConfig,
+    'disney': DisneyConfig,
+    'flights': FlightsConfig,
+    'pomodoro': PomodoroConfig,
+    'medicine': MedicineConfig,
+    'system': SystemConfig,
+    'display': DisplayConfig,
+}
+
+
 # ============================================================================
 # COMPLETE CONFIG VALIDATOR
 # ============================================================================
@@ -423,6 +481,8 @@ class ConfigValidator:
         self.config_path = config_path
         self.config = None
         self.errors: List[str] = []
+        # Section name -> snapshot of the data that last passed validation
+        self._passed_sections: Dict[str, dict] = {}
 
     def load_config(self, config_path: str = None) -> Dict[str, Any]:
         """Load configuration from JSON file
@@ -441,10 +501,11 @@ class ConfigValidator:
             raise ConfigValidationError("Config path not specified")
 
         try:
-            with open(path, 'r') as f:
-                self.config = json.load(f)
-                logger.info(f"Loaded config from {path}")
-                return self.config
+            # Read raw bytes; both parsers decode UTF-8 themselves
+            with open(path, 'rb') as f:
+                self.config = _json_loads(f.read())
+            logger.info(f"Loaded config from {path}")
+            return self.config
         except FileNotFoundError:
             raise ConfigValidationError(f"Config file not found: {path}")
         except json.JSONDecodeError as e:
@@ -472,9 +533,13 @@ class ConfigValidator:
 
         return True
 
-    def validate_config(self) -> bool:
+    def validate_config(self, fail_fast: bool = False) -> bool:
         """Validate complete configuration
 
+        Args:
+            fail_fast: If True, stop at the first section with an error
+                instead of collecting errors from every section
+
         Returns:
             True if validation passes
 
@@ -491,26 +556,19 @@ class ConfigValidator:
             self.validate_environment()
 
             # Validate each section
-            sections = {
-                'weather': WeatherConfig,
-                'mbta': MBTAConfig,
-                'disney': DisneyConfig,
-                'flights': FlightsConfig,
-                'pomodoro': PomodoroConfig,
-                'medicine': MedicineConfig,
-                'system': SystemConfig,
-                'display': DisplayConfig,
-            }
-
-            for section_name, config_class in sections.items():
-                if section_name in self.config:
+            for section_name, config_class in _SECTION_CLASSES.items():
+                section_data = self.config.get(section_name, _MISSING)
+                if section_data is not _MISSING:
                     try:
-                        section_data = self.config[section_name]
-
                         # Create dataclass instance
                         if isinstance(section_data, dict):
+                            # Hot reloads usually leave most sections untouched;
+                            # an equal dict has already been validated
+                            if self._passed_sections.get(section_name) == section_data:
+                                continue
                             instance = config_class(**section_data)
                             instance.validate()
+                            self._passed_sections[section_name] = copy.deepcopy(section_data)
                         else:
                             raise ConfigValidationError(
                                 f"Section '{section_name}' must be a dictionary"
@@ -520,6 +578,9 @@ class ConfigValidator:
                     except ConfigValidationError as e:
                         self.errors.append(f"Section '{section_name}': {e}")
 
+                    if fail_fast and self.errors:
+                        break
+
             if self.errors:
                 raise ConfigValidationError(
                     f"Configuration validation failed:\n" +
@@ -8,21 +8,80 @@ Detects connected hardware components including:
 Provides auto-detection and configuration recommendations.
 """
 
+import errno
+import fcntl
+import functools
 import logging
 import os
+import sys
 from typing import Dict, Optional, Tuple
 
+# Optional: libgpiod bindings (python3-libgpiod) query line info by ioctl
+try:
+    import gpiod
+except ImportError:
+    gpiod = None
+
 logger = logging.getLogger(__name__)
 
+# I2C bus (Pi Zero 2W exposes the header pins on bus 1)
+I2C_BUS = 1
+_I2C_DEV = f"/dev/i2c-{I2C_BUS}"
+_I2C_SLAVE = 0x0703  # ioctl request from <linux/i2c-dev.h>
+
+# Dev machines and CI have no I2C bus; checked once so probes short-circuit
+_I2C_BUS_AVAILABLE = os.path.exists(_I2C_DEV)
+
 # Hardware I2C addresses
 GT1151_I2C_ADDRESS = 0x5D  # GT1151 touchscreen controller
 PISUGAR_I2C_ADDRESSES = [0x57, 0x32]  # PiSugar 2/3 battery module addresses
 
+# GPIO character device for the header pins
+GPIO_CHIP = "/dev/gpiochip0"
+
 # GPIO pins
 GT1151_INT_PIN = 27  # GT1151 interrupt pin
 PISUGAR_BUTTON_PIN = 3  # PiSugar button (also can be used as generic button)
 
 
+@functools.lru_cache(maxsize=None)
+def _probe_i2c_address(address: int) -> bool:
+    """
+    Probe one I2C address directly through /dev/i2c-N.
+
+    Selects the address with the I2C_SLAVE ioctl and attempts a one-byte
+    read, which is what i2cdetect does for these address ranges. Results
+    are cached for the life of the process since devices don't come and
+    go at runtime.
+
+    Args:
+        address: I2C address to probe (e.g., 0x5D)
+
+    Returns:
+        True if a device acknowledged or a kernel driver has claimed the
+        address (i2cdetect's "UU"), False otherwise
+    """
+    if not _I2C_BUS_AVAILABLE:
+        return False
+
+    try:
+        fd = os.open(_I2C_DEV, os.O_RDWR)
+    except OSError as e:
+        logger.warning("Cannot open I2C bus %d: %s", I2C_BUS, e)
+        return False
+
+    try:
+        fcntl.ioctl(fd, _I2C_SLAVE, address)
+        os.read(fd, 1)
+        return True
+    except OSError as e:
+        # EBUSY: a kernel driver (goodix on 0x5D, an RTC on 0x32) owns the
+        # address, so the device is there; anything else is a NACK
+        return e.errno == errno.EBUSY
+    finally:
+        os.close(fd)
+
+
 def _check_i2c_device(address: int) -> bool:
     """
     Check if an I2C device exists at the given address.
@@ -33,39 +92,83 @@ def _check_i2c_device(address: int) -> bool:
     Returns:
         True if device detected, False otherwise
     """
+    if _probe_i2c_address(address):
+        logger.debug("I2C device detected at 0x%02x", address)
+        return True
+
+    logger.debug("No I2C device at 0x%02x", address)
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def _gpio_chip():
+    """Open the GPIO character device once, or None if libgpiod is unavailable"""
+    if gpiod is None:
+        return None
     try:
-        # Try to detect I2C device using i2cdetect command
-        # Format: i2cdetect -y 1 (for Pi Zero 2W)
-        import subprocess
-        result = subprocess.run(
-            ['i2cdetect', '-y', '1'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-
-        # Convert address to hex string format used by i2cdetect
-        hex_addr = f"{address:02x}"
-
-        # Check if address appears in output
-        if hex_addr in result.stdout.lower():
-            logger.debug(f"I2C device detected at 0x{hex_addr}")
-            return True
-
-        logger.debug(f"No I2C device at 0x{hex_addr}")
-        return False
+        return gpiod.Chip(GPIO_CHIP)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Cannot open %s: %s", GPIO_CHIP, e)
+        return None
 
-    except FileNotFoundError:
-        logger.warning("i2cdetect command not found. Install i2c-tools package.")
-        return False
-    except subprocess.TimeoutExpired:
-        logger.warning(f"I2C detection timeout for address 0x{address:02x}")
-        return False
-    except Exception as e:
-        logger.warning(f"Error checking I2C device at 0x{address:02x}: {e}")
-        return False
 
+def _gpiod_line_state(pin: int) -> Optional[str]:
+    """
+    Describe a GPIO line via libgpiod line info.
+
+    Supports both the v1 (Chip.get_line) and v2 (Chip.get_line_info) APIs.
 
+    Args:
+        pin: GPIO pin number (BCM numbering)
+
+    Returns:
+        State string, or None if libgpiod can't answer (caller falls back to sysfs)
+    """
+    chip = _gpio_chip()
+    if chip is None:
+        return None
+
+    try:
+        if hasattr(chip, 'get_line_info'):
+            info = chip.get_line_info(pin)
+            used, consumer = info.used, info.consumer
+            output = info.direction == gpiod.line.Direction.OUTPUT
+        else:
+            line = chip.get_line(pin)
+            used, consumer = line.is_used(), line.consumer()
+            output = line.direction() == gpiod.Line.DIRECTION_OUTPUT
+    except (OSError, ValueError, AttributeError) as e:
+        logger.debug("libgpiod line info failed for GPIO %d: %s", pin, e)
+        return None
+
+    if used:
+        direction = "out" if output else "in"
+        return f"direction={direction}, consumer={consumer or 'unknown'}"
+    return "available"
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_gpio() -> Dict[int, str]:
+    """
+    List exported sysfs GPIO pins in one directory pass.
+
+    Returns:
+        Mapping of pin number to its /sys/class/gpio/gpioN path
+    """
+    exported = {}
+    try:
+        with os.scandir("/sys/class/gpio") as it:
+            for entry in it:
+                # Skip gpiochipN, export, unexport
+                suffix = entry.name[4:]
+                if entry.name.startswith("gpio") and suffix.isdigit():
+                    exported[int(suffix)] = entry.path
+    except OSError as e:
+        logger.debug("Cannot scan /sys/class/gpio: %s", e)
+    return exported
+
+
+@functools.lru_cache(maxsize=None)
 def _check_gpio_pin(pin: int) -> Tuple[bool, Optional[str]]:
     """
     Check if a GPIO pin is available and get its state.
@@ -76,11 +179,17 @@ def _check_gpio_pin(pin: int) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_available, state_info)
     """
+    # Prefer the character device: one ioctl instead of sysfs file reads
+    state = _gpiod_line_state(pin)
+    if state is not None:
+        logger.debug("GPIO %d: %s", pin, state)
+        return True, state
+
     try:
-        gpio_path = f"/sys/class/gpio/gpio{pin}"
+        gpio_path = _scan_gpio().get(pin)
 
         # Check if GPIO is exported
-        if os.path.exists(gpio_path):
+        if gpio_path is not None:
             # Try to read direction and value
             try:
                 with open(f"{gpio_path}/direction", 'r') as f:
@@ -89,21 +198,22 @@ def _check_gpio_pin(pin: int) -> Tuple[bool, Optional[str]]:
                     value = f.read().strip()
 
                 state = f"direction={direction}, value={value}"
-                logger.debug(f"GPIO {pin}: {state}")
+                logger.debug("GPIO %d: %s", pin, state)
                 return True, state
             except Exception as e:
-                logger.debug(f"GPIO {pin} exists but cannot read state: {e}")
+                logger.debug("GPIO %d exists but cannot read state: %s", pin, e)
                 return True, "exported"
 
         # GPIO not exported, but may be available
-        logger.debug(f"GPIO {pin} not exported")
+        logger.debug("GPIO %d not exported", pin)
         return True, "available"
 
     except Exception as e:
-        logger.warning(f"Error checking GPIO pin {pin}: {e}")
+        logger.warning("Error checking GPIO pin %d: %s", pin, e)
         return False, None
 
 
+@functools.lru_cache(maxsize=None)
 def detect_touch_hardware() -> bool:
     """
     Detect GT1151 touchscreen hardware.
@@ -126,38 +236,51 @@ def detect_touch_hardware() -> bool:
     if has_i2c:
         logger.info("GT1151 touchscreen detected (I2C 0x5D)")
         if gpio_available:
-            logger.info(f"GT1151 interrupt pin GPIO {GT1151_INT_PIN} is available")
+            logger.info("GT1151 interrupt pin GPIO %d is available", GT1151_INT_PIN)
         else:
-            logger.warning(f"GT1151 detected but GPIO {GT1151_INT_PIN} may not be available")
+            logger.warning("GT1151 detected but GPIO %d may not be available", GT1151_INT_PIN)
         return True
 
     logger.info("No GT1151 touchscreen detected")
     return False
 
 
-def detect_pisugar() -> bool:
+@functools.lru_cache(maxsize=None)
+def _find_pisugar_address() -> Optional[int]:
     """
-    Detect PiSugar battery module.
+    Find the I2C address the PiSugar battery module answers on.
 
     Checks for PiSugar I2C addresses:
     - 0x57 (PiSugar 2)
     - 0x32 (PiSugar 3)
 
     Returns:
-        True if PiSugar detected, False otherwise
+        The first responding address, or None if no PiSugar detected
     """
     logger.info("Detecting PiSugar battery module...")
 
     for address in PISUGAR_I2C_ADDRESSES:
         if _check_i2c_device(address):
-            logger.info(f"PiSugar detected at I2C address 0x{address:02x}")
-            return True
+            logger.info("PiSugar detected at I2C address 0x%02x", address)
+            return address
 
     logger.info("No PiSugar battery module detected")
-    return False
+    return None
 
 
-def auto_detect_hardware_profile() -> str:
+def detect_pisugar() -> bool:
+    """
+    Detect PiSugar battery module.
+
+    Returns:
+        True if PiSugar detected, False otherwise
+    """
+    return _find_pisugar_address() is not None
+
+
+@functools.lru_cache(maxsize=None)
+def auto_detect_hardware_profile(has_touch: Optional[bool] = None,
+                                 has_pisugar: Optional[bool] = None) -> str:
     """
     Auto-detect hardware configuration profile.
 
@@ -166,27 +289,49 @@ def auto_detect_hardware_profile() -> str:
     2. If PiSugar detected (no touch) -> "button"
     3. Fallback -> "button" (safest default)
 
+    Args:
+        has_touch: Result of detect_touch_hardware(), if already known
+        has_pisugar: Result of detect_pisugar(), if already known
+
     Returns:
         Profile name: "touch" or "button"
     """
     logger.info("Auto-detecting hardware profile...")
 
-    has_touch = detect_touch_hardware()
-    has_pisugar = detect_pisugar()
+    if has_touch is None:
+        has_touch = detect_touch_hardware()
+    if has_pisugar is None:
+        has_pisugar = detect_pisugar()
 
     if has_touch:
         profile = "touch"
-        logger.info(f"Selected profile: {profile} (GT1151 touchscreen detected)")
+        logger.info("Selected profile: %s (GT1151 touchscreen detected)", profile)
     elif has_pisugar:
         profile = "button"
-        logger.info(f"Selected profile: {profile} (PiSugar button detected)")
+        logger.info("Selected profile: %s (PiSugar button detected)", profile)
     else:
         profile = "button"
-        logger.info(f"Selected profile: {profile} (fallback - no specific hardware detected)")
+        logger.info("Selected profile: %s (fallback - no specific hardware detected)", profile)
 
     return profile
 
 
+def reset_hardware_cache() -> None:
+    """
+    Forget cached detection results so the next call probes again.
+
+    Detection is memoized per process because hardware doesn't change at
+    runtime; tests and hot-plug debugging can use this to start fresh.
+    """
+    _probe_i2c_address.cache_clear()
+    _gpio_chip.cache_clear()
+    _scan_gpio.cache_clear()
+    _check_gpio_pin.cache_clear()
+    detect_touch_hardware.cache_clear()
+    _find_pisugar_address.cache_clear()
+    auto_detect_hardware_profile.cache_clear()
+
+
 def get_hardware_info() -> Dict:
     """
     Get comprehensive hardware detection information.
@@ -201,10 +346,11 @@ def get_hardware_info() -> Dict:
     """
     logger.info("Gathering hardware information...")
 
-    # Detect hardware
+    # Detect hardware once and share the results
     has_touch = detect_touch_hardware()
-    has_pisugar = detect_pisugar()
-    recommended_profile = auto_detect_hardware_profile()
+    pisugar_addr = _find_pisugar_address()
+    has_pisugar = pisugar_addr is not None
+    recommended_profile = auto_detect_hardware_profile(has_touch, has_pisugar)
 
     # Check GPIO pins
     gpio_info = {}
@@ -219,13 +365,12 @@ def get_hardware_info() -> Dict:
             "state": state
         }
 
-    # List detected I2C devices
+    # List detected I2C devices from the results above
     i2c_devices = []
     if has_touch:
         i2c_devices.append(f"0x{GT1151_I2C_ADDRESS:02x}")
-    for addr in PISUGAR_I2C_ADDRESSES:
-        if _check_i2c_device(addr):
-            i2c_devices.append(f"0x{addr:02x}")
+    if has_pisugar:
+        i2c_devices.append(f"0x{pisugar_addr:02x}")
 
     info = {
         "has_touch": has_touch,
@@ -240,7 +385,7 @@ def get_hardware_info() -> Dict:
         }
     }
 
-    logger.info(f"Hardware detection complete: {info['detection_summary']}")
+    logger.info("Hardware detection complete: %s", info['detection_summary'])
     return info
 
 
@@ -253,7 +398,7 @@ def get_hardware_profile_from_env() -> Optional[str]:
     """
     profile = os.getenv('PIZERO_HARDWARE_PROFILE')
     if profile and profile.lower() != 'auto':
-        logger.info(f"Hardware profile from environment: {profile}")
+        logger.info("Hardware profile from environment: %s", profile)
         return profile.lower()
     return None
 
@@ -273,13 +418,13 @@ def get_input_mode() -> str:
     # Check environment variable for input mode
     input_mode = os.getenv('PIZERO_INPUT_MODE')
     if input_mode and input_mode.lower() != 'auto':
-        logger.info(f"Input mode from PIZERO_INPUT_MODE: {input_mode}")
+        logger.info("Input mode from PIZERO_INPUT_MODE: %s", input_mode)
         return input_mode.lower()
 
     # Check environment variable for hardware profile
     profile = get_hardware_profile_from_env()
     if profile:
-        logger.info(f"Input mode from PIZERO_HARDWARE_PROFILE: {profile}")
+        logger.info("Input mode from PIZERO_HARDWARE_PROFILE: %s", profile)
         return profile
 
     # Auto-detect
@@ -295,28 +440,32 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    print("\n" + "="*60)
-    print("Pi Zero 2W Hardware Detection")
-    print("="*60 + "\n")
+    sys.stdout.write("\n" + "="*60 + "\nPi Zero 2W Hardware Detection\n" + "="*60 + "\n\n")
+    sys.stdout.flush()
 
     # Get full hardware info
     info = get_hardware_info()
 
-    # Print results
-    print("DETECTION RESULTS:")
-    print("-" * 60)
-    print(f"GT1151 Touchscreen:  {info['detection_summary']['GT1151_touchscreen']}")
-    print(f"PiSugar Battery:     {info['detection_summary']['PiSugar_battery']}")
-    print(f"Recommended Profile: {info['recommended_profile']}")
-    print(f"Input Mode:          {info['detection_summary']['input_mode']}")
+    # Collect the report and write it in one go
+    summary = info['detection_summary']
+    lines = [
+        "DETECTION RESULTS:",
+        "-" * 60,
+        f"GT1151 Touchscreen:  {summary['GT1151_touchscreen']}",
+        f"PiSugar Battery:     {summary['PiSugar_battery']}",
+        f"Recommended Profile: {info['recommended_profile']}",
+        f"Input Mode:          {summary['input_mode']}",
+    ]
 
     if info['i2c_devices']:
-        print(f"\nI2C Devices Found:   {', '.join(info['i2c_devices'])}")
+        lines.append(f"\nI2C Devices Found:   {', '.join(info['i2c_devices'])}")
 
-    print("\nGPIO STATUS:")
-    print("-" * 60)
+    lines.append("\nGPIO STATUS:")
+    lines.append("-" * 60)
     for name, gpio in info['gpio_info'].items():
         status = "✓" if gpio['available'] else "✗"
-        print(f"{status} {name:20s} GPIO {gpio['pin']:2d}  ({gpio['state'] or 'unavailable'})")
+        state = gpio['state'] or 'unavailable'
+        lines.append(f"{status} {name:20s} GPIO {gpio['pin']:2d}  ({state})")
 
-    print("\n" + "="*60 + "\n")
+    lines.append("\n" + "="*60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -7,7 +7,10 @@ Sets up fixtures and configuration for testing display components.
 """
 
 import pytest
+import importlib
 import os
+import sys
+import types
 from PIL import Image, ImageDraw
 
 
@@ -38,6 +41,27 @@ def mock_font(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def drivers(monkeypatch):
+    """Import both EPD driver modules without touching hardware
+
+    epdconfig probes /proc/cpuinfo and opens GPIO/SPI at import time, so it
+    is replaced with a module carrying only the pin constants V4 reads.
+    """
+    epdconfig = types.ModuleType("TP_lib.epdconfig")
+    epdconfig.RST_PIN = 17
+    epdconfig.DC_PIN = 25
+    epdconfig.CS_PIN = 8
+    epdconfig.BUSY_PIN = 24
+    monkeypatch.setitem(sys.modules, "TP_lib.epdconfig", epdconfig)
+    for name in ("TP_lib", "TP_lib.epd2in13_V3", "TP_lib.epd2in13_V4", "TP_lib.gt1151"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    # TP_lib/__init__ rebinds the submodule names to the EPD classes
+    return (importlib.import_module("TP_lib.epd2in13_V3"),
+            importlib.import_module("TP_lib.epd2in13_V4"))
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up test environment"""
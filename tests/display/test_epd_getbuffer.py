@@ -0,0 +1,117 @@
+"""
+EPD getbuffer Tests
+===================
+
+The V3 and V4 drivers pack frames with Image.tobytes("raw") and return the
+bytes without the old bytearray() copy. These tests pin the packed bytes and
+bit order to the previous convert + bytearray implementation. V3 landscape
+frames are packed in the panel's portrait rows, the same as V4.
+"""
+
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _sample_image(size, mode="1"):
+    """Asymmetric test pattern, so any flip or bit-order change shows up"""
+    img = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((2, 3, size[0] // 3, size[1] // 4), fill=0)
+    draw.line((0, size[1] - 1, size[0] - 1, 0), fill=0)
+    draw.text((5, size[1] // 2), "Rx 8:05", fill=0)
+
+    rng = random.Random(1234)
+    for _ in range(300):
+        img.putpixel((rng.randrange(size[0]), rng.randrange(size[1])), 0)
+
+    if mode == "L":
+        # Add a gradient so the 1-bit conversion has to dither
+        for x in range(size[0]):
+            img.putpixel((x, size[1] - 2), x * 255 // size[0])
+        return img
+    return img.convert(mode)
+
+
+# ============================================================================
+# PREVIOUS IMPLEMENTATIONS
+# ============================================================================
+
+def _legacy_v3_getbuffer(image):
+    img = image.rotate(180)
+    return bytearray(img.tobytes('raw'))
+
+
+def _legacy_v4_getbuffer(epd, image):
+    img = image
+    imwidth, imheight = img.size
+    if(imwidth == epd.width and imheight == epd.height):
+        img = img.convert("1")
+    elif(imwidth == epd.height and imheight == epd.width):
+        img = img.rotate(90, expand=True).convert("1")
+    else:
+        return [0x00] * (int(epd.width/8) * epd.height)
+    return bytearray(img.tobytes("raw"))
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_v3_getbuffer_matches_legacy(drivers):
+    v3, _ = drivers
+    epd = v3.EPD(mock_mode=True)
+    image = _sample_image((epd.width, epd.height))
+
+    buf = epd.getbuffer(image)
+
+    assert bytes(buf) == bytes(_legacy_v3_getbuffer(image))
+    assert len(buf) == (epd.width + 7) // 8 * epd.height
+
+
+def test_v3_getbuffer_landscape_matches_v4(drivers):
+    v3, v4 = drivers
+    epd = v3.EPD(mock_mode=True)
+    image = _sample_image((epd.height, epd.width))
+
+    buf = epd.getbuffer(image)
+
+    # Landscape frames use the panel's portrait rows, like V4
+    assert bytes(buf) == bytes(v4.EPD().getbuffer(image))
+    assert len(buf) == (epd.width + 7) // 8 * epd.height
+
+
+def test_v3_getbuffer_rejects_non_1bit(drivers):
+    v3, _ = drivers
+    epd = v3.EPD(mock_mode=True)
+
+    with pytest.raises(ValueError):
+        epd.getbuffer(_sample_image((epd.width, epd.height), mode="L"))
+
+
+@pytest.mark.parametrize("landscape", [False, True])
+@pytest.mark.parametrize("mode", ["1", "L"])
+def test_v4_getbuffer_matches_legacy(drivers, landscape, mode):
+    _, v4 = drivers
+    epd = v4.EPD()
+    size = (epd.height, epd.width) if landscape else (epd.width, epd.height)
+    image = _sample_image(size, mode=mode)
+
+    buf = epd.getbuffer(image)
+
+    assert bytes(buf) == bytes(_legacy_v4_getbuffer(epd, image))
+    assert len(buf) == (epd.width + 7) // 8 * epd.height
+
+
+def test_v4_getbuffer_wrong_size_is_blank(drivers):
+    _, v4 = drivers
+    epd = v4.EPD()
+
+    buf = epd.getbuffer(Image.new("1", (10, 10), 255))
+
+    assert bytes(buf) == bytes(_legacy_v4_getbuffer(epd, Image.new("1", (10, 10), 255)))
@@ -0,0 +1,185 @@
+"""
+EPD Windowed Partial Update Tests
+=================================
+
+MedicineApp._display_now diffs the landscape canvas against the previous
+frame and sends only the changed region through displayPartialWindow().
+These tests check the landscape bbox -> portrait window mapping against
+getbuffer()'s rotation, and the RAM window and row slicing both drivers put
+on the SPI bus.
+"""
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _landscape_window(bbox, canvas_width):
+    """Portrait (x, y, w, h) for a landscape bbox, as _display_now maps it"""
+    left, top, right, bottom = bbox
+    return top, canvas_width - right, bottom - top, right - left
+
+
+def _frames(size):
+    """Two landscape frames that differ in one small region"""
+    before = Image.new("1", size, 255)
+    draw = ImageDraw.Draw(before)
+    draw.rectangle((0, 0, size[0] - 1, 20), fill=0)
+    draw.text((10, 40), "Aspirin", fill=0)
+
+    after = before.copy()
+    ImageDraw.Draw(after).rectangle((140, 60, 171, 75), fill=0)
+    return before, after
+
+
+class _Bus:
+    """Records SPI traffic as (command, data bytes) pairs"""
+
+    def __init__(self):
+        self.dc = 0
+        self.transfers = []
+
+    def write(self, data):
+        data = bytes(data)
+        if self.dc:
+            self.transfers[-1][1].extend(data)
+        else:
+            for command in data:
+                self.transfers.append((command, bytearray()))
+
+    def commands(self):
+        return [command for command, _ in self.transfers]
+
+    def data(self, command, nth=0):
+        return bytes([d for c, d in self.transfers if c == command][nth])
+
+
+@pytest.fixture
+def v3_bus(drivers, monkeypatch):
+    """V3 driver in hardware mode, with GPIO and SPI recorded by a _Bus"""
+    v3, _ = drivers
+    bus = _Bus()
+    epd = v3.EPD(mock_mode=True)
+
+    class GPIO:
+        @staticmethod
+        def output(pin, value):
+            if pin == epd.DC_PIN:
+                bus.dc = value
+
+        @staticmethod
+        def input(pin):
+            return 0
+
+    class Spi:
+        writebytes = writebytes2 = staticmethod(bus.write)
+
+    monkeypatch.setattr(v3, "GPIO", GPIO, raising=False)
+    monkeypatch.setattr(v3.time, "sleep", lambda s: None)
+    epd.mock_mode = False
+    epd.spi = Spi()
+    return epd, bus
+
+
+@pytest.fixture
+def v4_bus(drivers, monkeypatch):
+    """V4 driver with the stubbed epdconfig recording into a _Bus"""
+    _, v4 = drivers
+    bus = _Bus()
+    epd = v4.EPD()
+
+    def digital_write(pin, value):
+        if pin == epd.dc_pin:
+            bus.dc = value
+
+    config = v4.epdconfig
+    monkeypatch.setattr(config, "digital_write", digital_write, raising=False)
+    monkeypatch.setattr(config, "digital_read", lambda pin: 0, raising=False)
+    monkeypatch.setattr(config, "delay_ms", lambda ms: None, raising=False)
+    monkeypatch.setattr(config, "spi_writebyte", bus.write, raising=False)
+    monkeypatch.setattr(config, "spi_writebyte2", bus.write, raising=False)
+    return epd, bus
+
+
+def _rows(buf, linewidth, x_start, x_end, y_start, y_end):
+    return b"".join(buf[r * linewidth + x_start:r * linewidth + x_end]
+                    for r in range(y_start, y_end))
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("bus_fixture", ["v3_bus", "v4_bus"])
+def test_landscape_bbox_maps_to_changed_portrait_rows(request, bus_fixture):
+    epd, _ = request.getfixturevalue(bus_fixture)
+    before, after = _frames((epd.height, epd.width))
+    x, y, w, h = _landscape_window(ImageChops.logical_xor(before, after).getbbox(),
+                                   after.size[0])
+
+    # Diff the packed portrait frames: every changed byte must fall inside
+    # the byte-widened window
+    old, new = epd.getbuffer(before), epd.getbuffer(after)
+    linewidth = (epd.width + 7) // 8
+    changed = [i for i in range(len(new)) if old[i] != new[i]]
+    assert changed
+    for i in changed:
+        row, col = divmod(i, linewidth)
+        assert y <= row < y + h
+        assert x // 8 <= col < (x + w + 7) // 8
+
+
+@pytest.mark.parametrize("bus_fixture", ["v3_bus", "v4_bus"])
+def test_partial_window_sends_only_window_rows(request, bus_fixture):
+    epd, bus = request.getfixturevalue(bus_fixture)
+    _, after = _frames((epd.height, epd.width))
+    buf = epd.getbuffer(after)
+    linewidth = (epd.width + 7) // 8
+
+    # x/w not byte-aligned on purpose: 13..40 widens to bytes 1..5
+    epd.displayPartialWindow(buf, 13, 60, 28, 32)
+
+    assert bus.data(0x24) == _rows(buf, linewidth, 1, 6, 60, 92)
+    assert bus.data(0x44) == bytes([1, 5])
+    assert bus.data(0x45) == bytes([60, 0, 91, 0])
+    assert bus.data(0x4E) == bytes([1])
+    assert bus.data(0x4F) == bytes([60, 0])
+    assert bus.commands().index(0x24) > bus.commands().index(0x4F)
+
+
+@pytest.mark.parametrize("bus_fixture", ["v3_bus", "v4_bus"])
+def test_partial_window_full_rows_are_contiguous(request, bus_fixture):
+    epd, bus = request.getfixturevalue(bus_fixture)
+    _, after = _frames((epd.height, epd.width))
+    buf = epd.getbuffer(after)
+    linewidth = (epd.width + 7) // 8
+
+    epd.displayPartialWindow(buf, 0, 200, epd.width, 80)
+
+    # Clipped to the panel height
+    assert bus.data(0x24) == bytes(buf[200 * linewidth:epd.height * linewidth])
+
+
+@pytest.mark.parametrize("bus_fixture", ["v3_bus", "v4_bus"])
+def test_partial_window_empty_region_sends_nothing(request, bus_fixture):
+    epd, bus = request.getfixturevalue(bus_fixture)
+
+    epd.displayPartialWindow(epd.getbuffer(Image.new("1", (epd.height, epd.width), 255)),
+                             0, epd.height, 8, 8)
+
+    assert bus.transfers == []
+
+
+def test_v3_partial_window_restores_full_frame_window(v3_bus):
+    epd, bus = v3_bus
+
+    epd.displayPartialWindow(epd.getbuffer(Image.new("1", (epd.height, epd.width), 255)),
+                             0, 0, 8, 8)
+
+    # The second 0x44/0x45 put back the window _init_full programs
+    assert bus.data(0x44, 1) == bytes([0x00, 0x0F])
+    assert bus.data(0x45, 1) == bytes([0xF9, 0x00, 0x00, 0x00])
+    assert bus.commands()[-2:] == [0x22, 0x20]
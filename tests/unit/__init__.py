@@ -0,0 +1,7 @@
+"""
+Unit Tests
+==========
+
+Focused tests for the shared utilities and the medicine database layer.
+These need no hardware, Flask or display.
+"""
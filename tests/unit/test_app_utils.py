@@ -0,0 +1,315 @@
+"""
+App Utils Tests
+===============
+
+Tests for the ConfigLoader environment override conversion, nested-path memo
+and validation memo, path helpers and the TouchThread interrupt loop.
+"""
+
+import json
+import math
+import os
+import time
+
+import pytest
+
+from shared import app_utils
+from shared.app_utils import ConfigLoader, TouchThread, get_base_dir
+
+
+# ============================================================================
+# ENVIRONMENT VALUE CONVERSION
+# ============================================================================
+
+@pytest.mark.parametrize("raw, expected", [
+    ("120", 120),
+    (" 120", 120),
+    ("120 ", 120),
+    ("\t7\n", 7),
+    ("+3", 3),
+    ("-42", -42),
+    ("1_000", 1000),
+    ("2.5", 2.5),
+    (".5", 0.5),
+    ("5.", 5.0),
+    ("1e3", 1000.0),
+    (" 1.5 ", 1.5),
+    ("1_0.5", 10.5),
+    ("inf", math.inf),
+    ("-Infinity", -math.inf),
+])
+def test_convert_env_value_numbers(raw, expected):
+    value = ConfigLoader._convert_env_value(raw)
+
+    assert type(value) is type(expected)
+    assert value == expected
+
+
+def test_convert_env_value_nan():
+    value = ConfigLoader._convert_env_value("nan")
+
+    assert isinstance(value, float) and math.isnan(value)
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("true", True),
+    ("Yes", True),
+    ("1", True),
+    ("FALSE", False),
+    ("no", False),
+    ("0", False),
+])
+def test_convert_env_value_bools(raw, expected):
+    assert ConfigLoader._convert_env_value(raw) is expected
+
+
+@pytest.mark.parametrize("raw", ["abc", "1.5.2", "12ab", "0x10", "-", ".", " true", ""])
+def test_convert_env_value_strings(raw):
+    assert ConfigLoader._convert_env_value(raw) == raw
+
+
+# ============================================================================
+# NESTED PATH MEMO
+# ============================================================================
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """Point a clean ConfigLoader at a temporary config file"""
+    path = tmp_path / "config.json"
+
+    def write(data):
+        path.write_text(json.dumps(data))
+
+    write({"medicine": {"update_interval": 60, "display": {"rotation": 90}}})
+    monkeypatch.setenv("PIZERO_CONFIG", str(path))
+    for key in [k for k in os.environ if k.startswith("PIZERO_CONFIG_")]:
+        monkeypatch.delenv(key)
+    for attr, value in [("_config", None), ("_config_path", None),
+                        ("_environment", None), ("_path_memo", (None, {})),
+                        ("_validator", None), ("_validated_config", None)]:
+        monkeypatch.setattr(ConfigLoader, attr, value)
+    return write
+
+
+def test_nested_path_memo_is_keyed_on_config(config_file):
+    assert ConfigLoader.get_value_nested("medicine.display.rotation") == 90
+    assert ConfigLoader.get_value_nested("medicine.missing.key", "fallback") == "fallback"
+
+    memo_config, memo = ConfigLoader._path_memo
+    assert memo_config is ConfigLoader.load()
+    assert memo == {"medicine.display.rotation": 90, "medicine.missing.key": None}
+
+
+def test_nested_path_memo_follows_reload(config_file):
+    assert ConfigLoader.get_value_nested("medicine.update_interval") == 60
+    old_memo = ConfigLoader._path_memo[1]
+
+    config_file({"medicine": {"update_interval": 120}})
+    ConfigLoader.load(force_reload=True)
+
+    assert ConfigLoader.get_value_nested("medicine.update_interval") == 120
+    assert ConfigLoader._path_memo[1] is not old_memo
+    assert old_memo == {"medicine.update_interval": 60}
+
+
+def test_nested_path_memo_ignores_stale_pair(config_file):
+    # A reader that resolved against an old config leaves a stale pair
+    # behind; it must not be served for the current config
+    stale = {"medicine": {"update_interval": 1}}
+    ConfigLoader._path_memo = (stale, {"medicine.update_interval": 1})
+
+    assert ConfigLoader.get_value_nested("medicine.update_interval") == 60
+
+
+# ============================================================================
+# VALIDATION MEMO
+# ============================================================================
+
+class _CountingValidator:
+    """Stands in for ConfigValidator and counts full validations"""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.checked = []
+
+    def validate_config(self):
+        self.checked.append(self.config)
+        if self.error is not None:
+            raise self.error
+
+
+def test_validate_skips_already_validated_config(config_file):
+    validator = ConfigLoader._validator = _CountingValidator()
+
+    assert ConfigLoader.validate() is True
+    assert ConfigLoader.validate() is True
+
+    assert validator.checked == [ConfigLoader.load()]
+    assert ConfigLoader._validated_config is ConfigLoader.load()
+
+
+def test_validate_rechecks_after_reload(config_file):
+    validator = ConfigLoader._validator = _CountingValidator()
+    ConfigLoader.validate()
+    first = ConfigLoader.load()
+
+    ConfigLoader.load(force_reload=True)
+    ConfigLoader.validate()
+
+    assert len(validator.checked) == 2
+    assert validator.checked[0] is first
+    assert validator.checked[1] is ConfigLoader.load()
+
+
+def test_validate_rechecks_after_environment_change(config_file):
+    validator = ConfigLoader._validator = _CountingValidator()
+    ConfigLoader.validate()
+
+    ConfigLoader.set_environment("test")
+    ConfigLoader.validate()
+
+    assert len(validator.checked) == 2
+
+
+def test_failed_validation_is_not_remembered(config_file):
+    validator = ConfigLoader._validator = _CountingValidator(ValueError("bad config"))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            ConfigLoader.validate()
+
+    assert len(validator.checked) == 2
+    assert ConfigLoader._validated_config is None
+
+
+# ============================================================================
+# PATHS
+# ============================================================================
+
+def test_get_base_dir_follows_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv("PIZERO_BASE_DIR", str(tmp_path / "a"))
+    assert get_base_dir() == str(tmp_path / "a")
+
+    monkeypatch.setenv("PIZERO_BASE_DIR", str(tmp_path / "b"))
+    assert get_base_dir() == str(tmp_path / "b")
+
+
+# ============================================================================
+# TOUCH THREAD
+# ============================================================================
+
+class _TouchState:
+    Touch = 0
+
+
+class _FakeGT:
+    """Touch driver that replays INT levels (0 = touched, active low)"""
+    INT = 27
+
+    def __init__(self, levels):
+        self.levels = list(levels)
+        self.thread = None
+        self.seen = []  # gt_dev.Touch before each read
+        self.waits = []
+
+    def digital_read(self, pin):
+        self.seen.append(self.thread.gt_dev.Touch)
+        level = self.levels.pop(0)
+        if not self.levels:
+            # Last sample: let the current iteration finish, then exit
+            self.thread.running = False
+        return level
+
+    def wait_event(self, timeout):
+        self.waits.append(timeout)
+
+
+class _PollGT(_FakeGT):
+    """Driver without an interrupt edge wait"""
+    wait_event = None
+
+
+class _StopEvent:
+    """Stands in for TouchThread._stop_event and records poll sleeps"""
+
+    def __init__(self):
+        self.polls = []
+
+    def wait(self, timeout):
+        self.polls.append(timeout)
+
+
+def _run_loop(monkeypatch, gt, clock_ms=(), **kwargs):
+    """Drive TouchThread._irq_loop in this thread until gt runs out of samples"""
+    thread = TouchThread(gt, _TouchState(), interval=0.01, idle_timeout=0.5, **kwargs)
+    thread._stop_event = _StopEvent()
+    thread.running = True
+    gt.thread = thread
+
+    clock = iter(ms * 1_000_000 for ms in clock_ms)
+    monkeypatch.setattr(app_utils.time, "monotonic_ns", lambda: next(clock))
+    thread._irq_loop()
+    return thread
+
+
+def test_touch_thread_debounces_changes_in_ns(monkeypatch):
+    # Touch at 100 ms, a bounce back at 105 ms, the real release at 125 ms
+    gt = _FakeGT([0, 1, 1, 1])
+
+    thread = _run_loop(monkeypatch, gt, clock_ms=(100, 105, 125), debounce=0.02)
+
+    assert gt.seen == [0, 1, 1, 0]
+    assert thread.gt_dev.Touch == 0
+    assert thread._last_edge_ns == 125_000_000
+
+
+def test_touch_thread_blocks_on_edge_only_while_idle(monkeypatch):
+    # Touched, held, released, idle
+    gt = _FakeGT([0, 0, 1, 1])
+
+    thread = _run_loop(monkeypatch, gt, clock_ms=(100, 200), debounce=0.02)
+
+    # Polls while touched, edge waits once released
+    assert thread._stop_event.polls == [0.01, 0.01]
+    assert gt.waits == [0.5, 0.5]
+
+
+def test_touch_thread_polls_while_bouncing(monkeypatch):
+    gt = _FakeGT([0, 1, 1])
+
+    thread = _run_loop(monkeypatch, gt, clock_ms=(100, 101, 130), debounce=0.02)
+
+    # Touch and bounce both poll, so the settled level is read promptly
+    assert thread._stop_event.polls == [0.01, 0.01]
+    assert gt.waits == [0.5]
+
+
+def test_touch_thread_polls_without_edge_wait(monkeypatch):
+    gt = _PollGT([1, 1, 1])
+
+    thread = _run_loop(monkeypatch, gt)
+
+    assert thread._stop_event.polls == [0.01, 0.01, 0.01]
+    assert gt.waits == []
+
+
+def test_touch_thread_stop_wakes_polling_thread():
+    class HeldGT:
+        INT = 27
+
+        def digital_read(self, pin):
+            return 0  # held down, so the loop sleeps on the stop event
+
+    gt_dev = _TouchState()
+    thread = TouchThread(HeldGT(), gt_dev, interval=30.0)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while gt_dev.Touch != 1 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert gt_dev.Touch == 1
+
+    started = time.monotonic()
+    thread.stop()
+
+    assert time.monotonic() - started < 1.0
+    assert not thread._thread.is_alive()
@@ -0,0 +1,132 @@
+"""
+Backup Manager Tests
+====================
+
+Tests for backup rotation and listing with the per-file timestamp index.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from shared import backup
+from shared.backup import BackupManager, BACKUP_SUFFIX, TIMESTAMP_FORMAT
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def source(tmp_path):
+    """A small file to back up"""
+    path = tmp_path / "medicine.db"
+    path.write_bytes(b"sqlite" * 100)
+    return str(path)
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return str(tmp_path / "backups")
+
+
+def _make_backup(backup_dir, filename, when):
+    """Drop a backup file with the given timestamp into backup_dir"""
+    name = f"{filename}.{when.strftime(TIMESTAMP_FORMAT)}{BACKUP_SUFFIX}"
+    path = os.path.join(backup_dir, name)
+    with open(path, "wb") as f:
+        f.write(b"old")
+    return path
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned, for same-second backups"""
+    frozen = datetime(2026, 3, 1, 8, 30, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.frozen
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_cleanup_removes_only_expired_backups(source, backup_dir):
+    manager = BackupManager(backup_dir)
+    now = datetime.now().replace(microsecond=0)
+    expired = [_make_backup(backup_dir, "medicine.db", now - timedelta(days=d))
+               for d in (30, 10, 8)]
+    kept = [_make_backup(backup_dir, "medicine.db", now - timedelta(days=d))
+            for d in (6, 1)]
+    other = _make_backup(backup_dir, "config.json", now - timedelta(days=30))
+
+    new = manager.backup_file(source, keep_days=7)
+
+    for path in expired:
+        assert not os.path.exists(path)
+    for path in kept + [new, other]:
+        assert os.path.exists(path)
+    assert [p for p, _ in manager.list_backups("medicine.db")] == [new] + kept[::-1]
+
+
+def test_same_second_backup_is_listed_once(source, backup_dir, monkeypatch):
+    monkeypatch.setattr(backup, "datetime", _FrozenDatetime)
+    manager = BackupManager(backup_dir)
+
+    first = manager.backup_file(source)
+    second = manager.backup_file(source)
+
+    assert first == second
+    assert manager.list_backups("medicine.db") == [(first, _FrozenDatetime.frozen)]
+
+
+def test_list_backups_sees_other_managers(source, backup_dir):
+    reader = BackupManager(backup_dir)
+    assert reader.list_backups() == []
+
+    path = BackupManager(backup_dir).backup_file(source)
+    assert [p for p, _ in reader.list_backups()] == [path]
+
+    os.remove(path)
+    assert reader.list_backups() == []
+
+
+def test_unparseable_names_are_skipped(source, backup_dir):
+    manager = BackupManager(backup_dir)
+    with open(os.path.join(backup_dir, f"medicine.db.garbage{BACKUP_SUFFIX}"), "wb"):
+        pass
+
+    path = manager.backup_file(source)
+
+    assert [p for p, _ in manager.list_backups()] == [path]
+
+
+
+def _stalls_immediately(src, dst, count):
+    return 0
+
+
+def _stalls_after_one_chunk():
+    """copy_file_range that copies 100 bytes, then reports 0 (EOF)"""
+    calls = []
+
+    def copy(src, dst, count):
+        if calls:
+            return 0
+        calls.append(count)
+        return os.write(dst, os.read(src, min(count, 100)))
+    return copy
+
+
+@pytest.mark.parametrize("kernel_copy", [_stalls_immediately, _stalls_after_one_chunk()])
+def test_fast_copy_falls_back_when_kernel_copy_stops(tmp_path, monkeypatch, kernel_copy):
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * 64)
+    dst = tmp_path / "dst.bin"
+    monkeypatch.setattr(os, "copy_file_range", kernel_copy, raising=False)
+
+    backup._fast_copy(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
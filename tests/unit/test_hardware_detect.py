@@ -0,0 +1,53 @@
+"""
+Hardware Detection Tests
+========================
+
+Tests for the direct /dev/i2c-N address probe.
+"""
+
+import errno
+
+import pytest
+
+from shared import hardware_detect
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    """_probe_i2c_address with the bus and the ioctl faked out"""
+    outcome = {}
+
+    def ioctl(fd, request, address):
+        error = outcome.get(address)
+        if error is not None:
+            raise OSError(error, "fake ioctl")
+
+    def read(fd, n):
+        if outcome.get("read") is not None:
+            raise OSError(outcome["read"], "fake read")
+        return b"\x00"
+
+    monkeypatch.setattr(hardware_detect, "_I2C_BUS_AVAILABLE", True)
+    monkeypatch.setattr(hardware_detect.os, "open", lambda path, flags: 99)
+    monkeypatch.setattr(hardware_detect.os, "close", lambda fd: None)
+    monkeypatch.setattr(hardware_detect.os, "read", read)
+    monkeypatch.setattr(hardware_detect.fcntl, "ioctl", ioctl)
+    hardware_detect._probe_i2c_address.cache_clear()
+    yield outcome
+    hardware_detect._probe_i2c_address.cache_clear()
+
+
+def test_probe_acknowledged_address_is_present(probe):
+    assert hardware_detect._probe_i2c_address(0x57) is True
+
+
+def test_probe_kernel_claimed_address_is_present(probe):
+    probe[0x5D] = errno.EBUSY
+
+    assert hardware_detect._probe_i2c_address(0x5D) is True
+
+
+def test_probe_nack_is_absent(probe):
+    probe["read"] = errno.EREMOTEIO
+
+    assert hardware_detect._probe_i2c_address(0x32) is False
@@ -0,0 +1,97 @@
+"""
+Medicine Database Tests
+=======================
+
+Tests for MedicineDatabase.transaction() nesting: the outermost call owns
+the commit, nested calls run in SAVEPOINTs.
+"""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from db.medicine_db import MedicineDatabase
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def db(tmp_path):
+    database = MedicineDatabase(db_path=str(tmp_path / "medicine.db"))
+    with database.transaction() as conn:
+        conn.execute("CREATE TABLE scratch (value TEXT)")
+    yield database
+    database.close()
+
+
+def _values(db):
+    """Committed rows, read through a separate connection"""
+    with closing(sqlite3.connect(db.db_path)) as other:
+        return sorted(row[0] for row in other.execute("SELECT value FROM scratch"))
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def test_nested_transaction_commits_once_with_outer(db):
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO scratch VALUES ('outer')")
+        with db.transaction() as inner:
+            assert inner is conn
+            inner.execute("INSERT INTO scratch VALUES ('inner')")
+
+        # Released, but nothing is committed until the outer block exits
+        assert _values(db) == []
+
+    assert _values(db) == ['inner', 'outer']
+
+
+def test_failing_nested_transaction_rolls_back_only_itself(db):
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO scratch VALUES ('kept')")
+        with pytest.raises(RuntimeError):
+            with db.transaction() as inner:
+                inner.execute("INSERT INTO scratch VALUES ('dropped')")
+                raise RuntimeError("inner failure")
+        conn.execute("INSERT INTO scratch VALUES ('after')")
+
+    assert _values(db) == ['after', 'kept']
+
+
+def test_failing_outer_transaction_discards_released_savepoints(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            with db.transaction() as inner:
+                inner.execute("INSERT INTO scratch VALUES ('inner')")
+            conn.execute("INSERT INTO scratch VALUES ('outer')")
+            raise RuntimeError("outer failure")
+
+    assert _values(db) == []
+
+
+def test_doubly_nested_savepoints(db):
+    with db.transaction():
+        with db.transaction() as middle:
+            middle.execute("INSERT INTO scratch VALUES ('middle')")
+            with pytest.raises(RuntimeError):
+                with db.transaction() as innermost:
+                    innermost.execute("INSERT INTO scratch VALUES ('innermost')")
+                    raise RuntimeError("innermost failure")
+
+    assert _values(db) == ['middle']
+
+
+def test_depth_resets_after_failure(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            raise RuntimeError("outer failure")
+
+    # A fresh top-level transaction commits on its own again
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO scratch VALUES ('next')")
+
+    assert _values(db) == ['next']